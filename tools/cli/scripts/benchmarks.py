@@ -0,0 +1,405 @@
+#!/usr/bin/env python3
+"""Ad-hoc benchmarks for the toska CLI's kubectl-facing paths.
+
+Runs against a stand-in ``kubectl`` (a Python script that sleeps for a fixed startup/round-trip
+cost and prints a canned payload) so results are reproducible without a cluster. Pass
+``--kubectl kubectl`` plus ``--namespace`` to measure a real cluster instead.
+
+    python scripts/benchmarks.py status --runs 5 --latency 0.15
+    python scripts/benchmarks.py parse --pods 10000
+    python scripts/benchmarks.py projection --pods 10000
+    python scripts/benchmarks.py table --rows 100 1000 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from toska_mesh_cli.info import gather_service_info  # noqa: E402
+from toska_mesh_cli.progress import ProgressReporter  # noqa: E402
+
+FAKE_KUBECTL = """\
+import json, sys, time
+time.sleep({latency})
+payload = json.load(open({payload!r}))
+kinds = sys.argv[sys.argv.index("get") + 1].split(",")
+wanted = {{"deploy": "Deployment", "svc": "Service", "pods": "Pod"}}
+items = [i for i in payload["items"] if i["kind"] in {{wanted[k] for k in kinds}}]
+json.dump({{"apiVersion": "v1", "kind": "List", "items": items}}, sys.stdout)
+"""
+
+
+def synthetic_items(deployments: int, pods_per_deployment: int) -> list[dict]:
+    items: list[dict] = []
+    for d in range(deployments):
+        name = f"svc-{d}"
+        labels = {"app": name, "component": "example"}
+        items.append(
+            {
+                "kind": "Deployment",
+                "metadata": {"name": name, "namespace": "bench", "labels": labels},
+                "spec": {"template": {"spec": {"containers": [{"image": f"{name}:v1"}]}}},
+                "status": {"replicas": pods_per_deployment, "readyReplicas": pods_per_deployment},
+            }
+        )
+        items.append(
+            {
+                "kind": "Service",
+                "metadata": {"name": name, "namespace": "bench", "labels": labels},
+                "spec": {"clusterIP": f"10.0.{d // 250}.{d % 250}", "ports": [{"port": 80}]},
+            }
+        )
+        for p in range(pods_per_deployment):
+            items.append(
+                {
+                    "kind": "Pod",
+                    "metadata": {"name": f"{name}-{p}", "namespace": "bench", "labels": labels},
+                    "status": {
+                        "phase": "Running",
+                        "nodeName": f"node-{p % 3}",
+                        "containerStatuses": [{"ready": True, "restartCount": 0}],
+                    },
+                }
+            )
+    return items
+
+
+def _time_runs(fn, runs: int) -> list[float]:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _report(label: str, samples: list[float]) -> float:
+    median = statistics.median(samples)
+    print(f"{label:<12} median {median * 1000:8.1f} ms   min {min(samples) * 1000:8.1f} ms")
+    return median
+
+
+def bench_status(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.kubectl:
+            executable = [args.kubectl]
+        else:
+            payload = Path(tmp) / "payload.json"
+            payload.write_text(json.dumps({"items": synthetic_items(args.deployments, args.pods)}))
+            script = Path(tmp) / "kubectl.py"
+            script.write_text(FAKE_KUBECTL.format(latency=args.latency, payload=str(payload)))
+            executable = [sys.executable, str(script)]
+
+        def runner(cmd):
+            return subprocess.run([*executable, *cmd[1:]], capture_output=True, text=True)
+
+        quiet = ProgressReporter(stream=io.StringIO())
+
+        def fetch(mode: str):
+            return lambda: gather_service_info(
+                namespace=args.namespace,
+                selector=None,
+                include_pods=True,
+                fetch=mode,
+                run_cmd=runner,
+                progress=quiet,
+            )
+
+        sequential = _report("sequential", _time_runs(fetch("sequential"), args.runs))
+        combined = _report("combined", _time_runs(fetch("combined"), args.runs))
+        print(f"speedup      {sequential / combined:.2f}x")
+
+
+def synthetic_pod(index: int) -> dict:
+    """A pod shaped like real ``kubectl get pods -o json`` output (~3 KB once pretty-printed)."""
+    name = f"svc-{index // 10}-{index:06d}"
+    labels = {"app": f"svc-{index // 10}", "component": "example", "pod-template-hash": "5d9f8"}
+    return {
+        "apiVersion": "v1",
+        "kind": "Pod",
+        "metadata": {
+            "name": name,
+            "namespace": "bench",
+            "uid": f"00000000-0000-4000-8000-{index:012d}",
+            "labels": labels,
+            "annotations": {"kubectl.kubernetes.io/restartedAt": "2026-01-01T00:00:00Z"},
+            "managedFields": [
+                {
+                    "apiVersion": "v1",
+                    "fieldsType": "FieldsV1",
+                    "manager": "kube-controller-manager",
+                    "operation": "Update",
+                    "time": "2026-01-01T00:00:00Z",
+                }
+            ],
+            "ownerReferences": [{"kind": "ReplicaSet", "name": f"svc-{index // 10}-5d9f8"}],
+        },
+        "spec": {
+            "containers": [
+                {
+                    "name": "app",
+                    "image": f"registry.local/svc-{index // 10}:v1",
+                    "env": [{"name": f"VAR_{i}", "value": "x" * 24} for i in range(8)],
+                    "ports": [{"containerPort": 8080, "protocol": "TCP"}],
+                    "resources": {"requests": {"cpu": "100m", "memory": "128Mi"}},
+                }
+            ],
+            "nodeName": f"node-{index % 12}",
+        },
+        "status": {
+            "phase": "Running",
+            "podIP": f"10.{index // 65536}.{index // 256 % 256}.{index % 256}",
+            "conditions": [
+                {"type": t, "status": "True", "lastTransitionTime": "2026-01-01T00:00:00Z"}
+                for t in ("Initialized", "Ready", "ContainersReady", "PodScheduled")
+            ],
+            "containerStatuses": [
+                {
+                    "name": "app",
+                    "ready": True,
+                    "restartCount": index % 3,
+                    "image": f"registry.local/svc-{index // 10}:v1",
+                    "state": {"running": {"startedAt": "2026-01-01T00:00:00Z"}},
+                }
+            ],
+            "nodeName": f"node-{index % 12}",
+        },
+    }
+
+
+def _parse_child(args: argparse.Namespace) -> None:
+    import resource
+
+    from toska_mesh_cli.info import _StreamedCommand, list_pods
+
+    cat = ["cat", args.payload]
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    if args.mode == "streaming":
+        pods = list_pods(
+            namespace="bench", chunk_size=500, stream_cmd=lambda cmd: _StreamedCommand(cat)
+        )
+    else:
+        pods = list_pods(
+            namespace="bench",
+            run_cmd=lambda cmd: subprocess.run(cat, capture_output=True, text=True),
+        )
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(
+        json.dumps(
+            {"pods": len(pods), "seconds": elapsed, "baseline_kb": baseline, "peak_kb": peak}
+        )
+    )
+
+
+def bench_parse(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        payload = Path(tmp) / "pods.json"
+        with payload.open("w") as handle:
+            # Written incrementally so generating the fixture does not skew this process either.
+            handle.write('{\n    "apiVersion": "v1",\n    "items": [\n')
+            for index in range(args.pods):
+                if index:
+                    handle.write(",\n")
+                handle.write(json.dumps(synthetic_pod(index), indent=4))
+            handle.write(
+                '\n    ],\n    "kind": "List",\n    "metadata": {"resourceVersion": ""}\n}\n'
+            )
+        size_mb = payload.stat().st_size / 1e6
+        print(f"payload      {args.pods} pods, {size_mb:.1f} MB")
+
+        for mode in ("buffered", "streaming"):
+            out = subprocess.run(
+                [
+                    sys.executable,
+                    __file__,
+                    "_parse-child",
+                    "--mode",
+                    mode,
+                    "--payload",
+                    str(payload),
+                ],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            result = json.loads(out.stdout)
+            # ru_maxrss is KiB on Linux.
+            print(
+                f"{mode:<12} peak RSS {result['peak_kb'] / 1024:7.1f} MiB "
+                f"(+{(result['peak_kb'] - result['baseline_kb']) / 1024:6.1f} MiB over imports)   "
+                f"{result['seconds'] * 1000:8.1f} ms"
+            )
+
+
+def _table_row(pod: dict) -> list:
+    status = pod["status"]
+    cs = status["containerStatuses"][0]
+    return [
+        pod["metadata"]["name"],
+        f"{int(cs['ready'])}/1",
+        status["phase"],
+        cs["restartCount"],
+        "2d",
+        status["podIP"],
+        status["nodeName"],
+        "<none>",
+        "<none>",
+    ]
+
+
+def bench_projection(args: argparse.Namespace) -> None:
+    from toska_mesh_cli.info import _parse_pod
+    from toska_mesh_cli.projection import parse_table_output
+
+    if args.kubectl:
+        _projection_live(args)
+        return
+
+    pods = [synthetic_pod(i) for i in range(args.pods)]
+    full_wire = json.dumps(
+        {"apiVersion": "v1", "kind": "List", "items": pods}, separators=(",", ":")
+    )
+    table_wire = json.dumps(
+        {
+            "apiVersion": "meta.k8s.io/v1",
+            "kind": "Table",
+            "columnDefinitions": [{"name": c, "type": "string"} for c in "ABCDEFGHI"],
+            "rows": [
+                {
+                    "cells": _table_row(p),
+                    "object": {"kind": "PartialObjectMetadata", "metadata": p["metadata"]},
+                }
+                for p in pods
+            ],
+        },
+        separators=(",", ":"),
+    )
+    full_out = json.dumps({"apiVersion": "v1", "kind": "List", "items": pods}, indent=4)
+    table_out = "\n".join("   ".join(str(c) for c in _table_row(p)) for p in pods) + "\n"
+    del pods
+
+    def parse_full():
+        return [_parse_pod(item, "bench") for item in json.loads(full_out)["items"]]
+
+    def parse_table():
+        return parse_table_output(table_out, kinds=["pods"], namespace="bench")["pods"]
+
+    print(f"{args.pods} pods")
+    print(f"{'':<8}{'API bytes':>12}{'kubectl out':>14}{'parse (median)':>18}")
+    for label, wire, out, parse in (
+        ("full", full_wire, full_out, parse_full),
+        ("table", table_wire, table_out, parse_table),
+    ):
+        median = statistics.median(_time_runs(parse, args.runs))
+        sizes = f"{len(wire) / 1e6:>10.1f}MB{len(out) / 1e6:>12.1f}MB"
+        print(f"{label:<8}{sizes}{median * 1000:>15.1f} ms")
+
+
+def _projection_live(args: argparse.Namespace) -> None:
+    from toska_mesh_cli.info import _parse_pod
+    from toska_mesh_cli.projection import parse_table_output
+
+    base = [args.kubectl, "get", "pods", "-n", args.namespace]
+    for label, extra in (("full", ["-o", "json"]), ("table", ["-o", "wide", "--no-headers"])):
+        start = time.perf_counter()
+        out = subprocess.run([*base, *extra], capture_output=True, text=True, check=True).stdout
+        fetched = time.perf_counter() - start
+        start = time.perf_counter()
+        if label == "full":
+            count = len([_parse_pod(i, args.namespace) for i in json.loads(out)["items"]])
+        else:
+            count = len(parse_table_output(out, kinds=["pods"], namespace=args.namespace)["pods"])
+        parsed = time.perf_counter() - start
+        print(
+            f"{label:<8}{count} pods  kubectl out {len(out) / 1e6:6.2f} MB  "
+            f"fetch {fetched * 1000:8.1f} ms  parse {parsed * 1000:8.1f} ms"
+        )
+
+
+def bench_table(args: argparse.Namespace) -> None:
+    from toska_mesh_cli.info import PodInfo, format_pods_table, write_table
+
+    print(f"{'rows':>8}{'plain':>12}{'rich':>12}{'streaming':>12}   (median ms)")
+    with open(os.devnull, "w") as sink:
+        for count in args.rows:
+            pods = [
+                PodInfo(
+                    name=f"app-{i // 3:05d}-7d9f8b6c5-{i:05x}",
+                    namespace="bench",
+                    ready="1/1",
+                    status="Running",
+                    restarts=i % 7,
+                    node=f"worker-{i % 12}",
+                )
+                for i in range(count)
+            ]
+            modes = (
+                lambda pods=pods: sink.write(format_pods_table(pods)),
+                lambda pods=pods: sink.write(format_pods_table(pods, rich_output=True)),
+                lambda pods=pods: write_table("pods", pods, stream=sink, rich_output=True),
+            )
+            medians = [statistics.median(_time_runs(fn, args.runs)) * 1000 for fn in modes]
+            print(f"{count:>8}" + "".join(f"{m:>12.1f}" for m in medians))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(dest="bench", required=True)
+
+    status = subparsers.add_parser("status", help="Sequential vs combined status fetch.")
+    status.add_argument("--runs", type=int, default=5)
+    status.add_argument(
+        "--latency",
+        type=float,
+        default=0.15,
+        help="Simulated kubectl startup + API round-trip per call, seconds (default: 0.15).",
+    )
+    status.add_argument("--deployments", type=int, default=20)
+    status.add_argument("--pods", type=int, default=3, help="Pods per deployment (default: 3).")
+    status.add_argument(
+        "--kubectl", help="Benchmark a real kubectl binary instead of the stand-in."
+    )
+    status.add_argument("--namespace", default="bench")
+    status.set_defaults(func=bench_status)
+
+    parse = subparsers.add_parser("parse", help="Peak RSS of buffered vs streaming pod parsing.")
+    parse.add_argument("--pods", type=int, default=10_000)
+    parse.set_defaults(func=bench_parse)
+
+    projection = subparsers.add_parser("projection", help="Full JSON vs server-side table pods.")
+    projection.add_argument("--pods", type=int, default=10_000)
+    projection.add_argument("--runs", type=int, default=3)
+    projection.add_argument("--kubectl", help="Measure a real kubectl/cluster instead.")
+    projection.add_argument("--namespace", default="default")
+    projection.set_defaults(func=bench_projection)
+
+    table = subparsers.add_parser("table", help="Plain vs rich vs streaming table rendering.")
+    table.add_argument("--rows", type=int, nargs="+", default=[100, 1_000, 10_000])
+    table.add_argument("--runs", type=int, default=5)
+    table.set_defaults(func=bench_table)
+
+    child = subparsers.add_parser("_parse-child")
+    child.add_argument("--mode", choices=["buffered", "streaming"], required=True)
+    child.add_argument("--payload", required=True)
+    child.set_defaults(func=_parse_child)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
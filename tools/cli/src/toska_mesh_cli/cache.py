@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+
+def cache_dir() -> Path:
+    """Directory for local CLI state (``$TOSKA_CACHE_DIR``, else ``$XDG_CACHE_HOME/toska``)."""
+    override = os.environ.get("TOSKA_CACHE_DIR")
+    if override:
+        return Path(override).expanduser()
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base).expanduser() / "toska"
+
+
+def file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_json(path: Path) -> dict:
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        # Missing or corrupt state is treated as empty; it is only a cache.
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def write_json(path: Path, data: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(data, indent=2, sort_keys=True))
+    os.replace(tmp, path)
+
+
+@dataclass
+class ApplyRecord:
+    context: str
+    server: str
+    namespace: str
+    path: str
+    digest: str
+    applied_at: float
+
+
+class ApplyStateStore:
+    """Content hashes of manifests last applied successfully.
+
+    Records are keyed by context, API server URL, namespace and manifest path. Context names such
+    as ``default`` recur across kubeconfigs, so the server is what identifies the cluster.
+    """
+
+    def __init__(self, path: Path | None = None):
+        self.path = path or cache_dir() / "apply-state.json"
+        self._entries: dict[str, ApplyRecord] = {}
+        for key, raw in (load_json(self.path).get("entries") or {}).items():
+            try:
+                self._entries[key] = ApplyRecord(**raw)
+            except TypeError:
+                continue
+
+    @staticmethod
+    def key(context: str, server: str, namespace: str, manifest: Path) -> str:
+        return f"{context}|{server}|{namespace}|{manifest}"
+
+    def is_current(
+        self, context: str, server: str, namespace: str, manifest: Path, digest: str
+    ) -> bool:
+        record = self._entries.get(self.key(context, server, namespace, manifest))
+        return record is not None and record.digest == digest
+
+    def record(
+        self, context: str, server: str, namespace: str, manifest: Path, digest: str
+    ) -> None:
+        self._entries[self.key(context, server, namespace, manifest)] = ApplyRecord(
+            context=context,
+            server=server,
+            namespace=namespace,
+            path=str(manifest),
+            digest=digest,
+            applied_at=time.time(),
+        )
+        self.save()
+
+    def forget(self, manifests: list[Path], *, namespace: str | None = None) -> int:
+        """Drop records for manifests (in any context) so the next deploy re-applies them."""
+        paths = {str(m) for m in manifests}
+        doomed = [
+            key
+            for key, record in self._entries.items()
+            if record.path in paths and (namespace is None or record.namespace == namespace)
+        ]
+        for key in doomed:
+            del self._entries[key]
+        if doomed:
+            self.save()
+        return len(doomed)
+
+    def entries(self) -> list[ApplyRecord]:
+        return sorted(self._entries.values(), key=lambda r: (r.context, r.namespace, r.path))
+
+    def clear(self, *, context: str | None = None, namespace: str | None = None) -> int:
+        doomed = [
+            key
+            for key, record in self._entries.items()
+            if (context is None or record.context == context)
+            and (namespace is None or record.namespace == namespace)
+        ]
+        for key in doomed:
+            del self._entries[key]
+        self.save()
+        return len(doomed)
+
+    def save(self) -> None:
+        write_json(
+            self.path, {"entries": {key: asdict(record) for key, record in self._entries.items()}}
+        )
@@ -12,6 +12,17 @@ from . import __version__
 from .progress import ProgressReporter
 
 
+def _format_latency(measured) -> str:
+    if measured.connect is None:
+        return f"unreachable ({measured.error})"
+    text = f"connect {measured.connect * 1000:.1f} ms"
+    if measured.tls is not None:
+        text += f", TLS {measured.tls * 1000:.1f} ms"
+    elif measured.error:
+        text += f" ({measured.error})"
+    return f"{text} (dropped)" if measured.dropped else text
+
+
 def _require_commands(commands: Sequence[str], action: str) -> None:
     missing = [cmd for cmd in commands if which(cmd) is None]
     if missing:
@@ -19,6 +30,127 @@ def _require_commands(commands: Sequence[str], action: str) -> None:
         raise RuntimeError(f"{action} requires command(s) on PATH: {formatted}")
 
 
+def _emit_ndjson(args: argparse.Namespace, kinds: Sequence[str], selector: str | None) -> int:
+    """Write one compact JSON line per resource as kubectl's output is parsed.
+
+    Repeated ``--namespace`` values are listed concurrently (at most ``--max-parallel`` at a time),
+    so lines of different namespaces interleave; each line is written whole.
+    """
+    import json
+    import os
+    import queue
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    from dataclasses import asdict
+
+    from .info import RESOURCE_KINDS, iter_resources
+
+    namespaces = list(dict.fromkeys(args.namespace or ["toskamesh"]))
+    scopes = [None] if args.all_namespaces else namespaces
+    lines: queue.Queue = queue.Queue(maxsize=1024)
+    stop = threading.Event()
+    done = object()
+
+    def _list(namespace: str | None) -> None:
+        try:
+            for kind, record in iter_resources(
+                kinds,
+                namespace=namespace,
+                selector=selector,
+                kubeconfig=args.kubeconfig,
+                context=args.context,
+                chunk_size=args.chunk_size or None,
+            ):
+                if stop.is_set():
+                    return
+                payload = {"kind": RESOURCE_KINDS[kind], **asdict(record)}
+                lines.put(json.dumps(payload, separators=(",", ":")))
+        except Exception:
+            stop.set()
+            raise
+        finally:
+            lines.put(done)
+
+    broken = False
+    with ThreadPoolExecutor(max_workers=max(1, min(args.max_parallel, len(scopes)))) as pool:
+        futures = [pool.submit(_list, namespace) for namespace in scopes]
+        pending = len(futures)
+        while pending:
+            line = lines.get()
+            if line is done:
+                pending -= 1
+            elif not broken:
+                try:
+                    sys.stdout.write(f"{line}\n")
+                    sys.stdout.flush()
+                except BrokenPipeError:
+                    # The reader went away (e.g. `| head`). Point stdout at devnull so the
+                    # interpreter's final flush does not fail too, and stop the listings.
+                    devnull = os.open(os.devnull, os.O_WRONLY)
+                    os.dup2(devnull, sys.stdout.fileno())
+                    broken = True
+                    stop.set()
+    if not broken:
+        for future in futures:
+            future.result()
+    return 0
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def _add_listing_arguments(parser: argparse.ArgumentParser) -> None:
+    scope = parser.add_mutually_exclusive_group()
+    scope.add_argument(
+        "-n",
+        "--namespace",
+        action="append",
+        help="Kubernetes namespace to query; repeat to query several (default: toskamesh).",
+    )
+    scope.add_argument(
+        "-A",
+        "--all-namespaces",
+        action="store_true",
+        help="Query every namespace.",
+    )
+    parser.add_argument(
+        "--max-parallel",
+        type=int,
+        default=8,
+        help="Maximum namespaces queried concurrently with repeated --namespace (default: 8).",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=500,
+        help=(
+            "Items kubectl fetches per API request; output is parsed as it streams in "
+            "(default: 500; 0 buffers the whole response)."
+        ),
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        choices=["table", "json", "ndjson"],
+        help=(
+            "table (default), json (same as --json) or ndjson: one compact JSON record per "
+            "resource, tagged with its kind, written as soon as it is parsed."
+        ),
+    )
+    parser.add_argument(
+        "--projection",
+        choices=["table", "full"],
+        help=(
+            "table: fetch only the server-printed columns (default for tables); "
+            "full: fetch complete objects as JSON (default with --json)."
+        ),
+    )
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="toska",
@@ -165,6 +297,84 @@ def build_parser() -> argparse.ArgumentParser:
         default=256,
         help="Maximum hosts to probe across all CIDRs (default: 256).",
     )
+    kubeconfig_parser.add_argument(
+        "--discover-engine",
+        choices=["nonblocking", "threads"],
+        default="nonblocking",
+        help=(
+            "nonblocking: one selector loop with many connects in flight (default); "
+            "threads: one blocking connect per worker thread."
+        ),
+    )
+    kubeconfig_parser.add_argument(
+        "--discover-concurrency",
+        type=int,
+        default=2048,
+        help=(
+            "Connects kept in flight by the nonblocking engine, "
+            "capped by the open-file limit (default: 2048)."
+        ),
+    )
+    kubeconfig_parser.add_argument(
+        "--discover-rate",
+        type=float,
+        default=20000.0,
+        help=(
+            "New connects per second for the nonblocking engine; 0 disables pacing "
+            "(default: 20000)."
+        ),
+    )
+    kubeconfig_parser.add_argument(
+        "--discover-count",
+        type=int,
+        default=1,
+        help="Stop discovery once this many endpoints answered; 0 scans every host (default: 1).",
+    )
+    kubeconfig_parser.add_argument(
+        "--no-discover-likely",
+        dest="discover_likely",
+        action="store_false",
+        help="Do not probe hosts from the kubeconfig, talosconfig and ARP table before the sweep.",
+    )
+    kubeconfig_parser.add_argument(
+        "--no-cache",
+        dest="discover_cache",
+        action="store_false",
+        help="Neither reuse nor record discovered endpoints.",
+    )
+    kubeconfig_parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Rescan even when cached endpoints are fresh, then update the cache.",
+    )
+    kubeconfig_parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=3600.0,
+        help="Seconds discovered endpoints are reused before a rescan (default: 3600).",
+    )
+    kubeconfig_parser.add_argument(
+        "--no-rank",
+        dest="rank",
+        action="store_false",
+        help="Pass talosconfig/discovered endpoints to talosctl without ordering them by latency.",
+    )
+    kubeconfig_parser.add_argument(
+        "--rank-tls",
+        action="store_true",
+        help="Also time a TLS handshake to each endpoint when ranking.",
+    )
+    kubeconfig_parser.add_argument(
+        "--rank-timeout",
+        type=float,
+        default=1.0,
+        help="Timeout per endpoint while ranking in seconds (default: 1.0).",
+    )
+    kubeconfig_parser.add_argument(
+        "--max-latency",
+        type=float,
+        help="Drop endpoints slower than this many milliseconds (the fastest is always kept).",
+    )
 
     validate_parser = subparsers.add_parser(
         "validate",
@@ -212,6 +422,14 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Start kubectl port-forward for workloads that define portForward in the manifest.",
     )
+    deploy_parser.add_argument(
+        "--no-restart",
+        action="store_true",
+        help=(
+            "Do not restart port-forwards that exit (e.g. after a pod restart); "
+            "stop once all have exited."
+        ),
+    )
     deploy_parser.add_argument(
         "-w",
         "--workload",
@@ -232,6 +450,83 @@ def build_parser() -> argparse.ArgumentParser:
         "--namespace",
         help="Override namespace defined in the manifest.",
     )
+    deploy_parser.add_argument(
+        "--apply-mode",
+        choices=["file", "batch", "levels"],
+        default="file",
+        help=(
+            "file: one kubectl apply per manifest (default); "
+            "batch: one kubectl apply for all manifests; "
+            "levels: apply resources in dependency order, concurrently within each level."
+        ),
+    )
+    deploy_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=4,
+        help="Concurrent kubectl applies per level with --apply-mode levels (default: 4).",
+    )
+    deploy_parser.add_argument(
+        "--force-apply",
+        action="store_true",
+        help=(
+            "Apply every manifest even if its content is unchanged "
+            "since the last successful apply."
+        ),
+    )
+    deploy_parser.add_argument(
+        "--wait",
+        action="store_true",
+        help=(
+            "Watch rollout status of every Deployment/StatefulSet in the deploy "
+            "until all are ready."
+        ),
+    )
+    deploy_parser.add_argument(
+        "--timeout",
+        type=float,
+        default=300.0,
+        help="Seconds to wait for rollouts with --wait (default: 300).",
+    )
+
+    cache_parser = subparsers.add_parser(
+        "cache",
+        help="Inspect or clear local deploy/build/discovery state.",
+        description=(
+            "Inspect or clear the local apply-state store and build fingerprints used to skip "
+            "unchanged manifests and images, and the Talos endpoints found by discovery."
+        ),
+    )
+    cache_subparsers = cache_parser.add_subparsers(dest="cache_command", metavar="ACTION")
+    cache_show_parser = cache_subparsers.add_parser("show", help="List recorded manifest applies.")
+    cache_show_parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Emit raw JSON for scripting.",
+    )
+    cache_clear_parser = cache_subparsers.add_parser(
+        "clear", help="Forget recorded applies, builds and discoveries."
+    )
+    cache_clear_parser.add_argument(
+        "--context",
+        help="Only clear entries recorded for this kube context.",
+    )
+    cache_clear_parser.add_argument(
+        "-n",
+        "--namespace",
+        help="Only clear entries recorded for this namespace.",
+    )
+    cache_clear_parser.add_argument(
+        "--builds",
+        action="store_true",
+        help="Only clear build fingerprints.",
+    )
+    cache_clear_parser.add_argument(
+        "--discovery",
+        action="store_true",
+        help="Only clear discovered Talos endpoints.",
+    )
 
     destroy_parser = subparsers.add_parser(
         "destroy",
@@ -275,6 +570,45 @@ def build_parser() -> argparse.ArgumentParser:
         "--namespace",
         help="Override namespace defined in the manifest.",
     )
+    destroy_parser.add_argument(
+        "--delete-mode",
+        choices=["file", "levels"],
+        default="file",
+        help=(
+            "file: one kubectl delete per manifest (default); levels: delete resources in reverse "
+            "dependency order, concurrently within each level."
+        ),
+    )
+    destroy_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=4,
+        help="Concurrent kubectl deletes per level with --delete-mode levels (default: 4).",
+    )
+    destroy_wait = destroy_parser.add_mutually_exclusive_group()
+    destroy_wait.add_argument(
+        "--no-wait",
+        action="store_true",
+        help=(
+            "Issue all deletions with background propagation and return without waiting "
+            "(implies levels)."
+        ),
+    )
+    destroy_wait.add_argument(
+        "--wait",
+        action="store_true",
+        help=(
+            "Issue non-blocking deletions, then watch until every resource is gone "
+            "(implies levels)."
+        ),
+    )
+    destroy_parser.add_argument(
+        "--timeout",
+        type=float,
+        default=300.0,
+        help="Seconds to wait for resources to disappear with --wait (default: 300).",
+    )
 
     build_parser = subparsers.add_parser(
         "build",
@@ -303,6 +637,18 @@ def build_parser() -> argparse.ArgumentParser:
         action="append",
         help="Limit builds to specific workload(s) by name.",
     )
+    build_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of workload images to build concurrently (default: 1).",
+    )
+    build_parser.add_argument(
+        "--force-build",
+        action="store_true",
+        help="Build even when the build context fingerprint matches the last successful build.",
+    )
 
     push_parser = subparsers.add_parser(
         "push",
@@ -359,16 +705,25 @@ def build_parser() -> argparse.ArgumentParser:
         action="append",
         help="Limit publish to specific workload(s) by name.",
     )
+    publish_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of workload images to build concurrently (default: 1).",
+    )
+    publish_parser.add_argument(
+        "--push-jobs",
+        type=int,
+        default=1,
+        help="Number of images to push concurrently while builds continue (default: 1).",
+    )
 
     services_parser = subparsers.add_parser(
         "services",
         help="List deployed ToskaMesh user services.",
     )
-    services_parser.add_argument(
-        "--namespace",
-        default="toskamesh",
-        help="Kubernetes namespace to query (default: toskamesh).",
-    )
+    _add_listing_arguments(services_parser)
     services_parser.add_argument(
         "-l",
         "--selector",
@@ -399,11 +754,7 @@ def build_parser() -> argparse.ArgumentParser:
         "deployments",
         help="List ToskaMesh user deployments.",
     )
-    deployments_parser.add_argument(
-        "--namespace",
-        default="toskamesh",
-        help="Kubernetes namespace to query (default: toskamesh).",
-    )
+    _add_listing_arguments(deployments_parser)
     deployments_parser.add_argument(
         "-l",
         "--selector",
@@ -434,11 +785,7 @@ def build_parser() -> argparse.ArgumentParser:
         "status",
         help="Show deployments, services, and pods for ToskaMesh workloads.",
     )
-    status_parser.add_argument(
-        "--namespace",
-        default="toskamesh",
-        help="Kubernetes namespace to query (default: toskamesh).",
-    )
+    _add_listing_arguments(status_parser)
     status_parser.add_argument(
         "-l",
         "--selector",
@@ -455,6 +802,21 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Emit raw JSON for scripting.",
     )
+    status_parser.add_argument(
+        "-w",
+        "--watch",
+        action="store_true",
+        help="Keep the tables open and update them from kubectl watch streams until Ctrl+C.",
+    )
+    status_parser.add_argument(
+        "--fetch",
+        choices=["combined", "sequential"],
+        default="combined",
+        help=(
+            "combined: one 'kubectl get deploy,svc,pods' call (default); "
+            "sequential: one kubectl call per kind."
+        ),
+    )
     status_parser.add_argument(
         "--kubeconfig",
         type=Path,
@@ -465,6 +827,177 @@ def build_parser() -> argparse.ArgumentParser:
         help="Kube context to target (passed to kubectl).",
     )
 
+    logs_parser = subparsers.add_parser(
+        "logs",
+        help="Follow and merge the logs of a workload's pods.",
+    )
+    logs_parser.add_argument(
+        "-w",
+        "--workload",
+        action="append",
+        required=True,
+        help="Deployment/StatefulSet whose pods to follow (repeatable).",
+    )
+    logs_parser.add_argument(
+        "-n",
+        "--namespace",
+        default="toskamesh",
+        help="Kubernetes namespace (default: toskamesh).",
+    )
+    logs_parser.add_argument(
+        "-l",
+        "--selector",
+        default="component=example",
+        help=(
+            "Label selector the workloads must match (default: component=example). "
+            "Use --all to disable."
+        ),
+    )
+    logs_parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Look the workloads up without a selector (e.g. core components).",
+    )
+    logs_parser.add_argument(
+        "--tail",
+        type=int,
+        default=10,
+        help=(
+            "Recent lines to show per container already running at start "
+            "(default: 10, -1 for all)."
+        ),
+    )
+    logs_parser.add_argument(
+        "--timestamps",
+        action="store_true",
+        help="Prefix each line with its timestamp.",
+    )
+    logs_parser.add_argument(
+        "--buffer-lines",
+        type=_positive_int,
+        default=1000,
+        help="Ring buffer size per container; older unprinted lines are dropped (default: 1000).",
+    )
+    logs_parser.add_argument(
+        "--merge-window",
+        type=float,
+        default=0.5,
+        help="Seconds lines are held to merge them in timestamp order (default: 0.5).",
+    )
+    logs_parser.add_argument(
+        "--kubeconfig",
+        type=Path,
+        help="Path to kubeconfig file (passed to kubectl).",
+    )
+    logs_parser.add_argument(
+        "--context",
+        help="Kube context to target (passed to kubectl).",
+    )
+
+    top_parser = subparsers.add_parser(
+        "top",
+        help="Show CPU/memory usage per workload from the metrics API.",
+    )
+    top_scope = top_parser.add_mutually_exclusive_group()
+    top_scope.add_argument(
+        "-n",
+        "--namespace",
+        default="toskamesh",
+        help="Kubernetes namespace (default: toskamesh).",
+    )
+    top_scope.add_argument(
+        "-A",
+        "--all-namespaces",
+        action="store_true",
+        help="Show workloads in every namespace.",
+    )
+    top_parser.add_argument(
+        "-l",
+        "--selector",
+        default="component=example",
+        help=(
+            "Label selector to filter workloads (default: component=example). "
+            "Use --all to disable."
+        ),
+    )
+    top_parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Show all deployments without a selector (may include core components).",
+    )
+    top_parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Emit raw JSON for scripting.",
+    )
+    top_parser.add_argument(
+        "-w",
+        "--watch",
+        action="store_true",
+        help="Refresh the table every --interval seconds until Ctrl+C.",
+    )
+    top_parser.add_argument(
+        "--interval",
+        type=float,
+        default=5.0,
+        help="Seconds between refreshes with --watch (default: 5).",
+    )
+    top_parser.add_argument(
+        "--kubeconfig",
+        type=Path,
+        help="Path to kubeconfig file (passed to kubectl).",
+    )
+    top_parser.add_argument(
+        "--context",
+        help="Kube context to target (passed to kubectl).",
+    )
+
+    startup_parser = subparsers.add_parser(
+        "startup-report",
+        help="Break pod startup time down into scheduling, image pull, start and readiness.",
+    )
+    startup_parser.add_argument(
+        "-w",
+        "--workload",
+        action="append",
+        required=True,
+        help="Deployment/StatefulSet whose pods to report on (repeatable).",
+    )
+    startup_parser.add_argument(
+        "-n",
+        "--namespace",
+        default="toskamesh",
+        help="Kubernetes namespace (default: toskamesh).",
+    )
+    startup_parser.add_argument(
+        "-l",
+        "--selector",
+        default="component=example",
+        help=(
+            "Label selector the workloads must match (default: component=example). "
+            "Use --all to disable."
+        ),
+    )
+    startup_parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Look the workloads up without a selector (e.g. core components).",
+    )
+    startup_parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Emit raw JSON for scripting.",
+    )
+    startup_parser.add_argument(
+        "--kubeconfig",
+        type=Path,
+        help="Path to kubeconfig file (passed to kubectl).",
+    )
+    startup_parser.add_argument(
+        "--context",
+        help="Kube context to target (passed to kubectl).",
+    )
+
     return parser
 
 
@@ -511,12 +1044,12 @@ def main(argv: Sequence[str] | None = None) -> int:
             return 1
 
     if args.command == "kubeconfig":
-        from .cluster import KubeconfigError, talos_kubeconfig
+        from .cluster import DiscoveryCache, KubeconfigError, talos_kubeconfig
 
         try:
             _require_commands(["talosctl"], "Kubeconfig")
             with reporter.step("Generating kubeconfig"):
-                result = talos_kubeconfig(
+                kubeconfig = talos_kubeconfig(
                     talosconfig=Path(args.talosconfig),
                     endpoints=args.endpoints,
                     nodes=args.nodes,
@@ -527,10 +1060,41 @@ def main(argv: Sequence[str] | None = None) -> int:
                     discover_port=args.discover_port,
                     discover_timeout=args.discover_timeout,
                     max_hosts=args.max_hosts,
+                    discover_engine=args.discover_engine,
+                    discover_concurrency=args.discover_concurrency,
+                    discover_rate=args.discover_rate,
+                    discover_count=args.discover_count or None,
+                    discover_likely=args.discover_likely,
+                    discover_cache=DiscoveryCache() if args.discover_cache else None,
+                    discover_cache_ttl=args.cache_ttl,
+                    discover_refresh=args.refresh,
+                    rank=args.rank,
+                    rank_timeout=args.rank_timeout,
+                    rank_tls=args.rank_tls,
+                    max_latency=args.max_latency / 1000 if args.max_latency is not None else None,
+                )
+            print(f"Wrote kubeconfig to {kubeconfig.path}")
+            if kubeconfig.endpoints:
+                print(f"Endpoints: {', '.join(kubeconfig.endpoints)}")
+            for measured in kubeconfig.latencies:
+                print(f"  {measured.endpoint}: {_format_latency(measured)}")
+            if kubeconfig.discovery and kubeconfig.discovery.source == "cache":
+                report = kubeconfig.discovery
+                print(
+                    f"Discovery: {len(report.endpoints)} cached endpoint(s) revalidated "
+                    f"in {report.elapsed:.3f}s"
+                )
+            elif kubeconfig.discovery:
+                report = kubeconfig.discovery
+                first = (
+                    f"first after {report.first_found_after:.3f}s"
+                    if report.first_found_after is not None
+                    else "none found"
+                )
+                print(
+                    f"Discovery: {len(report.endpoints)} endpoint(s) in {report.elapsed:.3f}s "
+                    f"({first}; {report.likely_hosts} likely host(s) probed first)"
                 )
-            print(f"Wrote kubeconfig to {result.path}")
-            if result.endpoints:
-                print(f"Endpoints: {', '.join(result.endpoints)}")
             reporter.summarize()
             return 0
         except (KubeconfigError, RuntimeError) as exc:
@@ -579,7 +1143,62 @@ def main(argv: Sequence[str] | None = None) -> int:
             reporter.summarize()
             return 1
 
+    if args.command == "cache":
+        import json
+        from dataclasses import asdict
+
+        from .cache import ApplyStateStore
+        from .cluster import DiscoveryCache
+        from .fingerprint import FingerprintIndex
+
+        store = ApplyStateStore()
+        index = FingerprintIndex()
+        discovery = DiscoveryCache()
+        if args.cache_command == "clear":
+            unfiltered = args.context is None and args.namespace is None
+            if not args.builds and not args.discovery:
+                removed = store.clear(context=args.context, namespace=args.namespace)
+                print(f"Removed {removed} apply record(s) from {store.path}")
+            if args.builds or (unfiltered and not args.discovery):
+                removed = index.clear()
+                print(f"Removed {removed} build fingerprint(s) from {index.path}")
+            if args.discovery or (unfiltered and not args.builds):
+                removed = discovery.clear()
+                print(f"Removed {removed} discovery record(s) from {discovery.path}")
+            return 0
+
+        entries = store.entries()
+        builds = index.builds()
+        discovered = discovery.entries()
+        if getattr(args, "json", False):
+            payload = {
+                "applies": [asdict(e) for e in entries],
+                "builds": [{"image": image, **asdict(record)} for image, record in builds],
+                "discovery": [asdict(found) for found in discovered],
+            }
+            print(json.dumps(payload, indent=2))
+            return 0
+        print(f"Apply state: {store.path}")
+        if not entries:
+            print("No manifests recorded.")
+        for entry in entries:
+            target = f"{entry.context} ({entry.server}) / {entry.namespace}"
+            print(f"- {target}: {entry.path} ({entry.digest[:12]})")
+        print(f"\nBuild fingerprints: {index.path}")
+        if not builds:
+            print("No builds recorded.")
+        for image, record in builds:
+            print(f"- {image}: {record.context} ({record.fingerprint[:12]})")
+        print(f"\nDiscovered Talos endpoints: {discovery.path}")
+        if not discovered:
+            print("No discoveries recorded.")
+        for found in discovered:
+            cidrs = ", ".join(found.cidrs)
+            print(f"- {cidrs} port {found.port}: {', '.join(found.endpoints)}")
+        return 0
+
     if args.command == "deploy":
+        from .cache import ApplyStateStore
         from .deploy import (
             DeployConfigError,
             deploy,
@@ -587,7 +1206,6 @@ def main(argv: Sequence[str] | None = None) -> int:
             format_plan,
             load_deploy_config,
             stop_port_forwards,
-            wait_on_port_forwards,
         )
 
         manifest_path = Path(args.manifest)
@@ -604,7 +1222,7 @@ def main(argv: Sequence[str] | None = None) -> int:
                     config = replace(config, namespace=args.namespace)
 
             with reporter.step("Building deployment plan"):
-                plan = format_plan(config)
+                plan = format_plan(config, apply_mode=args.apply_mode)
 
             show_plan = args.verbose or args.dry_run
             if show_plan:
@@ -617,6 +1235,12 @@ def main(argv: Sequence[str] | None = None) -> int:
                 port_forward=args.port_forward,
                 kubeconfig=args.kubeconfig,
                 context=args.context,
+                apply_mode=args.apply_mode,
+                apply_state=ApplyStateStore(),
+                force_apply=args.force_apply,
+                jobs=args.jobs,
+                wait=args.wait,
+                wait_timeout=args.timeout,
                 progress=reporter,
             )
             forward_handles = result.port_forwards
@@ -629,8 +1253,10 @@ def main(argv: Sequence[str] | None = None) -> int:
 
             if args.port_forward and not args.dry_run:
                 if result.port_forwards:
+                    from .portforward import PortForwardSupervisor
+
                     print("\nPort-forwarding; press Ctrl+C to stop.")
-                    wait_on_port_forwards(result.port_forwards)
+                    PortForwardSupervisor(result.port_forwards, restart=not args.no_restart).run()
                 else:
                     print("\nNo workloads with portForward defined; nothing to port-forward.")
             reporter.summarize()
@@ -644,6 +1270,7 @@ def main(argv: Sequence[str] | None = None) -> int:
                 stop_port_forwards(forward_handles)
 
     if args.command == "destroy":
+        from .cache import ApplyStateStore
         from .deploy import DeployConfigError, destroy, filter_workloads, format_plan, load_deploy_config
 
         manifest_path = Path(args.manifest)
@@ -665,12 +1292,18 @@ def main(argv: Sequence[str] | None = None) -> int:
             if show_plan:
                 print(plan)
 
+            wait_mode = "none" if args.no_wait else "watch" if args.wait else "block"
             commands = destroy(
                 config,
                 dry_run=args.dry_run,
                 verbose=args.verbose,
                 kubeconfig=args.kubeconfig,
                 context=args.context,
+                delete_mode="levels" if wait_mode != "block" else args.delete_mode,
+                wait=wait_mode,
+                jobs=args.jobs,
+                timeout=args.timeout,
+                apply_state=ApplyStateStore(),
                 progress=reporter,
             )
 
@@ -696,6 +1329,7 @@ def main(argv: Sequence[str] | None = None) -> int:
             publish,
             push_images,
         )
+        from .fingerprint import FingerprintIndex
 
         manifest_path = Path(args.manifest)
 
@@ -720,6 +1354,9 @@ def main(argv: Sequence[str] | None = None) -> int:
                     config,
                     dry_run=args.dry_run,
                     verbose=args.verbose,
+                    jobs=args.jobs,
+                    fingerprints=FingerprintIndex(),
+                    force_build=args.force_build,
                     progress=reporter,
                 )
             elif args.command == "push":
@@ -738,6 +1375,8 @@ def main(argv: Sequence[str] | None = None) -> int:
                     config,
                     dry_run=args.dry_run,
                     verbose=args.verbose,
+                    build_jobs=args.jobs,
+                    push_jobs=args.push_jobs,
                     progress=reporter,
                 )
 
@@ -755,19 +1394,23 @@ def main(argv: Sequence[str] | None = None) -> int:
 
     if args.command == "services":
         import json
+        from dataclasses import asdict
 
-        from .info import (
-            KubectlError,
-            format_deployments_table,
-            format_services_table,
-            gather_service_info,
-        )
+        from .info import KubectlError, gather_namespaces, write_table
 
         selector = None if args.all else args.selector
+        output = args.output or ("json" if args.json else "table")
+        show_namespace = args.all_namespaces or len(set(args.namespace or [])) > 1
         try:
             _require_commands(["kubectl"], "Services")
-            data = gather_service_info(
-                namespace=args.namespace,
+            if output == "ndjson":
+                return _emit_ndjson(args, ["svc"], selector)
+            data = gather_namespaces(
+                args.namespace or ["toskamesh"],
+                all_namespaces=args.all_namespaces,
+                max_workers=args.max_parallel,
+                chunk_size=args.chunk_size or None,
+                projection=args.projection or ("table" if output == "table" else "full"),
                 selector=selector,
                 include_deployments=False,
                 include_services=True,
@@ -776,17 +1419,22 @@ def main(argv: Sequence[str] | None = None) -> int:
                 progress=reporter,
             )
 
-            if args.json:
+            if output == "json":
                 serializable = {
-                    "deployments": [d.__dict__ for d in data["deployments"]],
-                    "services": [s.__dict__ for s in data["services"]],
+                    "deployments": [asdict(d) for d in data["deployments"]],
+                    "services": [asdict(s) for s in data["services"]],
                 }
                 print(json.dumps(serializable, indent=2))
                 return 0
 
             if data["services"]:
                 print("\nServices")
-                print(format_services_table(data["services"], rich_output=rich_output))
+                write_table(
+                    "svc",
+                    data["services"],
+                    rich_output=rich_output,
+                    show_namespace=show_namespace,
+                )
             else:
                 print("\nServices: none found")
             reporter.summarize()
@@ -798,14 +1446,23 @@ def main(argv: Sequence[str] | None = None) -> int:
 
     if args.command == "deployments":
         import json
+        from dataclasses import asdict
 
-        from .info import KubectlError, format_deployments_table, gather_service_info
+        from .info import KubectlError, gather_namespaces, write_table
 
         selector = None if args.all else args.selector
+        output = args.output or ("json" if args.json else "table")
+        show_namespace = args.all_namespaces or len(set(args.namespace or [])) > 1
         try:
             _require_commands(["kubectl"], "Deployments")
-            data = gather_service_info(
-                namespace=args.namespace,
+            if output == "ndjson":
+                return _emit_ndjson(args, ["deploy"], selector)
+            data = gather_namespaces(
+                args.namespace or ["toskamesh"],
+                all_namespaces=args.all_namespaces,
+                max_workers=args.max_parallel,
+                chunk_size=args.chunk_size or None,
+                projection=args.projection or ("table" if output == "table" else "full"),
                 selector=selector,
                 include_deployments=True,
                 include_services=False,
@@ -814,16 +1471,21 @@ def main(argv: Sequence[str] | None = None) -> int:
                 progress=reporter,
             )
 
-            if args.json:
+            if output == "json":
                 serializable = {
-                    "deployments": [d.__dict__ for d in data["deployments"]],
+                    "deployments": [asdict(d) for d in data["deployments"]],
                 }
                 print(json.dumps(serializable, indent=2))
                 return 0
 
             if data["deployments"]:
                 print("\nDeployments")
-                print(format_deployments_table(data["deployments"], rich_output=rich_output))
+                write_table(
+                    "deploy",
+                    data["deployments"],
+                    rich_output=rich_output,
+                    show_namespace=show_namespace,
+                )
             else:
                 print("\nDeployments: none found")
             reporter.summarize()
@@ -835,53 +1497,91 @@ def main(argv: Sequence[str] | None = None) -> int:
 
     if args.command == "status":
         import json
+        from dataclasses import asdict
 
-        from .info import (
-            KubectlError,
-            format_deployments_table,
-            format_pods_table,
-            format_services_table,
-            gather_service_info,
-        )
+        from .info import KubectlError, gather_namespaces, write_table
 
         selector = None if args.all else args.selector
+        output = args.output or ("json" if args.json else "table")
+        show_namespace = args.all_namespaces or len(set(args.namespace or [])) > 1
         try:
             _require_commands(["kubectl"], "Status")
-            data = gather_service_info(
-                namespace=args.namespace,
+            if args.watch:
+                from .livestatus import watch_status
+
+                if output != "table":
+                    print(
+                        f"Status failed: --watch cannot be combined with {output} output.",
+                        file=sys.stderr,
+                    )
+                    return 2
+                namespaces = list(dict.fromkeys(args.namespace or ["toskamesh"]))
+                watch_status(
+                    namespaces=None if args.all_namespaces else namespaces,
+                    selector=selector,
+                    kubeconfig=args.kubeconfig,
+                    context=args.context,
+                    show_namespace=show_namespace,
+                )
+                return 0
+            if output == "ndjson":
+                return _emit_ndjson(args, ["deploy", "svc", "pods"], selector)
+
+            data = gather_namespaces(
+                args.namespace or ["toskamesh"],
+                all_namespaces=args.all_namespaces,
+                max_workers=args.max_parallel,
+                chunk_size=args.chunk_size or None,
+                projection=args.projection or ("table" if output == "table" else "full"),
                 selector=selector,
                 include_deployments=True,
                 include_services=True,
                 include_pods=True,
                 kubeconfig=args.kubeconfig,
                 context=args.context,
+                fetch=args.fetch,
                 progress=reporter,
             )
 
-            if args.json:
+            if output == "json":
                 serializable = {
-                    "deployments": [d.__dict__ for d in data["deployments"]],
-                    "services": [s.__dict__ for s in data["services"]],
-                    "pods": [p.__dict__ for p in data["pods"]],
+                    "deployments": [asdict(d) for d in data["deployments"]],
+                    "services": [asdict(s) for s in data["services"]],
+                    "pods": [asdict(p) for p in data["pods"]],
                 }
                 print(json.dumps(serializable, indent=2))
                 return 0
 
             if data["deployments"]:
                 print("\nDeployments")
-                print(format_deployments_table(data["deployments"], rich_output=rich_output))
+                write_table(
+                    "deploy",
+                    data["deployments"],
+                    rich_output=rich_output,
+                    show_namespace=show_namespace,
+                )
             else:
                 print("\nDeployments: none found")
 
             if data["services"]:
                 print("\nServices")
-                print(format_services_table(data["services"], rich_output=rich_output))
+                write_table(
+                    "svc",
+                    data["services"],
+                    rich_output=rich_output,
+                    show_namespace=show_namespace,
+                )
             else:
                 print("\nServices: none found")
 
             if data["pods"]:
                 print("\nPods")
-                print(format_pods_table(data["pods"], rich_output=rich_output))
+                write_table(
+                    "pods",
+                    data["pods"],
+                    rich_output=rich_output,
+                    show_namespace=show_namespace,
+                )
             else:
                 print("\nPods: none found")
             reporter.summarize()
@@ -891,6 +1591,102 @@ def main(argv: Sequence[str] | None = None) -> int:
             reporter.summarize()
             return 1
 
+    if args.command == "logs":
+        from .info import KubectlError
+        from .logs import follow_logs
+
+        try:
+            _require_commands(["kubectl"], "Logs")
+            follow_logs(
+                args.workload,
+                namespace=args.namespace,
+                selector=None if args.all else args.selector,
+                kubeconfig=args.kubeconfig,
+                context=args.context,
+                tail=args.tail,
+                timestamps=args.timestamps,
+                buffer_lines=args.buffer_lines,
+                merge_window=args.merge_window,
+            )
+            return 0
+        except (KubectlError, RuntimeError) as exc:
+            print(f"Logs failed: {exc}", file=sys.stderr)
+            return 1
+
+    if args.command == "top":
+        import json
+        from dataclasses import asdict
+
+        from .info import KubectlError
+        from .top import gather_top, watch_top, write_top_table
+
+        namespace = None if args.all_namespaces else args.namespace
+        selector = None if args.all else args.selector
+        try:
+            _require_commands(["kubectl"], "Top")
+            if args.watch:
+                if args.json:
+                    print("Top failed: --watch cannot be combined with --json.", file=sys.stderr)
+                    return 2
+                watch_top(
+                    namespace=namespace,
+                    selector=selector,
+                    interval=args.interval,
+                    kubeconfig=args.kubeconfig,
+                    context=args.context,
+                    show_namespace=args.all_namespaces,
+                )
+                return 0
+            with reporter.step("Fetching workload usage"):
+                usages = gather_top(
+                    namespace=namespace,
+                    selector=selector,
+                    kubeconfig=args.kubeconfig,
+                    context=args.context,
+                )
+            if args.json:
+                print(json.dumps([asdict(u) for u in usages], indent=2))
+                return 0
+            write_top_table(usages, rich_output=rich_output, show_namespace=args.all_namespaces)
+            reporter.summarize()
+            return 0
+        except (KubectlError, RuntimeError) as exc:
+            print(f"Top failed: {exc}", file=sys.stderr)
+            reporter.summarize()
+            return 1
+
+    if args.command == "startup-report":
+        import json
+        from dataclasses import asdict
+
+        from .info import KubectlError
+        from .startup import startup_report, summarize, write_startup_report
+
+        try:
+            _require_commands(["kubectl"], "Startup report")
+            with reporter.step("Reading pod conditions and events"):
+                pods = startup_report(
+                    args.workload,
+                    namespace=args.namespace,
+                    selector=None if args.all else args.selector,
+                    kubeconfig=args.kubeconfig,
+                    context=args.context,
+                )
+            if args.json:
+                serializable = {
+                    "pods": [asdict(p) for p in pods],
+                    "summary": [asdict(s) for s in summarize(pods)],
+                }
+                print(json.dumps(serializable, indent=2))
+                return 0
+            write_startup_report(pods, rich_output=rich_output)
+            reporter.summarize()
+            return 0
+        except (KubectlError, RuntimeError) as exc:
+            print(f"Startup report failed: {exc}", file=sys.stderr)
+            reporter.summarize()
+            return 1
+
     # Default to help when no command is provided.
     parser.print_help()
     return 0
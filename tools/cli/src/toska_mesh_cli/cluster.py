@@ -1,16 +1,23 @@
 from __future__ import annotations
 
+import errno
 import ipaddress
+import selectors
 import socket
+import ssl
 import subprocess
+import time
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from shutil import which
-from typing import Iterable, Sequence
+from typing import Callable, Iterable, Iterator, Sequence
 
 import yaml
 
+from .cache import cache_dir, load_json, write_json
+
 
 class KubeconfigError(Exception):
     """Raised when kubeconfig generation fails."""
@@ -22,11 +29,46 @@ class TalosContext:
     nodes: list[str]
 
 
+@dataclass
+class DiscoveryReport:
+    """How ``--discover-cidr`` found its endpoints; times are seconds since discovery started.
+
+    ``source`` is ``"cache"`` when cached endpoints still answered and no scan was needed.
+    """
+
+    endpoints: list[str]
+    elapsed: float
+    first_found_after: float | None
+    likely_hosts: int
+    source: str = "scan"
+
+
+@dataclass
+class EndpointLatency:
+    """Connect (and optional TLS handshake) time to one endpoint, in seconds.
+
+    ``connect`` is None when the endpoint did not accept a connection. ``dropped`` marks
+    endpoints left out of the ranked list.
+    """
+
+    endpoint: str
+    connect: float | None = None
+    tls: float | None = None
+    error: str | None = None
+    dropped: bool = False
+
+    @property
+    def latency(self) -> float | None:
+        return self.tls if self.tls is not None else self.connect
+
+
 @dataclass
 class KubeconfigResult:
     path: str
     endpoints: list[str]
     nodes: list[str]
+    discovery: DiscoveryReport | None = None
+    latencies: list[EndpointLatency] = field(default_factory=list)
 
 
 def _load_talos_context(talosconfig: Path) -> TalosContext:
@@ -59,25 +101,290 @@ def _resolve_talosconfig_path(talosconfig: Path, *, base_dir: Path | None = None
     return (base_dir / candidate).resolve()
 
 
-def _iter_hosts(cidrs: Iterable[str], *, max_hosts: int) -> list[str]:
-    hosts: list[str] = []
-    seen: set[str] = set()
-    for cidr in cidrs:
+# IPv6 subnets are sparse and huge; refuse anything wider than a /112 instead of walking it.
+MAX_IPV6_RANGE = 1 << 16
+
+
+@dataclass
+class _HostRange:
+    version: int
+    first: int
+    last: int
+    order: int
+
+
+def _host_ranges(cidrs: Iterable[str]) -> list[_HostRange]:
+    """Validate ``cidrs`` and merge their usable hosts into disjoint integer intervals.
+
+    Each network contributes the addresses ``network.hosts()`` would yield. Overlapping or
+    adjacent intervals are merged, and the result keeps the order in which the CIDRs were given.
+    """
+    ranges: list[_HostRange] = []
+    for order, cidr in enumerate(cidrs):
         try:
             network = ipaddress.ip_network(cidr, strict=False)
         except ValueError as exc:
             raise KubeconfigError(f"Invalid CIDR '{cidr}': {exc}") from exc
-        for host in network.hosts():
-            host_str = str(host)
-            if host_str in seen:
-                continue
-            seen.add(host_str)
-            hosts.append(host_str)
-            if len(hosts) >= max_hosts:
-                return hosts
+        first, last = int(network.network_address), int(network.broadcast_address)
+        if network.version == 6 and last - first + 1 > MAX_IPV6_RANGE:
+            raise KubeconfigError(
+                f"IPv6 range '{cidr}' is too large to scan; use a /112 or narrower prefix."
+            )
+        if network.num_addresses > 2 and network.prefixlen < network.max_prefixlen - 1:
+            # hosts() skips the network address, and the broadcast address on IPv4.
+            first += 1
+            last -= 1 if network.version == 4 else 0
+        ranges.append(_HostRange(network.version, first, last, order))
+
+    merged: list[_HostRange] = []
+    for current in sorted(ranges, key=lambda r: (r.version, r.first)):
+        previous = merged[-1] if merged else None
+        if previous and previous.version == current.version and current.first <= previous.last + 1:
+            previous.last = max(previous.last, current.last)
+            previous.order = min(previous.order, current.order)
+        else:
+            merged.append(current)
+    return sorted(merged, key=lambda r: (r.order, r.version, r.first))
+
+
+def _iter_hosts(
+    cidrs: Iterable[str], *, max_hosts: int, likely: Iterable[str] = ()
+) -> Iterator[str]:
+    """Lazily yield up to ``max_hosts`` distinct host addresses from ``cidrs``.
+
+    Addresses in ``likely`` that fall inside the CIDRs come first; the sweep then skips them.
+    CIDRs are validated up front; memory use is proportional to the number of ranges, not hosts.
+    """
+    ranges = _host_ranges(cidrs)
+    return _expand_ranges(ranges, max_hosts, _likely_in_ranges(likely, ranges))
+
+
+def _likely_in_ranges(hosts: Iterable[str], ranges: list[_HostRange]) -> list[str]:
+    """Normalized, de-duplicated ``hosts`` that lie inside ``ranges`` (hostnames are skipped)."""
+    selected: dict[str, None] = {}
+    for host in hosts:
+        try:
+            address = ipaddress.ip_address(host)
+        except ValueError:
+            continue
+        value = int(address)
+        if any(r.version == address.version and r.first <= value <= r.last for r in ranges):
+            selected[str(address)] = None
+    return list(selected)
+
+
+def _expand_ranges(
+    ranges: list[_HostRange], max_hosts: int, likely: Sequence[str] = ()
+) -> Iterator[str]:
+    yield from likely[:max_hosts]
+    remaining = max_hosts - min(len(likely), max_hosts)
+    skip = set(likely)
+    for host_range in ranges:
+        family, width = (
+            (socket.AF_INET, 4) if host_range.version == 4 else (socket.AF_INET6, 16)
+        )
+        for value in range(host_range.first, host_range.last + 1):
+            if remaining <= 0:
+                return
+            host = socket.inet_ntop(family, value.to_bytes(width, "big"))
+            if host not in skip:
+                remaining -= 1
+                yield host
+
+
+ARP_TABLE = Path("/proc/net/arp")
+
+
+def _host_port(value: str, default_port: int) -> tuple[str, int]:
+    """``10.0.0.5:50000``, ``[fd00::5]:50000`` or ``https://10.0.0.5:6443`` -> (host, port)."""
+    host = value.strip().split("://", 1)[-1].split("/", 1)[0]
+    port = ""
+    if host.startswith("["):
+        host, _, rest = host[1:].partition("]")
+        port = rest[1:]
+    elif host.count(":") == 1:
+        host, port = host.split(":")
+    return host, int(port) if port.isdigit() else default_port
+
+
+def _strip_port(value: str) -> str:
+    return _host_port(value, 0)[0]
+
+
+def _talosconfig_hosts(talosconfig: Path) -> list[str]:
+    """Endpoints and nodes of every talosconfig context, the current context first."""
+    try:
+        data = yaml.safe_load(talosconfig.read_text()) or {}
+    except (OSError, yaml.YAMLError):
+        return []
+    contexts = data.get("contexts") or {}
+    current = data.get("context")
+    ordered = [contexts.get(current) or {}] + [
+        ctx for name, ctx in contexts.items() if name != current and isinstance(ctx, dict)
+    ]
+    hosts = []
+    for ctx in [data, *ordered]:
+        for value in [*(ctx.get("endpoints") or []), *(ctx.get("nodes") or [])]:
+            if value:
+                hosts.append(_strip_port(str(value)))
     return hosts
 
 
+def _kubeconfig_hosts(kubeconfig: Path) -> list[str]:
+    """API server hosts of an existing kubeconfig; on Talos these are control-plane nodes."""
+    try:
+        data = yaml.safe_load(kubeconfig.expanduser().read_text()) or {}
+    except (OSError, yaml.YAMLError):
+        return []
+    if not isinstance(data, dict):
+        return []
+    clusters = data.get("clusters") or []
+    servers = [((c or {}).get("cluster") or {}).get("server") for c in clusters]
+    return [_strip_port(str(server)) for server in servers if server]
+
+
+def _arp_neighbors(path: Path = ARP_TABLE) -> list[str]:
+    """IPv4 neighbours with a resolved hardware address from the kernel's ARP table."""
+    try:
+        lines = path.read_text().splitlines()[1:]
+    except OSError:
+        return []
+    neighbors = []
+    for line in lines:
+        fields = line.split()
+        # Flags 0x0 marks an incomplete entry: the host did not answer ARP.
+        if len(fields) >= 4 and fields[2] != "0x0" and fields[3] != "00:00:00:00:00:00":
+            neighbors.append(fields[0])
+    return neighbors
+
+
+def likely_talos_hosts(
+    *,
+    talosconfig: Path | None = None,
+    kubeconfig: Path | None = None,
+    arp_table: Path | None = ARP_TABLE,
+) -> list[str]:
+    """Hosts worth probing before a sweep, most likely first.
+
+    These are API servers from an existing kubeconfig, endpoints and nodes from every
+    talosconfig context, and the local ARP neighbours. Discovery ignores any outside its CIDRs.
+    """
+    hosts = []
+    if kubeconfig is not None:
+        hosts.extend(_kubeconfig_hosts(kubeconfig))
+    if talosconfig is not None:
+        hosts.extend(_talosconfig_hosts(talosconfig))
+    if arp_table is not None:
+        hosts.extend(_arp_neighbors(arp_table))
+    return list(dict.fromkeys(hosts))
+
+
+@dataclass
+class DiscoveryRecord:
+    cidrs: list[str]
+    port: int
+    endpoints: list[str]
+    discovered_at: float
+    # Limits of the scan that produced ``endpoints``; records written before they were stored
+    # default to a scan that covers nothing, so they only seed the next scan.
+    stop_after: int | None = None
+    max_hosts: int = 0
+
+    def covers(self, *, max_hosts: int, stop_after: int | None) -> bool:
+        """Whether this scan probed at least as many hosts as one with these limits would."""
+        if self.max_hosts < max_hosts:
+            return False
+        if self.stop_after is None:
+            return True
+        return stop_after is not None and self.stop_after >= stop_after
+
+
+class DiscoveryCache:
+    """Talos endpoints found by earlier scans, keyed by the scanned CIDRs and port."""
+
+    def __init__(self, path: Path | None = None):
+        self.path = path or cache_dir() / "talos-discovery.json"
+        self._entries: dict[str, DiscoveryRecord] = {}
+        for key, raw in (load_json(self.path).get("entries") or {}).items():
+            try:
+                self._entries[key] = DiscoveryRecord(**raw)
+            except TypeError:
+                continue
+
+    @staticmethod
+    def key(cidrs: Sequence[str], port: int) -> str:
+        return f"{','.join(cidrs)}|{port}"
+
+    def lookup(self, cidrs: Sequence[str], port: int) -> DiscoveryRecord | None:
+        return self._entries.get(self.key(cidrs, port))
+
+    def record(
+        self,
+        cidrs: Sequence[str],
+        port: int,
+        endpoints: Sequence[str],
+        *,
+        discovered_at: float | None = None,
+        stop_after: int | None = None,
+        max_hosts: int = 256,
+    ) -> None:
+        self._entries[self.key(cidrs, port)] = DiscoveryRecord(
+            cidrs=list(cidrs),
+            port=port,
+            endpoints=list(endpoints),
+            discovered_at=time.time() if discovered_at is None else discovered_at,
+            stop_after=stop_after,
+            max_hosts=max_hosts,
+        )
+        self.save()
+
+    def entries(self) -> list[DiscoveryRecord]:
+        return sorted(self._entries.values(), key=lambda r: (r.cidrs, r.port))
+
+    def clear(self) -> int:
+        removed = len(self._entries)
+        self._entries.clear()
+        self.save()
+        return removed
+
+    def save(self) -> None:
+        write_json(
+            self.path, {"entries": {key: asdict(record) for key, record in self._entries.items()}}
+        )
+
+
+def _cidr_key(cidrs: Iterable[str]) -> list[str]:
+    """Canonical, sorted CIDRs so equivalent ``--discover-cidr`` lists share a cache entry."""
+    networks = set()
+    for cidr in cidrs:
+        try:
+            networks.add(ipaddress.ip_network(cidr, strict=False))
+        except ValueError as exc:
+            raise KubeconfigError(f"Invalid CIDR '{cidr}': {exc}") from exc
+    return [str(n) for n in sorted(networks, key=lambda n: (n.version, n))]
+
+
+def revalidate_endpoints(endpoints: Sequence[str], *, port: int, timeout: float) -> list[str]:
+    """The ``endpoints`` that still accept a connection, probed concurrently, in their order."""
+    if not endpoints:
+        return []
+    alive = set(
+        _scan_nonblocking(
+            endpoints,
+            port=port,
+            timeout=timeout,
+            max_in_flight=_fd_budget(len(endpoints)),
+            rate=0,
+        )
+    )
+    return [host for host in endpoints if host in alive]
+
+
+DISCOVERY_ENGINES = ("nonblocking", "threads")
+# File descriptors kept free for everything else the process has open during a scan.
+_FD_RESERVE = 64
+
+
 def discover_talos_endpoints(
     cidrs: Sequence[str],
     *,
@@ -85,18 +392,55 @@ def discover_talos_endpoints(
     max_hosts: int = 256,
     timeout: float = 0.2,
     max_workers: int = 64,
+    engine: str = "threads",
+    max_in_flight: int = 2048,
+    rate: float = 20000.0,
+    on_found: Callable[[str], None] | None = None,
+    likely: Iterable[str] = (),
+    stop_after: int | None = None,
 ) -> list[str]:
+    """Return the hosts in ``cidrs`` that accept a TCP connection on ``port``.
+
+    ``engine="threads"`` probes with blocking connects on ``max_workers`` threads.
+    ``engine="nonblocking"`` keeps up to ``max_in_flight`` non-blocking connects open in a
+    single selector loop and starts at most ``rate`` new ones per second. The in-flight count is
+    capped by the process's file descriptor limit. This sweeps a /16 in seconds. Either way
+    ``on_found`` is called as soon as a host answers.
+
+    Hosts in ``likely`` (see :func:`likely_talos_hosts`) are probed before the sweep. With
+    ``stop_after`` the scan ends once that many hosts have answered; probes still in flight are
+    abandoned, so a few more hosts than requested may be returned.
+    """
     if port <= 0 or port > 65535:
         raise KubeconfigError(f"Invalid port {port}; must be between 1 and 65535.")
     if max_hosts <= 0:
         raise KubeconfigError("max_hosts must be greater than zero.")
+    if engine not in DISCOVERY_ENGINES:
+        raise KubeconfigError(
+            f"Unknown discovery engine '{engine}'; use {' or '.join(DISCOVERY_ENGINES)}."
+        )
+    if stop_after is not None and stop_after <= 0:
+        raise KubeconfigError("stop_after must be greater than zero.")
     if not cidrs:
         return []
 
-    hosts = _iter_hosts(cidrs, max_hosts=max_hosts)
-    if not hosts:
-        return []
+    hosts = _iter_hosts(cidrs, max_hosts=max_hosts, likely=likely)
+
+    if engine == "nonblocking":
+        return _scan_nonblocking(
+            hosts,
+            port=port,
+            timeout=timeout,
+            max_in_flight=_fd_budget(max_in_flight),
+            rate=rate,
+            on_found=on_found,
+            stop_after=stop_after,
+        )
 
+    # Every host becomes a future up front, so this engine needs the list anyway.
+    host_list = list(hosts)
+    if not host_list:
+        return []
     found: list[str] = []
 
     def _probe(host: str) -> str | None:
@@ -106,17 +450,227 @@ def discover_talos_endpoints(
         except OSError:
             return None
 
-    workers = min(max_workers, len(hosts)) or 1
+    workers = min(max_workers, len(host_list)) or 1
     with ThreadPoolExecutor(max_workers=workers) as executor:
-        futures = {executor.submit(_probe, host): host for host in hosts}
+        # Workers take futures in submission order, so likely hosts are probed first.
+        futures = {executor.submit(_probe, host): host for host in host_list}
         for future in as_completed(futures):
             result = future.result()
             if result:
                 found.append(result)
+                if on_found:
+                    on_found(result)
+                if stop_after is not None and len(found) >= stop_after:
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    break
 
     return found
 
 
+def _fd_budget(requested: int) -> int:
+    """Connections the async scanner may hold open, raising the soft fd limit when allowed."""
+    try:
+        import resource
+    except ImportError:  # pragma: no cover - not available on Windows
+        return max(requested, 1)
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    wanted = requested + _FD_RESERVE
+    if soft != resource.RLIM_INFINITY and soft < wanted:
+        target = wanted if hard == resource.RLIM_INFINITY else min(wanted, hard)
+        try:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+            soft = target
+        except (ValueError, OSError):
+            pass
+    if soft == resource.RLIM_INFINITY:
+        return max(requested, 1)
+    return max(min(requested, soft - _FD_RESERVE), 1)
+
+
+_CONNECT_PENDING = {errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EAGAIN, errno.EALREADY}
+
+
+def _scan_nonblocking(
+    hosts: Iterable[str],
+    *,
+    port: int,
+    timeout: float,
+    max_in_flight: int,
+    rate: float,
+    on_found: Callable[[str], None] | None = None,
+    stop_after: int | None = None,
+    clock=time.monotonic,
+) -> list[str]:
+    selector = selectors.DefaultSelector()
+    in_flight: dict[int, tuple[socket.socket, str]] = {}
+    # Every probe gets the same timeout, so deadlines expire in start order.
+    deadlines: deque[tuple[float, int, socket.socket]] = deque()
+    found: list[str] = []
+    interval = 1.0 / rate if rate > 0 else 0.0
+    next_start = clock()
+    remaining = iter(hosts)
+    exhausted = False
+
+    def finish(sock: socket.socket, host: str, ok: bool) -> None:
+        sock.close()
+        if ok:
+            found.append(host)
+            if on_found:
+                on_found(host)
+
+    def satisfied() -> bool:
+        return stop_after is not None and len(found) >= stop_after
+
+    try:
+        while not satisfied():
+            now = clock()
+            while not exhausted and len(in_flight) < max_in_flight and next_start <= now:
+                host = next(remaining, None)
+                if host is None:
+                    exhausted = True
+                    break
+                if interval:
+                    # Allow at most a second of burst after a stall, then pace to ``rate``.
+                    next_start = max(next_start, now - 1.0) + interval
+                try:
+                    sock = socket.socket(socket.AF_INET6 if ":" in host else socket.AF_INET)
+                except OSError:
+                    # Out of descriptors, or no IPv6 on this system: the host is unreachable.
+                    continue
+                sock.setblocking(False)
+                try:
+                    code = sock.connect_ex((host, port))
+                except OSError:
+                    code = errno.EHOSTUNREACH
+                if code in _CONNECT_PENDING:
+                    fd = sock.fileno()
+                    selector.register(sock, selectors.EVENT_WRITE, host)
+                    in_flight[fd] = (sock, host)
+                    deadlines.append((now + timeout, fd, sock))
+                else:
+                    finish(sock, host, code == 0)
+                    if satisfied():
+                        break
+
+            if satisfied() or (exhausted and not in_flight):
+                break
+            waits = [deadlines[0][0] - now] if deadlines else []
+            if not exhausted and len(in_flight) < max_in_flight:
+                waits.append(next_start - now)
+            for key, _ in selector.select(max(min(waits), 0.0) if waits else None):
+                sock, host = in_flight.pop(key.fd)
+                selector.unregister(sock)
+                finish(sock, host, sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0)
+
+            now = clock()
+            while deadlines and deadlines[0][0] <= now:
+                _, fd, sock = deadlines.popleft()
+                # The fd may have been answered already and reused by a later probe.
+                if in_flight.get(fd, (None,))[0] is sock:
+                    selector.unregister(sock)
+                    del in_flight[fd]
+                    finish(sock, "", False)
+            while deadlines and in_flight.get(deadlines[0][1], (None,))[0] is not deadlines[0][2]:
+                deadlines.popleft()
+    finally:
+        for sock, _ in in_flight.values():
+            sock.close()
+        selector.close()
+    return found
+
+
+def _scan_for_endpoints(
+    cidrs: Sequence[str], *, likely: Sequence[str], **options
+) -> DiscoveryReport:
+    started = time.monotonic()
+    first_found: list[float] = []
+
+    def _found(host: str) -> None:
+        if not first_found:
+            first_found.append(time.monotonic() - started)
+
+    discovered = discover_talos_endpoints(cidrs, on_found=_found, likely=likely, **options)
+    return DiscoveryReport(
+        endpoints=discovered,
+        elapsed=time.monotonic() - started,
+        first_found_after=first_found[0] if first_found else None,
+        likely_hosts=len(_likely_in_ranges(likely, _host_ranges(cidrs))),
+    )
+
+
+def measure_endpoint_latency(
+    endpoints: Sequence[str],
+    *,
+    port: int = 50000,
+    timeout: float = 1.0,
+    tls: bool = False,
+    max_workers: int = 32,
+) -> list[EndpointLatency]:
+    """Time a TCP connect to every endpoint concurrently, in the order given.
+
+    Endpoints may carry their own port. With ``tls`` a TLS handshake is timed as well, without
+    verifying the server or presenting a client certificate. Talos speaks TLS 1.3, so the client
+    side completes before apid would reject the missing certificate.
+    """
+    context = None
+    if tls:
+        context = ssl.create_default_context()
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+
+    def _measure(endpoint: str) -> EndpointLatency:
+        host, endpoint_port = _host_port(endpoint, port)
+        started = time.perf_counter()
+        try:
+            sock = socket.create_connection((host, endpoint_port), timeout=timeout)
+        except OSError as exc:
+            return EndpointLatency(endpoint, error=str(exc) or type(exc).__name__)
+        measured = EndpointLatency(endpoint, connect=time.perf_counter() - started)
+        with sock:
+            if context is not None:
+                started = time.perf_counter()
+                try:
+                    with context.wrap_socket(sock):
+                        measured.tls = time.perf_counter() - started
+                except (ssl.SSLError, OSError) as exc:
+                    measured.error = f"TLS handshake failed: {exc}"
+        return measured
+
+    if not endpoints:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(endpoints))) as executor:
+        return list(executor.map(_measure, endpoints))
+
+
+def rank_endpoints(
+    endpoints: Sequence[str],
+    *,
+    port: int = 50000,
+    timeout: float = 1.0,
+    tls: bool = False,
+    max_latency: float | None = None,
+) -> tuple[list[str], list[EndpointLatency]]:
+    """Order ``endpoints`` fastest-first and drop unreachable ones and those over ``max_latency``.
+
+    If no endpoint answers, the original order is kept. If every reachable endpoint is over the
+    threshold, the fastest one is kept. Returns the ranked endpoints and every measurement,
+    ranked first and dropped last.
+    """
+    measured = measure_endpoint_latency(endpoints, port=port, timeout=timeout, tls=tls)
+    latencies: list[tuple[float, EndpointLatency]] = [
+        (m.latency, m) for m in measured if m.latency is not None
+    ]
+    if not latencies:
+        return list(endpoints), measured
+    latencies.sort(key=lambda pair: pair[0])
+    kept = [m for latency, m in latencies if max_latency is None or latency <= max_latency]
+    kept = kept or [latencies[0][1]]
+    kept_ids = {id(m) for m in kept}
+    for m in measured:
+        m.dropped = id(m) not in kept_ids
+    return [m.endpoint for m in kept], kept + [m for m in measured if m.dropped]
+
+
 def talos_kubeconfig(
     *,
     talosconfig: Path,
@@ -130,6 +684,18 @@ def talos_kubeconfig(
     discover_timeout: float = 0.2,
     max_hosts: int = 256,
     max_workers: int = 64,
+    discover_engine: str = "threads",
+    discover_concurrency: int = 2048,
+    discover_rate: float = 20000.0,
+    discover_count: int | None = None,
+    discover_likely: bool = True,
+    discover_cache: DiscoveryCache | None = None,
+    discover_cache_ttl: float = 3600.0,
+    discover_refresh: bool = False,
+    rank: bool = False,
+    rank_timeout: float = 1.0,
+    rank_tls: bool = False,
+    max_latency: float | None = None,
     run_cmd=None,
 ) -> KubeconfigResult:
     if which("talosctl") is None and run_cmd is None:
@@ -143,18 +709,94 @@ def talos_kubeconfig(
     endpoints_list: list[str] = list(endpoints or []) or derived.endpoints
     nodes_list: list[str] = list(nodes or []) or derived.nodes
 
+    report = None
     if not endpoints_list and discover_cidrs:
-        discovered = discover_talos_endpoints(
-            discover_cidrs,
-            port=discover_port,
-            max_hosts=max_hosts,
-            timeout=discover_timeout,
-            max_workers=max_workers,
+        cidrs = _cidr_key(discover_cidrs)
+        cached = discover_cache.lookup(cidrs, discover_port) if discover_cache else None
+        fresh = cached is not None and time.time() - cached.discovered_at < discover_cache_ttl
+        # An early-stopped or narrower scan cannot answer a request for more hosts.
+        complete = cached is not None and cached.covers(
+            max_hosts=max_hosts, stop_after=discover_count
         )
+        # Revalidation is synchronous: talosctl needs endpoints that are known to answer.
+        if (
+            cached is not None
+            and discover_cache is not None
+            and fresh
+            and complete
+            and not discover_refresh
+        ):
+            started = time.monotonic()
+            alive = revalidate_endpoints(
+                cached.endpoints, port=discover_port, timeout=discover_timeout
+            )
+            if len(alive) >= (discover_count or 1):
+                elapsed = time.monotonic() - started
+                report = DiscoveryReport(
+                    endpoints=alive,
+                    elapsed=elapsed,
+                    first_found_after=elapsed,
+                    likely_hosts=0,
+                    source="cache",
+                )
+                if alive != cached.endpoints:
+                    # Forget endpoints that went away, but keep the age of the original scan.
+                    discover_cache.record(
+                        cidrs,
+                        discover_port,
+                        alive,
+                        discovered_at=cached.discovered_at,
+                        stop_after=cached.stop_after,
+                        max_hosts=cached.max_hosts,
+                    )
+
+        if report is None:
+            likely = []
+            if cached and not discover_refresh:
+                # Expired or unreachable cached endpoints are still the best first guesses.
+                likely.extend(cached.endpoints)
+            if discover_likely:
+                likely.extend(likely_talos_hosts(talosconfig=talosconfig, kubeconfig=out))
+            report = _scan_for_endpoints(
+                discover_cidrs,
+                port=discover_port,
+                max_hosts=max_hosts,
+                timeout=discover_timeout,
+                max_workers=max_workers,
+                engine=discover_engine,
+                max_in_flight=discover_concurrency,
+                rate=discover_rate,
+                likely=likely,
+                stop_after=discover_count,
+            )
+            if discover_cache and report.endpoints:
+                discover_cache.record(
+                    cidrs,
+                    discover_port,
+                    report.endpoints,
+                    stop_after=discover_count,
+                    max_hosts=max_hosts,
+                )
+
+        discovered = report.endpoints
         endpoints_list = discovered
         if nodes_list == []:
             nodes_list = discovered
 
+    latencies: list[EndpointLatency] = []
+    # Endpoints given on the command line keep the order they were given in.
+    if rank and not endpoints and endpoints_list:
+        ranked, latencies = rank_endpoints(
+            endpoints_list,
+            port=discover_port,
+            timeout=rank_timeout,
+            tls=rank_tls,
+            max_latency=max_latency,
+        )
+        if nodes_list == endpoints_list:
+            nodes_list = ranked
+        endpoints_list = ranked
+
     if not endpoints_list:
         raise KubeconfigError("No endpoints supplied and none found in talosconfig.")
     if nodes_list == []:
@@ -189,4 +831,10 @@ def talos_kubeconfig(
         # Best effort; leave existing permissions if chmod fails.
         pass
 
-    return KubeconfigResult(path=str(out_path), endpoints=endpoints_list, nodes=nodes_list)
+    return KubeconfigResult(
+        path=str(out_path),
+        endpoints=endpoints_list,
+        nodes=nodes_list,
+        discovery=report,
+        latencies=latencies,
+    )
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
+import socket
 import subprocess
+import threading
 import time
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field
 from pathlib import Path
 from shutil import which
-from typing import Iterable, List, Optional, Sequence
+from typing import Iterable, List, Optional, Protocol, Sequence
 
 import yaml
 
+from .cache import ApplyStateStore, file_digest
+from .fingerprint import FingerprintIndex
+from .jobs import Job, JobFailed, run_jobs, run_pipeline
 from .progress import ProgressReporter
 
 
@@ -64,6 +70,10 @@ class DeployOutcome:
 class PortForwardHandle:
     command: str
     process: subprocess.Popen
+    ready_after: float | None = None
+    argv: list[str] = field(default_factory=list)
+    label: str = ""
+    monitor: _ForwardMonitor | None = field(default=None, repr=False, compare=False)
 
     def stop(self) -> None:
         if self.process.poll() is None:
@@ -74,6 +84,11 @@ class PortForwardHandle:
                 self.process.kill()
 
 
+APPLY_MODES = ("file", "batch", "levels")
+DELETE_MODES = ("file", "levels")
+DELETE_WAITS = ("block", "none", "watch")
+
+
 def require_commands(commands: Sequence[str], context: str) -> None:
     missing = [cmd for cmd in commands if which(cmd) is None]
     if missing:
@@ -274,7 +289,7 @@ def validate_deploy_config(config: DeployConfig) -> ValidationResult:
     return ValidationResult(errors=errors, warnings=warnings)
 
 
-def format_plan(config: DeployConfig) -> str:
+def format_plan(config: DeployConfig, *, apply_mode: str = "file") -> str:
     lines = [
         f"Service: {config.service} ({config.mode})",
         f"Target: {config.target}",
@@ -294,6 +309,13 @@ def format_plan(config: DeployConfig) -> str:
             f" (image: {image_str}{pf_str})"
         )
 
+    if apply_mode == "levels":
+        from .manifests import format_levels, load_config_resources, plan_apply_levels
+
+        lines.extend(
+            ["", "Apply levels:", format_levels(plan_apply_levels(load_config_resources(config)))]
+        )
+
     return "\n".join(lines)
 
 
@@ -311,8 +333,8 @@ def _default_port_forward_runner(cmd: list[str]) -> subprocess.Popen:
 
 
 def _subprocess_runner(verbose: bool):
-    def _run(cmd: list[str]):
-        return subprocess.run(cmd, check=False, text=True, capture_output=not verbose)
+    def _run(cmd: list[str], input: str | None = None):
+        return subprocess.run(cmd, check=False, text=True, capture_output=not verbose, input=input)
 
     return _run
 
@@ -325,11 +347,23 @@ def deploy(
     port_forward: bool = False,
     kubeconfig: Optional[Path] = None,
     context: Optional[str] = None,
+    apply_mode: str = "file",
+    apply_state: ApplyStateStore | None = None,
+    force_apply: bool = False,
+    jobs: int = 4,
+    port_forward_timeout: float = 10.0,
+    wait: bool = False,
+    wait_timeout: float = 300.0,
     run_cmd=None,
     port_forward_runner=None,
+    watch_runner=None,
     progress: ProgressReporter | None = None,
     emit=None,
 ) -> DeployOutcome:
+    if apply_mode not in APPLY_MODES:
+        raise DeployConfigError(
+            f"Unknown apply mode '{apply_mode}'; expected one of {', '.join(APPLY_MODES)}."
+        )
     runner = run_cmd or _subprocess_runner(verbose)
     port_forward_runner = port_forward_runner or _default_port_forward_runner
     printer = emit or print
@@ -339,21 +373,80 @@ def deploy(
 
     executed: list[str] = []
     forwards: list[PortForwardHandle] = []
+    forward_specs: list[tuple[Workload, str, list[str]]] = []
     if config.target != "kubernetes":
         raise DeployConfigError(f"Unsupported target '{config.target}'.")
 
     kube_args = _kubectl_args(kubeconfig, context)
+    cache = None
+    if apply_state is not None and not dry_run:
+        cache = _ApplyCache.resolve(
+            apply_state,
+            context=context,
+            namespace=config.namespace,
+            kube_args=kube_args,
+            runner=run_cmd or _subprocess_runner(False),
+            force=force_apply,
+        )
+
+    if apply_mode == "batch":
+        pending = [
+            m for w in config.workloads for m in w.manifests if not (cache and cache.unchanged(m))
+        ]
+        if pending:
+            executed.append(
+                _apply_batch(
+                    config,
+                    pending,
+                    kube_args=kube_args,
+                    dry_run=dry_run,
+                    verbose=verbose,
+                    runner=run_cmd or _subprocess_runner(False),
+                    progress=progress,
+                    printer=printer,
+                )
+            )
+            if cache:
+                for manifest in pending:
+                    cache.applied(manifest)
+        else:
+            progress.note("All manifests unchanged since the last apply; nothing to do.")
+    elif apply_mode == "levels":
+        pending_by_workload = [
+            (workload, [m for m in workload.manifests if not (cache and cache.unchanged(m))])
+            for workload in config.workloads
+        ]
+        executed.extend(
+            _apply_levels(
+                config,
+                pending_by_workload,
+                kube_args=kube_args,
+                dry_run=dry_run,
+                verbose=verbose,
+                jobs=jobs,
+                run_cmd=run_cmd,
+                progress=progress,
+                emit=emit,
+            )
+        )
+        if cache and not dry_run:
+            for _, manifests in pending_by_workload:
+                for manifest in manifests:
+                    cache.applied(manifest)
 
     for workload in config.workloads:
-        for manifest in workload.manifests:
+        for manifest in workload.manifests if apply_mode == "file" else []:
             cmd = ["kubectl", *kube_args, "apply", "-f", str(manifest)]
             if config.namespace:
                 cmd.extend(["-n", config.namespace])
 
             rendered = " ".join(cmd)
-            executed.append(rendered)
 
             with progress.step(f"Applying {manifest.name}") as step:
+                if cache and cache.unchanged(manifest):
+                    step.mark("unchanged")
+                    continue
+                executed.append(rendered)
                 if dry_run:
                     step.mark("skipped")
                     continue
@@ -365,6 +458,8 @@ def deploy(
                     raise DeployConfigError(
                         f"kubectl apply failed for workload '{workload.name}' (exit {return_code}): {stderr}"
                     )
+                if cache:
+                    cache.applied(manifest)
 
                 if verbose:
                     stdout = getattr(result, "stdout", "") or ""
@@ -387,27 +482,333 @@ def deploy(
             if config.namespace:
                 cmd.extend(["-n", config.namespace])
 
-            rendered = " ".join(cmd)
-            executed.append(rendered)
+            executed.append(" ".join(cmd))
+            forward_specs.append((workload, f"{pf.service} {local}->{pf.remote_port}", cmd))
+
+    if wait and not dry_run:
+        # Tunnels opened before the rollout finishes would land on pods about to be replaced.
+        from .rollout import rollout_targets, wait_for_rollouts
+
+        wait_for_rollouts(
+            rollout_targets(config),
+            namespace=config.namespace,
+            kubeconfig=kubeconfig,
+            context=context,
+            timeout=wait_timeout,
+            watch_runner=watch_runner,
+            progress=progress,
+        )
 
-            with progress.step(f"Port-forward {pf.service} {local}->{pf.remote_port}") as step:
-                if dry_run:
-                    step.mark("skipped")
-                    continue
-                process = port_forward_runner(cmd)
-                # Detect immediate failures instead of leaving a broken process running.
-                time.sleep(0.2)
-                if process.poll() is not None:
-                    stderr = process.stderr.read().strip() if process.stderr else ""
-                    stdout = process.stdout.read().strip() if process.stdout else ""
-                    detail = stderr or stdout or f"exit code {process.returncode}"
+    if forward_specs:
+        if dry_run:
+            for _, label, _ in forward_specs:
+                progress.record(f"Port-forward {label}", "skipped", 0.0)
+        else:
+            forwards = _start_port_forwards(
+                forward_specs,
+                runner=port_forward_runner,
+                timeout=port_forward_timeout,
+                progress=progress,
+            )
+
+    return DeployOutcome(commands=executed, port_forwards=forwards)
+
+
+class _Signal(Protocol):
+    """Anything a monitor can wake its owner with: a ``threading.Event`` or a wakeup pipe."""
+
+    def set(self) -> None: ...
+
+
+class _ForwardMonitor:
+    """Drains a port-forward's output and flags readiness on kubectl's "Forwarding from" line.
+
+    Draining also keeps kubectl from blocking on a full pipe once it logs per-connection lines.
+    """
+
+    def __init__(self, process, signal: _Signal):
+        self.process = process
+        self.started = time.monotonic()
+        self.ready_after: float | None = None
+        self.output: deque[str] = deque(maxlen=20)
+        self._signal = signal
+        self.readable = False
+        for stream, is_stdout in ((process.stdout, True), (process.stderr, False)):
+            if stream is not None and hasattr(stream, "readline"):
+                self.readable = self.readable or is_stdout
+                threading.Thread(target=self._pump, args=(stream, is_stdout), daemon=True).start()
+
+    def _pump(self, stream, is_stdout: bool) -> None:
+        try:
+            for line in iter(stream.readline, ""):
+                self.output.append(line.strip())
+                if is_stdout and self.ready_after is None and "Forwarding from" in line:
+                    self.ready_after = time.monotonic() - self.started
+                    self._signal.set()
+        except (OSError, ValueError):
+            pass
+        self._signal.set()
+
+    def detail(self) -> str:
+        captured = "\n".join(line for line in self.output if line).strip()
+        if captured:
+            return captured
+        chunks = []
+        for stream in (self.process.stderr, self.process.stdout):
+            if stream is not None and not hasattr(stream, "readline"):
+                chunks.append((stream.read() or "").strip())
+        return next((c for c in chunks if c), f"exit code {self.process.returncode}")
+
+
+def _port_open(port: int) -> bool:
+    try:
+        with socket.create_connection(("127.0.0.1", port), timeout=0.05):
+            return True
+    except OSError:
+        return False
+
+
+def _start_port_forwards(
+    specs: list[tuple[Workload, str, list[str]]],
+    *,
+    runner,
+    timeout: float,
+    progress: ProgressReporter,
+) -> list[PortForwardHandle]:
+    """Start every port-forward at once and wait until each tunnel reports it is listening."""
+    signal = threading.Event()
+    started: list[tuple[Workload, str, list[str], _ForwardMonitor]] = []
+    handles: list[PortForwardHandle] = []
+    try:
+        for workload, label, cmd in specs:
+            started.append((workload, label, cmd, _ForwardMonitor(runner(cmd), signal)))
+
+        deadline = time.monotonic() + timeout
+        pending = list(started)
+        while pending:
+            for entry in list(pending):
+                workload, label, cmd, monitor = entry
+                if monitor.ready_after is None and not monitor.readable:
+                    # No output to read (e.g. a custom runner); fall back to probing the local port.
+                    if _port_open(int(cmd[cmd.index("port-forward") + 2].split(":", 1)[0])):
+                        monitor.ready_after = time.monotonic() - monitor.started
+                if monitor.ready_after is not None:
+                    pending.remove(entry)
+                    progress.record(f"Port-forward {label} ready", "running", monitor.ready_after)
+                elif monitor.process.poll() is not None:
+                    progress.record(
+                        f"Port-forward {label}", "fail", time.monotonic() - monitor.started
+                    )
                     raise DeployConfigError(
-                        f"kubectl port-forward failed for workload '{workload.name}': {detail}"
+                        f"kubectl port-forward failed for workload '{workload.name}': "
+                        f"{monitor.detail()}"
                     )
-                forwards.append(PortForwardHandle(command=rendered, process=process))
-                step.mark("running")
+            if pending and time.monotonic() >= deadline:
+                names = ", ".join(f"'{w.name}'" for w, _, _, _ in pending)
+                raise DeployConfigError(
+                    f"kubectl port-forward not ready after {timeout:.0f}s for workload(s) {names}"
+                )
+            if pending:
+                signal.wait(0.05)
+                signal.clear()
+
+        handles = [
+            PortForwardHandle(
+                command=" ".join(cmd),
+                process=monitor.process,
+                ready_after=monitor.ready_after,
+                argv=list(cmd),
+                label=label,
+                monitor=monitor,
+            )
+            for _, label, cmd, monitor in started
+        ]
+        return handles
+    finally:
+        if not handles:
+            # Do not leave half of the tunnels running when one of them failed.
+            stop_port_forwards(
+                PortForwardHandle(command=" ".join(cmd), process=monitor.process)
+                for _, _, cmd, monitor in started
+            )
 
-    return DeployOutcome(commands=executed, port_forwards=forwards)
+
+def _apply_levels(
+    config: DeployConfig,
+    pending: list[tuple[Workload, list[Path]]],
+    *,
+    kube_args: list[str],
+    dry_run: bool,
+    verbose: bool,
+    jobs: int,
+    run_cmd,
+    progress: ProgressReporter,
+    emit,
+) -> list[str]:
+    """Apply resources level by level (see manifests.APPLY_LEVELS), concurrently within a level."""
+    from .manifests import load_manifest_resources, plan_apply_levels
+
+    resources = [
+        resource
+        for workload, manifests in pending
+        for manifest in manifests
+        for resource in load_manifest_resources(manifest, workload=workload.name)
+    ]
+    if not resources:
+        progress.note("All manifests unchanged since the last apply; nothing to do.")
+        return []
+
+    cmd = ["kubectl", *kube_args, "apply", "-f", "-"]
+    if config.namespace:
+        cmd.extend(["-n", config.namespace])
+
+    executed: list[str] = []
+    for level in plan_apply_levels(resources):
+        level_jobs = [
+            Job(
+                name=resource.ref,
+                label=f"Applying {resource.ref} ({resource.workload})",
+                cmd=cmd,
+                failure=f"kubectl apply failed for workload '{resource.workload}' ({resource.ref})",
+                input=resource.to_yaml(),
+            )
+            for resource in level.resources
+        ]
+        executed.extend(f"{' '.join(cmd)} < {job.name} ({level.name})" for job in level_jobs)
+        if dry_run:
+            for job in level_jobs:
+                progress.record(job.label, "skipped", 0.0)
+            continue
+        try:
+            run_jobs(
+                level_jobs,
+                max_workers=jobs,
+                verbose=verbose,
+                run_cmd=run_cmd,
+                progress=progress,
+                emit=emit,
+            )
+        except JobFailed as exc:
+            raise DeployConfigError(str(exc)) from exc
+    return executed
+
+
+class _ApplyCache:
+    """Skips manifests whose content was already applied to the same cluster and namespace."""
+
+    def __init__(
+        self, store: ApplyStateStore, *, context: str, server: str, namespace: str, force: bool
+    ):
+        self.store = store
+        self.context = context
+        self.server = server
+        self.namespace = namespace
+        self.force = force
+        self._digests: dict[Path, str] = {}
+
+    @classmethod
+    def resolve(
+        cls,
+        store: ApplyStateStore,
+        *,
+        context: str | None,
+        namespace: str | None,
+        kube_args: list[str],
+        runner,
+        force: bool,
+    ) -> _ApplyCache | None:
+        if not context:
+            result = runner(["kubectl", *kube_args, "config", "current-context"])
+            context = (getattr(result, "stdout", "") or "").strip()
+            if getattr(result, "returncode", 1) != 0 or not context:
+                # Without a known target the cache could skip applies against the wrong cluster.
+                return None
+        # Context names are reused across kubeconfigs; the API server identifies the cluster.
+        cmd = ["kubectl", *kube_args, "config", "view", "--minify", "-o"]
+        result = runner([*cmd, "jsonpath={.clusters[0].cluster.server}"])
+        server = (getattr(result, "stdout", "") or "").strip()
+        if getattr(result, "returncode", 1) != 0 or not server:
+            return None
+        return cls(
+            store,
+            context=context,
+            server=server,
+            namespace=namespace or "(default)",
+            force=force,
+        )
+
+    def _digest(self, manifest: Path) -> str:
+        if manifest not in self._digests:
+            self._digests[manifest] = file_digest(manifest)
+        return self._digests[manifest]
+
+    def unchanged(self, manifest: Path) -> bool:
+        if self.force:
+            return False
+        return self.store.is_current(
+            self.context, self.server, self.namespace, manifest, self._digest(manifest)
+        )
+
+    def applied(self, manifest: Path) -> None:
+        self.store.record(
+            self.context, self.server, self.namespace, manifest, self._digest(manifest)
+        )
+
+
+def _apply_batch(
+    config: DeployConfig,
+    manifests: list[Path],
+    *,
+    kube_args: list[str],
+    dry_run: bool,
+    verbose: bool,
+    runner,
+    progress: ProgressReporter,
+    printer,
+) -> str:
+    """Apply every manifest of the deploy through one ``kubectl apply -f -`` invocation."""
+    from .manifests import (
+        attribute_apply_output,
+        concat_manifests,
+        load_config_resources,
+        parse_apply_output,
+    )
+
+    cmd = ["kubectl", *kube_args, "apply", "-f", "-"]
+    if config.namespace:
+        cmd.extend(["-n", config.namespace])
+    rendered = f"{' '.join(cmd)} < [{', '.join(m.name for m in manifests)}]"
+
+    with progress.step(f"Applying {len(manifests)} manifests in one batch") as step:
+        if dry_run:
+            step.mark("skipped")
+            return rendered
+
+        resources = load_config_resources(config)
+        result = runner(cmd, input=concat_manifests(manifests))
+        return_code = getattr(result, "returncode", 1)
+        stdout = getattr(result, "stdout", "") or ""
+        stderr = getattr(result, "stderr", "") or ""
+        if return_code != 0:
+            step.mark("fail")
+
+    # Attribute per-resource results back to workloads; kubectl reports what it managed to apply
+    # even when a later document fails.
+    grouped = attribute_apply_output(parse_apply_output(stdout), resources, config.workloads)
+    for owner, lines in grouped.items():
+        if lines:
+            summary = ", ".join(f"{line.resource}/{line.name} {line.action}" for line in lines)
+            progress.note(f"{owner}: {summary}")
+
+    if return_code != 0:
+        raise DeployConfigError(f"kubectl apply failed (exit {return_code}): {stderr or stdout}")
+
+    if verbose:
+        if stdout.strip():
+            printer(stdout.strip())
+        if stderr.strip():
+            printer(stderr.strip())
+    return rendered
 
 
 def destroy(
@@ -417,10 +818,23 @@ def destroy(
     verbose: bool = False,
     kubeconfig: Optional[Path] = None,
     context: Optional[str] = None,
+    delete_mode: str = "file",
+    wait: str = "block",
+    jobs: int = 4,
+    timeout: float = 300.0,
+    apply_state: ApplyStateStore | None = None,
     run_cmd=None,
     progress: ProgressReporter | None = None,
     emit=None,
 ) -> Iterable[str]:
+    if delete_mode not in DELETE_MODES:
+        raise DeployConfigError(
+            f"Unknown delete mode '{delete_mode}'; expected one of {', '.join(DELETE_MODES)}."
+        )
+    if wait not in DELETE_WAITS:
+        raise DeployConfigError(
+            f"Unknown wait mode '{wait}'; expected one of {', '.join(DELETE_WAITS)}."
+        )
     runner = run_cmd or _subprocess_runner(verbose)
     printer = emit or print
     progress = progress or ProgressReporter()
@@ -433,6 +847,27 @@ def destroy(
 
     kube_args = _kubectl_args(kubeconfig, context)
 
+    if apply_state is not None and not dry_run:
+        # Deleted resources must be re-applied next time even though the manifests are unchanged.
+        apply_state.forget(
+            [m for w in config.workloads for m in w.manifests],
+            namespace=config.namespace or "(default)",
+        )
+
+    if delete_mode == "levels":
+        return _destroy_levels(
+            config,
+            kube_args=kube_args,
+            dry_run=dry_run,
+            verbose=verbose,
+            wait=wait,
+            jobs=jobs,
+            timeout=timeout,
+            run_cmd=run_cmd,
+            progress=progress,
+            emit=emit,
+        )
+
     for workload in config.workloads:
         for manifest in workload.manifests:
             cmd = ["kubectl", *kube_args, "delete", "-f", str(manifest)]
@@ -466,11 +901,131 @@ def destroy(
     return executed
 
 
+def _destroy_levels(
+    config: DeployConfig,
+    *,
+    kube_args: list[str],
+    dry_run: bool,
+    verbose: bool,
+    wait: str,
+    jobs: int,
+    timeout: float,
+    run_cmd,
+    progress: ProgressReporter,
+    emit,
+) -> list[str]:
+    """Delete resources in reverse apply-level order, concurrently within each level.
+
+    ``wait="block"`` lets each ``kubectl delete`` wait for its finalizers; ``"none"`` issues every
+    deletion with background propagation and returns; ``"watch"`` does the same and then waits for
+    all resources to disappear with a single ``kubectl wait --for=delete``.
+    """
+    from .manifests import load_config_resources, plan_apply_levels
+
+    delete_flags = ["--ignore-not-found"]
+    if wait != "block":
+        delete_flags.extend(["--wait=false", "--cascade=background"])
+
+    def namespace_args(namespace: str | None) -> list[str]:
+        return ["-n", namespace] if namespace else []
+
+    levels = list(reversed(plan_apply_levels(load_config_resources(config))))
+    executed: list[str] = []
+    level_jobs: list[list[Job]] = []
+    # A manifest's own metadata.namespace wins, as it did with ``kubectl delete -f``.
+    refs_by_namespace: dict[str | None, list[str]] = {}
+    for level in levels:
+        batch = []
+        for resource in level.resources:
+            namespace = resource.namespace or config.namespace
+            refs_by_namespace.setdefault(namespace, []).append(resource.kubectl_ref)
+            batch.append(
+                Job(
+                    name=resource.kubectl_ref,
+                    label=f"Deleting {resource.ref} ({resource.workload})",
+                    cmd=[
+                        "kubectl",
+                        *kube_args,
+                        "delete",
+                        resource.kubectl_ref,
+                        *delete_flags,
+                        *namespace_args(namespace),
+                    ],
+                    failure=(
+                        f"kubectl delete failed for workload '{resource.workload}' "
+                        f"({resource.ref})"
+                    ),
+                )
+            )
+        level_jobs.append(batch)
+    for batch in level_jobs:
+        executed.extend(" ".join(job.cmd) for job in batch)
+
+    def wait_cmd(namespace: str | None, refs: list[str], seconds: float) -> list[str]:
+        return [
+            "kubectl",
+            *kube_args,
+            "wait",
+            "--for=delete",
+            *refs,
+            f"--timeout={max(int(seconds), 1)}s",
+            *namespace_args(namespace),
+        ]
+
+    if wait == "watch":
+        executed.extend(
+            " ".join(wait_cmd(namespace, refs, timeout))
+            for namespace, refs in refs_by_namespace.items()
+        )
+
+    if dry_run:
+        for batch in level_jobs:
+            for job in batch:
+                progress.record(job.label, "skipped", 0.0)
+        return executed
+
+    # Non-blocking deletes return as soon as the API accepts them, so later levels start almost
+    # immediately while still being issued in reverse dependency order.
+    for batch in level_jobs:
+        try:
+            run_jobs(
+                batch,
+                max_workers=jobs,
+                verbose=verbose,
+                run_cmd=run_cmd,
+                progress=progress,
+                emit=emit,
+            )
+        except JobFailed as exc:
+            raise DeployConfigError(str(exc)) from exc
+
+    if wait == "watch" and refs_by_namespace:
+        runner = run_cmd or _subprocess_runner(False)
+        total = sum(len(refs) for refs in refs_by_namespace.values())
+        deadline = time.monotonic() + timeout
+        with progress.step(f"Waiting for {total} resources to be deleted") as step:
+            # One ``kubectl wait`` per namespace; together they share the --timeout budget.
+            for namespace, refs in refs_by_namespace.items():
+                result = runner(wait_cmd(namespace, refs, deadline - time.monotonic()))
+                return_code = getattr(result, "returncode", 1)
+                stderr = getattr(result, "stderr", "") or ""
+                # Resources that vanished before the watch started are reported as NotFound.
+                if return_code != 0 and "NotFound" not in stderr and "not found" not in stderr:
+                    step.mark("fail")
+                    raise DeployConfigError(
+                        f"Timed out waiting for deletion (exit {return_code}): {stderr}"
+                    )
+    return executed
+
+
 def build_images(
     config: DeployConfig,
     *,
     dry_run: bool = False,
     verbose: bool = False,
+    jobs: int = 1,
+    fingerprints: FingerprintIndex | None = None,
+    force_build: bool = False,
     run_cmd=None,
     progress: ProgressReporter | None = None,
     emit=None,
@@ -481,26 +1036,75 @@ def build_images(
     if not dry_run and run_cmd is None:
         require_commands(["docker"], "Build")
 
-    executed: list[str] = []
-    for workload in config.workloads:
-        if not workload.image:
-            raise DeployConfigError(f"Workload '{workload.name}' is missing an image definition.")
-
-        context = workload.build_context or manifest_default_context(config, workload)
-        dockerfile = workload.dockerfile or context / "Dockerfile"
-
-        cmd = [
-            "docker",
-            "build",
-            "-t",
+    builds = [(workload, _build_command(config, workload)) for workload in config.workloads]
+
+    current: dict[str, str] = {}
+    if fingerprints is not None and not dry_run:
+        with progress.step("Fingerprinting build contexts"):
+            for workload, _ in builds:
+                context, dockerfile = _build_inputs(config, workload)
+                current[workload.name] = fingerprints.fingerprint(context, dockerfile)
+            fingerprints.save()
+
+    def _unchanged(workload: Workload) -> bool:
+        if (
+            force_build
+            or fingerprints is None
+            or workload.name not in current
+            or not workload.image
+        ):
+            return False
+        return fingerprints.is_current(workload.image.as_string(), current[workload.name])
+
+    def _record(workload: Workload) -> None:
+        if fingerprints is None or workload.name not in current or not workload.image:
+            return
+        context, dockerfile = _build_inputs(config, workload)
+        fingerprints.record_build(
             workload.image.as_string(),
-            "-f",
-            str(dockerfile),
-            str(context),
+            context=context,
+            dockerfile=dockerfile,
+            fingerprint=current[workload.name],
+        )
+        fingerprints.save()
+
+    for workload, _ in builds:
+        if _unchanged(workload):
+            progress.record(f"Building {workload.name} (context unchanged)", "skipped", 0.0)
+    builds = [(workload, cmd) for workload, cmd in builds if not _unchanged(workload)]
+    executed = [" ".join(cmd) for _, cmd in builds]
+
+    if jobs > 1 and not dry_run:
+        by_name = {workload.name: workload for workload, _ in builds}
+        pool_jobs = [
+            Job(
+                name=workload.name,
+                label=f"Building {workload.name}",
+                cmd=cmd,
+                failure=f"Docker build failed for workload '{workload.name}'",
+            )
+            for workload, cmd in builds
         ]
-        rendered = " ".join(cmd)
-        executed.append(rendered)
-
+        try:
+            results = run_jobs(
+                pool_jobs,
+                max_workers=jobs,
+                verbose=verbose,
+                run_cmd=run_cmd,
+                progress=progress,
+                emit=emit,
+            )
+        except JobFailed as exc:
+            # Builds that finished before the failure still count as successful.
+            for outcome in exc.results:
+                if outcome.status == "ok":
+                    _record(by_name[outcome.job.name])
+            raise DeployConfigError(str(exc)) from exc
+        for outcome in results:
+            _record(by_name[outcome.job.name])
+        return executed
+
+    for workload, cmd in builds:
         with progress.step(f"Building {workload.name}") as step:
             if dry_run:
                 step.mark("skipped")
@@ -513,6 +1117,7 @@ def build_images(
                 raise DeployConfigError(
                     f"Docker build failed for workload '{workload.name}' (exit {return_code}): {stderr}"
                 )
+            _record(workload)
 
             if verbose:
                 stdout = getattr(result, "stdout", "") or ""
@@ -525,6 +1130,28 @@ def build_images(
     return executed
 
 
+def _build_inputs(config: DeployConfig, workload: Workload) -> tuple[Path, Path]:
+    context = workload.build_context or manifest_default_context(config, workload)
+    dockerfile = workload.dockerfile or context / "Dockerfile"
+    return context, dockerfile
+
+
+def _build_command(config: DeployConfig, workload: Workload) -> list[str]:
+    if not workload.image:
+        raise DeployConfigError(f"Workload '{workload.name}' is missing an image definition.")
+
+    context, dockerfile = _build_inputs(config, workload)
+    return [
+        "docker",
+        "build",
+        "-t",
+        workload.image.as_string(),
+        "-f",
+        str(dockerfile),
+        str(context),
+    ]
+
+
 def push_images(
     config: DeployConfig,
     *,
@@ -579,29 +1206,84 @@ def publish(
     *,
     dry_run: bool = False,
     verbose: bool = False,
+    build_jobs: int = 1,
+    push_jobs: int = 1,
     run_cmd=None,
     progress: ProgressReporter | None = None,
     emit=None,
 ) -> Iterable[str]:
     progress = progress or ProgressReporter()
 
-    build_cmds = build_images(
-        config,
-        dry_run=dry_run,
-        verbose=verbose,
-        run_cmd=run_cmd,
-        progress=progress,
-        emit=emit,
-    )
-    push_cmds = push_images(
-        config,
-        dry_run=dry_run,
-        verbose=verbose,
-        run_cmd=run_cmd,
-        progress=progress,
-        emit=emit,
-    )
-    return list(build_cmds) + list(push_cmds)
+    if dry_run:
+        build_cmds = build_images(
+            config,
+            dry_run=dry_run,
+            verbose=verbose,
+            run_cmd=run_cmd,
+            progress=progress,
+            emit=emit,
+        )
+        push_cmds = push_images(
+            config,
+            dry_run=dry_run,
+            verbose=verbose,
+            run_cmd=run_cmd,
+            progress=progress,
+            emit=emit,
+        )
+        return list(build_cmds) + list(push_cmds)
+
+    if run_cmd is None:
+        require_commands(["docker"], "Publish")
+
+    # Two-stage pipeline: each workload's push is queued as soon as its own build succeeds.
+    chains: list[list[Job]] = []
+    for workload in config.workloads:
+        build_cmd = _build_command(config, workload)
+        push_cmd = _push_command(workload)
+        chains.append(
+            [
+                Job(
+                    name=workload.name,
+                    label=f"Building {workload.name}",
+                    cmd=build_cmd,
+                    failure=f"Docker build failed for workload '{workload.name}'",
+                ),
+                Job(
+                    name=workload.name,
+                    label=f"Pushing {workload.name}",
+                    cmd=push_cmd,
+                    failure=f"Docker push failed for workload '{workload.name}'",
+                ),
+            ]
+        )
+
+    start = time.monotonic()
+    try:
+        results = run_pipeline(
+            chains,
+            limits=[build_jobs, push_jobs],
+            verbose=verbose,
+            run_cmd=run_cmd,
+            progress=progress,
+            emit=emit,
+        )
+    except JobFailed as exc:
+        raise DeployConfigError(str(exc)) from exc
+    wall = time.monotonic() - start
+    sequential = sum(r.duration for r in results)
+    speedup = f" ({sequential / wall:.1f}x)" if wall > 0 else ""
+    (emit or print)(f"Publish wall time: {wall:.1f}s vs {sequential:.1f}s sequential{speedup}")
+
+    return [" ".join(chain[0].cmd) for chain in chains] + [
+        " ".join(chain[1].cmd) for chain in chains
+    ]
+
+
+def _push_command(workload: Workload) -> list[str]:
+    if not workload.image:
+        raise DeployConfigError(f"Workload '{workload.name}' is missing an image definition.")
+    return ["docker", "push", workload.image.as_string()]
 
 
 def manifest_default_context(config: DeployConfig, workload: Workload) -> Path:
@@ -618,15 +1300,8 @@ def stop_port_forwards(handles: Iterable[PortForwardHandle]) -> None:
             pass
 
 
-def wait_on_port_forwards(handles: Iterable[PortForwardHandle], *, poll_interval: float = 0.5) -> None:
-    active = list(handles)
-    if not active:
-        return
+def wait_on_port_forwards(handles: Iterable[PortForwardHandle]) -> None:
+    """Block until every port-forward exits (or Ctrl+C), then stop them; no restarts."""
+    from .portforward import PortForwardSupervisor
 
-    try:
-        while any(h.process.poll() is None for h in active):
-            time.sleep(poll_interval)
-    except KeyboardInterrupt:
-        pass
-    finally:
-        stop_port_forwards(active)
+    PortForwardSupervisor(list(handles), restart=False).run()
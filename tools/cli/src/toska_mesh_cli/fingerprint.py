@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from .cache import cache_dir, file_digest, load_json, write_json
+
+
+@dataclass
+class _Pattern:
+    regex: re.Pattern
+    negated: bool
+
+
+class DockerIgnore:
+    """Subset of docker's .dockerignore semantics.
+
+    Supports globs with ``*``, ``?``, ``**`` and ``!`` negation.
+
+    As in docker, the last matching pattern wins and a pattern that matches a directory excludes
+    everything below it.
+    """
+
+    def __init__(self, lines: list[str]):
+        self.patterns: list[_Pattern] = []
+        for raw in lines:
+            line = raw.strip()
+            if not line or line.startswith("#"):
+                continue
+            negated = line.startswith("!")
+            if negated:
+                line = line[1:].strip()
+            line = os.path.normpath(line.lstrip("/")).replace(os.sep, "/")
+            if line == ".":
+                continue
+            self.patterns.append(_Pattern(regex=re.compile(_translate(line)), negated=negated))
+
+    @classmethod
+    def for_build(cls, context: Path, dockerfile: Path | None = None) -> DockerIgnore:
+        # BuildKit prefers <Dockerfile>.dockerignore next to the Dockerfile over the
+        # context default.
+        candidates = []
+        if dockerfile is not None:
+            candidates.append(dockerfile.with_name(f"{dockerfile.name}.dockerignore"))
+        candidates.append(context / ".dockerignore")
+        for candidate in candidates:
+            if candidate.is_file():
+                return cls(candidate.read_text().splitlines())
+        return cls([])
+
+    @property
+    def has_negations(self) -> bool:
+        return any(p.negated for p in self.patterns)
+
+    def excluded(self, relpath: str) -> bool:
+        parents = _parents(relpath)
+        excluded = False
+        for pattern in self.patterns:
+            if any(pattern.regex.fullmatch(candidate) for candidate in parents):
+                excluded = not pattern.negated
+        return excluded
+
+
+def _parents(relpath: str) -> list[str]:
+    parts = relpath.split("/")
+    return ["/".join(parts[: i + 1]) for i in range(len(parts))]
+
+
+def _translate(pattern: str) -> str:
+    out = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+            continue
+        if pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+            continue
+        if char == "*":
+            out.append("[^/]*")
+        elif char == "?":
+            out.append("[^/]")
+        elif char == "[":
+            end = pattern.find("]", i + 1)
+            if end == -1:
+                out.append(re.escape(char))
+            else:
+                body = pattern[i + 1 : end].replace("\\", "\\\\")
+                if body.startswith("^") or body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append(f"[{body}]")
+                i = end
+        elif char == "\\" and i + 1 < len(pattern):
+            i += 1
+            out.append(re.escape(pattern[i]))
+        else:
+            out.append(re.escape(char))
+        i += 1
+    return "".join(out)
+
+
+@dataclass
+class BuildRecord:
+    context: str
+    dockerfile: str
+    fingerprint: str
+    built_at: float
+
+
+class FingerprintIndex:
+    """Persistent per-file stat/hash index for docker build contexts.
+
+    Files whose size and mtime are unchanged since the last run reuse their recorded hash, so
+    re-fingerprinting a large context costs one ``stat`` per file.
+    """
+
+    def __init__(self, path: Path | None = None):
+        self.path = path or cache_dir() / "build-fingerprints.json"
+        data = load_json(self.path)
+        self._files: dict[str, dict[str, list]] = data.get("files") or {}
+        self._builds: dict[str, BuildRecord] = {}
+        for image, raw in (data.get("builds") or {}).items():
+            try:
+                self._builds[image] = BuildRecord(**raw)
+            except TypeError:
+                continue
+        self.hashed = 0
+
+    def fingerprint(self, context: Path, dockerfile: Path) -> str:
+        context = context.resolve()
+        ignore = DockerIgnore.for_build(context, dockerfile)
+        previous = self._files.get(str(context), {})
+        current: dict[str, list] = {}
+        digest = hashlib.sha256()
+
+        for relpath, stat in sorted(_walk(context, ignore)):
+            size, mtime_ns = stat
+            cached = previous.get(relpath)
+            if cached and cached[0] == size and cached[1] == mtime_ns:
+                file_hash = cached[2]
+            else:
+                file_hash = _hash_entry(context / relpath)
+                self.hashed += 1
+            current[relpath] = [size, mtime_ns, file_hash]
+            digest.update(f"{relpath}\0{file_hash}\n".encode())
+
+        self._files[str(context)] = current
+        digest.update(f"dockerfile\0{dockerfile}\0{file_digest(dockerfile)}\n".encode())
+        return digest.hexdigest()
+
+    def last_build(self, image: str) -> BuildRecord | None:
+        return self._builds.get(image)
+
+    def is_current(self, image: str, fingerprint: str) -> bool:
+        record = self._builds.get(image)
+        return record is not None and record.fingerprint == fingerprint
+
+    def record_build(
+        self, image: str, *, context: Path, dockerfile: Path, fingerprint: str
+    ) -> None:
+        self._builds[image] = BuildRecord(
+            context=str(context),
+            dockerfile=str(dockerfile),
+            fingerprint=fingerprint,
+            built_at=time.time(),
+        )
+
+    def builds(self) -> list[tuple[str, BuildRecord]]:
+        return sorted(self._builds.items())
+
+    def clear(self) -> int:
+        removed = len(self._builds)
+        self._builds.clear()
+        self._files.clear()
+        self.save()
+        return removed
+
+    def save(self) -> None:
+        write_json(
+            self.path,
+            {
+                "files": self._files,
+                "builds": {image: asdict(record) for image, record in self._builds.items()},
+            },
+        )
+
+
+def _walk(root: Path, ignore: DockerIgnore):
+    # Pruning excluded directories is only safe when no later "!" pattern can re-include a child.
+    prune = not ignore.has_negations
+    stack = [("", str(root))]
+    while stack:
+        prefix, directory = stack.pop()
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            continue
+        for entry in entries:
+            relpath = f"{prefix}{entry.name}"
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+            if is_dir:
+                if prune and ignore.excluded(relpath):
+                    continue
+                stack.append((f"{relpath}/", entry.path))
+                continue
+            if ignore.excluded(relpath):
+                continue
+            try:
+                stat = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            yield relpath, (stat.st_size, stat.st_mtime_ns)
+
+
+def _hash_entry(path: Path) -> str:
+    if path.is_symlink():
+        return hashlib.sha256(f"symlink:{os.readlink(path)}".encode()).hexdigest()
+    try:
+        return file_digest(path)
+    except OSError:
+        return ""
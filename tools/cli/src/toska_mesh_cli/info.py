@@ -1,19 +1,36 @@
 from __future__ import annotations
 
+import io
 import json
 import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TextIO,
+)
 
 from .progress import ProgressReporter
+from .stream import iter_list_items, read_chunks
 
 
 class KubectlError(Exception):
     """Raised when kubectl commands fail."""
 
 
-@dataclass
+@dataclass(slots=True)
 class DeploymentInfo:
     name: str
     namespace: str
@@ -22,9 +39,10 @@ class DeploymentInfo:
     desired: int
     images: List[str] = field(default_factory=list)
     labels: Dict[str, str] = field(default_factory=dict)
+    selector: dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ServiceInfo:
     name: str
     namespace: str
@@ -34,7 +52,7 @@ class ServiceInfo:
     selector: Dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class PodInfo:
     name: str
     namespace: str
@@ -55,109 +73,200 @@ def _kubectl_args(kubeconfig: Optional[Path] = None, context: Optional[str] = No
 
 def list_deployments(
     *,
-    namespace: str,
+    namespace: str | None,
     selector: Optional[str] = None,
     kubeconfig: Optional[Path] = None,
     context: Optional[str] = None,
     run_cmd=None,
+    chunk_size: int | None = None,
+    stream_cmd=None,
 ) -> List[DeploymentInfo]:
-    runner = run_cmd or (lambda cmd: subprocess.run(cmd, capture_output=True, text=True))
-    cmd = ["kubectl", *_kubectl_args(kubeconfig, context), "get", "deploy", "-n", namespace, "-o", "json"]
-    if selector:
-        cmd.extend(["-l", selector])
-
-    result = runner(cmd)
-    if getattr(result, "returncode", 1) != 0:
-        raise KubectlError(getattr(result, "stderr", "") or getattr(result, "stdout", ""))
-
-    try:
-        payload = json.loads(result.stdout or "{}")
-    except json.JSONDecodeError as exc:
-        raise KubectlError(f"Unable to parse kubectl output: {exc}") from exc
-
-    deployments: List[DeploymentInfo] = []
-    for item in payload.get("items", []):
-        meta = item.get("metadata", {})
-        status = item.get("status", {})
-        spec = item.get("spec", {}) or {}
-        template = spec.get("template", {}) or {}
-        containers = (template.get("spec") or {}).get("containers") or []
-        images = [c.get("image", "") for c in containers if c.get("image")]
-        desired = status.get("replicas", 0) or 0
-        available = status.get("availableReplicas", 0) or 0
-        ready = f"{status.get('readyReplicas', 0) or 0}/{desired}"
-        deployments.append(
-            DeploymentInfo(
-                name=meta.get("name", ""),
-                namespace=meta.get("namespace", namespace),
-                ready=ready,
-                available=available,
-                desired=desired,
-                images=images,
-                labels=meta.get("labels", {}) or {},
-            )
-        )
-    return deployments
+    items = _get_items(
+        "deploy",
+        namespace=namespace,
+        selector=selector,
+        kubeconfig=kubeconfig,
+        context=context,
+        run_cmd=run_cmd,
+        chunk_size=chunk_size,
+        stream_cmd=stream_cmd,
+    )
+    return [_parse_deployment(item, namespace) for item in items]
 
 
 def list_services(
     *,
-    namespace: str,
+    namespace: str | None,
     selector: Optional[str] = None,
     kubeconfig: Optional[Path] = None,
     context: Optional[str] = None,
     run_cmd=None,
+    chunk_size: int | None = None,
+    stream_cmd=None,
 ) -> List[ServiceInfo]:
-    runner = run_cmd or (lambda cmd: subprocess.run(cmd, capture_output=True, text=True))
-    cmd = ["kubectl", *_kubectl_args(kubeconfig, context), "get", "svc", "-n", namespace, "-o", "json"]
-    if selector:
-        cmd.extend(["-l", selector])
-
-    result = runner(cmd)
-    if getattr(result, "returncode", 1) != 0:
-        raise KubectlError(getattr(result, "stderr", "") or getattr(result, "stdout", ""))
-
-    try:
-        payload = json.loads(result.stdout or "{}")
-    except json.JSONDecodeError as exc:
-        raise KubectlError(f"Unable to parse kubectl output: {exc}") from exc
-
-    services: List[ServiceInfo] = []
-    for item in payload.get("items", []):
-        meta = item.get("metadata", {})
-        spec = item.get("spec", {}) or {}
-        ports_data = spec.get("ports") or []
-        ports = ", ".join(
-            f"{p.get('port')}->{p.get('targetPort') or ''}".strip("->")
-            for p in ports_data
-            if p.get("port")
-        )
-        services.append(
-            ServiceInfo(
-                name=meta.get("name", ""),
-                namespace=meta.get("namespace", namespace),
-                svc_type=spec.get("type", "ClusterIP"),
-                cluster_ip=spec.get("clusterIP", ""),
-                ports=ports,
-                selector=spec.get("selector", {}) or {},
-            )
-        )
-    return services
+    items = _get_items(
+        "svc",
+        namespace=namespace,
+        selector=selector,
+        kubeconfig=kubeconfig,
+        context=context,
+        run_cmd=run_cmd,
+        chunk_size=chunk_size,
+        stream_cmd=stream_cmd,
+    )
+    return [_parse_service(item, namespace) for item in items]
 
 
 def list_pods(
     *,
-    namespace: str,
+    namespace: str | None,
     selector: Optional[str] = None,
     kubeconfig: Optional[Path] = None,
     context: Optional[str] = None,
     run_cmd=None,
+    chunk_size: int | None = None,
+    stream_cmd=None,
 ) -> List[PodInfo]:
-    runner = run_cmd or (lambda cmd: subprocess.run(cmd, capture_output=True, text=True))
-    cmd = ["kubectl", *_kubectl_args(kubeconfig, context), "get", "pods", "-n", namespace, "-o", "json"]
+    items = _get_items(
+        "pods",
+        namespace=namespace,
+        selector=selector,
+        kubeconfig=kubeconfig,
+        context=context,
+        run_cmd=run_cmd,
+        chunk_size=chunk_size,
+        stream_cmd=stream_cmd,
+    )
+    return [_parse_pod(item, namespace) for item in items]
+
+
+def list_resources(
+    kinds: Sequence[str],
+    *,
+    namespace: str | None,
+    selector: str | None = None,
+    kubeconfig: Path | None = None,
+    context: str | None = None,
+    run_cmd=None,
+    chunk_size: int | None = None,
+    stream_cmd=None,
+) -> dict[str, list]:
+    """Fetch several kinds with one ``kubectl get deploy,svc,pods -o json`` call.
+
+    ``kinds`` are short names (``deploy``, ``svc``, ``pods``); the returned List is split by item
+    kind into a dict keyed like ``gather_service_info``'s result.
+    """
+    unknown = [kind for kind in kinds if kind not in RESOURCE_KINDS]
+    if unknown:
+        raise ValueError(f"Unsupported resource kind(s): {', '.join(unknown)}")
+
+    grouped: dict[str, list] = {RESULT_KEYS[kind]: [] for kind in kinds}
+    for kind, record in iter_resources(
+        kinds,
+        namespace=namespace,
+        selector=selector,
+        kubeconfig=kubeconfig,
+        context=context,
+        run_cmd=run_cmd,
+        chunk_size=chunk_size,
+        stream_cmd=stream_cmd,
+    ):
+        grouped[RESULT_KEYS[kind]].append(record)
+    return grouped
+
+
+def iter_resources(
+    kinds: Sequence[str],
+    *,
+    namespace: str | None,
+    selector: str | None = None,
+    kubeconfig: Path | None = None,
+    context: str | None = None,
+    run_cmd=None,
+    chunk_size: int | None = None,
+    stream_cmd=None,
+) -> Generator[tuple[str, Any], None, None]:
+    """Yield ``(kind, record)`` pairs from one kubectl call, as soon as each item is parsed.
+
+    With ``chunk_size`` set, the first records arrive while kubectl is still paging through the
+    API server, and memory stays bounded by one item.
+    """
+    unknown = [kind for kind in kinds if kind not in RESOURCE_KINDS]
+    if unknown:
+        raise ValueError(f"Unsupported resource kind(s): {', '.join(unknown)}")
+
+    items = _get_items(
+        ",".join(kinds),
+        namespace=namespace,
+        selector=selector,
+        kubeconfig=kubeconfig,
+        context=context,
+        run_cmd=run_cmd,
+        chunk_size=chunk_size,
+        stream_cmd=stream_cmd,
+    )
+    by_kind = {RESOURCE_KINDS[kind]: kind for kind in kinds}
+    for item in items:
+        kind = by_kind.get(item.get("kind", "")) or (kinds[0] if len(kinds) == 1 else None)
+        if kind is not None:
+            yield kind, _PARSERS[kind](item, namespace)
+
+
+def workload_pod_selector(
+    workload: str,
+    *,
+    namespace: str | None,
+    selector: str | None = None,
+    kubeconfig: Path | None = None,
+    context: str | None = None,
+    run_cmd=None,
+) -> str:
+    """Return the pod label selector (``spec.selector.matchLabels``) of a workload.
+
+    The workload is the Deployment or StatefulSet called ``workload`` among those matching
+    ``selector``.
+    """
+    items = _get_items(
+        "deploy,statefulsets",
+        namespace=namespace,
+        selector=selector,
+        kubeconfig=kubeconfig,
+        context=context,
+        run_cmd=run_cmd,
+    )
+    for item in items:
+        if (item.get("metadata") or {}).get("name") != workload:
+            continue
+        labels = ((item.get("spec") or {}).get("selector") or {}).get("matchLabels") or {}
+        if not labels:
+            raise KubectlError(f"{item.get('kind', 'Workload')} '{workload}' has no matchLabels")
+        return ",".join(f"{key}={value}" for key, value in sorted(labels.items()))
+    scope = f"namespace '{namespace}'" if namespace else "any namespace"
+    matching = f" matching '{selector}'" if selector else ""
+    raise KubectlError(f"No deployment or statefulset '{workload}' in {scope}{matching}")
+
+
+def _get_items(
+    kinds: str,
+    *,
+    namespace: str | None,
+    selector: str | None,
+    kubeconfig: Path | None,
+    context: str | None,
+    run_cmd,
+    chunk_size: int | None = None,
+    stream_cmd=None,
+) -> Iterator[dict]:
+    # A namespace of None lists across all namespaces, like ``kubectl get -A``.
+    scope = ["-n", namespace] if namespace else ["--all-namespaces"]
+    cmd = ["kubectl", *_kubectl_args(kubeconfig, context), "get", kinds, *scope, "-o", "json"]
     if selector:
         cmd.extend(["-l", selector])
+    if chunk_size:
+        cmd.append(f"--chunk-size={chunk_size}")
+        return _stream_items(cmd, stream_cmd or _StreamedCommand)
 
+    runner = run_cmd or (lambda cmd: subprocess.run(cmd, capture_output=True, text=True))
     result = runner(cmd)
     if getattr(result, "returncode", 1) != 0:
         raise KubectlError(getattr(result, "stderr", "") or getattr(result, "stdout", ""))
@@ -166,66 +275,268 @@ def list_pods(
         payload = json.loads(result.stdout or "{}")
     except json.JSONDecodeError as exc:
         raise KubectlError(f"Unable to parse kubectl output: {exc}") from exc
+    return iter(payload.get("items", []))
 
-    pods: List[PodInfo] = []
-    for item in payload.get("items", []):
-        meta = item.get("metadata", {})
-        status = item.get("status", {}) or {}
-        container_statuses = status.get("containerStatuses") or []
-        ready_count = sum(1 for cs in container_statuses if cs.get("ready"))
-        total = len(container_statuses)
-        ready = f"{ready_count}/{total or 0}"
-        restarts = sum(int(cs.get("restartCount", 0) or 0) for cs in container_statuses)
-        pods.append(
-            PodInfo(
-                name=meta.get("name", ""),
-                namespace=meta.get("namespace", namespace),
-                ready=ready,
-                status=status.get("phase", ""),
-                restarts=restarts,
-                node=status.get("nodeName", ""),
-            )
+
+def _stream_items(cmd: list[str], stream_cmd) -> Iterator[dict]:
+    """Parse kubectl's List output item by item as it arrives instead of buffering it."""
+    process = stream_cmd(cmd)
+    try:
+        yield from iter_list_items(read_chunks(process.stdout))
+        if process.wait() != 0:
+            raise KubectlError(_error_output(process))
+    except ValueError as exc:
+        process.wait()
+        if process.returncode:
+            raise KubectlError(_error_output(process)) from exc
+        raise KubectlError(f"Unable to parse kubectl output: {exc}") from exc
+    finally:
+        if process.returncode is None:
+            # The consumer stopped early; kubectl may be blocked writing to a full stdout pipe.
+            process.terminate()
+            process.wait()
+
+
+def _error_output(process) -> str:
+    stderr = getattr(process, "stderr", None)
+    output = stderr.read() if stderr is not None else ""
+    return output or f"kubectl exited with {process.returncode}"
+
+
+class _StreamedCommand:
+    """``subprocess.Popen`` wrapper whose stderr is spooled to a file, so an unread stderr pipe
+    can never stall kubectl while stdout is being consumed."""
+
+    def __init__(self, cmd: list[str]):
+        self._stderr = tempfile.TemporaryFile()
+        self._process = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=self._stderr, text=True
         )
-    return pods
+        self.stdout = self._process.stdout
+
+    @property
+    def returncode(self) -> int | None:
+        return self._process.returncode
+
+    @property
+    def stderr(self) -> TextIO:
+        self._stderr.seek(0)
+        return io.StringIO(self._stderr.read().decode(errors="replace").strip())
+
+    def terminate(self) -> None:
+        self._process.terminate()
+
+    def wait(self) -> int:
+        if self.stdout is not None:
+            self.stdout.close()
+        return self._process.wait()
+
+
+def _parse_deployment(item: dict, namespace: str | None) -> DeploymentInfo:
+    meta = item.get("metadata", {})
+    status = item.get("status", {})
+    spec = item.get("spec", {}) or {}
+    template = spec.get("template", {}) or {}
+    containers = (template.get("spec") or {}).get("containers") or []
+    images = [c.get("image", "") for c in containers if c.get("image")]
+    desired = status.get("replicas", 0) or 0
+    available = status.get("availableReplicas", 0) or 0
+    ready = f"{status.get('readyReplicas', 0) or 0}/{desired}"
+    return DeploymentInfo(
+        name=meta.get("name", ""),
+        namespace=meta.get("namespace") or namespace or "",
+        ready=ready,
+        available=available,
+        desired=desired,
+        images=images,
+        labels=meta.get("labels", {}) or {},
+        selector=(spec.get("selector") or {}).get("matchLabels") or {},
+    )
+
+
+def _parse_service(item: dict, namespace: str | None) -> ServiceInfo:
+    meta = item.get("metadata", {})
+    spec = item.get("spec", {}) or {}
+    ports_data = spec.get("ports") or []
+    ports = ", ".join(
+        f"{p.get('port')}->{p.get('targetPort') or ''}".strip("->")
+        for p in ports_data
+        if p.get("port")
+    )
+    return ServiceInfo(
+        name=meta.get("name", ""),
+        namespace=meta.get("namespace") or namespace or "",
+        svc_type=spec.get("type", "ClusterIP"),
+        cluster_ip=spec.get("clusterIP", ""),
+        ports=ports,
+        selector=spec.get("selector", {}) or {},
+    )
+
+
+def _parse_pod(item: dict, namespace: str | None) -> PodInfo:
+    meta = item.get("metadata", {})
+    status = item.get("status", {}) or {}
+    container_statuses = status.get("containerStatuses") or []
+    ready_count = sum(1 for cs in container_statuses if cs.get("ready"))
+    total = len(container_statuses)
+    ready = f"{ready_count}/{total or 0}"
+    restarts = sum(int(cs.get("restartCount", 0) or 0) for cs in container_statuses)
+    # Namespace, phase and node repeat across thousands of pods; share one string object each.
+    return PodInfo(
+        name=meta.get("name", ""),
+        namespace=sys.intern(meta.get("namespace") or namespace or ""),
+        ready=sys.intern(ready),
+        status=sys.intern(status.get("phase", "") or ""),
+        restarts=restarts,
+        node=sys.intern(status.get("nodeName", "") or ""),
+    )
+
+
+# Short kind names accepted by list_resources, mapped to the List item kind, the
+# gather_service_info result key and the item parser.
+RESOURCE_KINDS = {"deploy": "Deployment", "svc": "Service", "pods": "Pod"}
+RESULT_KEYS = {"deploy": "deployments", "svc": "services", "pods": "pods"}
+_PARSERS = {"deploy": _parse_deployment, "svc": _parse_service, "pods": _parse_pod}
+FETCH_MODES = ("combined", "sequential")
+# full: complete objects as JSON; table: server-printed columns only (see projection.py).
+PROJECTIONS = ("full", "table")
+
+
+DEPLOYMENT_HEADERS = ["NAME", "READY", "AVAILABLE", "IMAGES"]
+SERVICE_HEADERS = ["NAME", "TYPE", "CLUSTER IP", "PORTS"]
+POD_HEADERS = ["NAME", "READY", "STATUS", "RESTARTS", "NODE"]
+
+
+def deployment_row(d: DeploymentInfo) -> list[str]:
+    images = ", ".join(d.images) if d.images else "-"
+    return [d.name, d.ready, str(d.available), images]
+
+
+def service_row(s: ServiceInfo) -> list[str]:
+    return [s.name, s.svc_type, s.cluster_ip or "-", s.ports or "-"]
+
+
+def pod_row(p: PodInfo) -> list[str]:
+    return [p.name, p.ready, p.status or "-", str(p.restarts), p.node or "-"]
+
+
+def format_deployments_table(
+    deployments: Iterable[DeploymentInfo],
+    *,
+    rich_output: bool = False,
+    show_namespace: bool = False,
+) -> str:
+    rows = [_with_namespace(d, deployment_row(d), show_namespace) for d in deployments]
+    return _render_table(
+        _headers(DEPLOYMENT_HEADERS, show_namespace), rows, rich_output=rich_output
+    )
+
+
+def format_services_table(
+    services: Iterable[ServiceInfo], *, rich_output: bool = False, show_namespace: bool = False
+) -> str:
+    rows = [_with_namespace(s, service_row(s), show_namespace) for s in services]
+    return _render_table(_headers(SERVICE_HEADERS, show_namespace), rows, rich_output=rich_output)
 
 
-def format_deployments_table(deployments: Iterable[DeploymentInfo], *, rich_output: bool = False) -> str:
-    headers = ["NAME", "READY", "AVAILABLE", "IMAGES"]
-    rows = []
-    for d in deployments:
-        images = ", ".join(d.images) if d.images else "-"
-        rows.append([d.name, d.ready, str(d.available), images])
-    return _render_table(headers, rows, rich_output=rich_output)
+def format_pods_table(
+    pods: Iterable[PodInfo], *, rich_output: bool = False, show_namespace: bool = False
+) -> str:
+    rows = [_with_namespace(p, pod_row(p), show_namespace) for p in pods]
+    return _render_table(_headers(POD_HEADERS, show_namespace), rows, rich_output=rich_output)
 
 
-def format_services_table(services: Iterable[ServiceInfo], *, rich_output: bool = False) -> str:
-    headers = ["NAME", "TYPE", "CLUSTER IP", "PORTS"]
-    rows = []
-    for s in services:
-        ports = s.ports or "-"
-        rows.append([s.name, s.svc_type, s.cluster_ip or "-", ports])
-    return _render_table(headers, rows, rich_output=rich_output)
+def _headers(headers: list[str], show_namespace: bool) -> list[str]:
+    return ["NAMESPACE", *headers] if show_namespace else headers
 
 
-def format_pods_table(pods: Iterable[PodInfo], *, rich_output: bool = False) -> str:
-    headers = ["NAME", "READY", "STATUS", "RESTARTS", "NODE"]
-    rows = []
-    for p in pods:
-        rows.append([p.name, p.ready, p.status or "-", str(p.restarts), p.node or "-"])
-    return _render_table(headers, rows, rich_output=rich_output)
+def _with_namespace(item, row: list[str], show_namespace: bool) -> list[str]:
+    return [item.namespace or "-", *row] if show_namespace else row
+
+
+TABLE_KINDS: dict[str, tuple[list[str], Callable[[Any], list[str]]]] = {
+    "deploy": (DEPLOYMENT_HEADERS, deployment_row),
+    "svc": (SERVICE_HEADERS, service_row),
+    "pods": (POD_HEADERS, pod_row),
+}
+# Lines per write() when streaming a table; keeps syscalls low without holding the whole table.
+_WRITE_BATCH = 512
+
+
+def write_table(
+    kind: str,
+    records: Iterable,
+    *,
+    stream: TextIO | None = None,
+    rich_output: bool = False,
+    show_namespace: bool = False,
+) -> None:
+    """Write a deployments/services/pods table to ``stream`` (stdout by default).
+
+    Unlike ``format_*_table`` the table is never assembled as one string or rich ``Table``:
+    column widths come from a single pass over the rows and lines are written in batches as they
+    are formatted. With ``rich_output`` the header goes through one shared console for styling;
+    rows are plain text, so long values are not wrapped to the terminal width.
+    """
+    headers, make_row = TABLE_KINDS[kind]
+    rows = [_with_namespace(record, make_row(record), show_namespace) for record in records]
+    _write_table(_headers(headers, show_namespace), rows, stream or sys.stdout, rich_output)
+
+
+def _write_table(headers: list[str], rows: list[list[str]], stream: TextIO, rich_output: bool):
+    widths = _column_widths(headers, rows)
+    console = _stream_console(stream) if rich_output else None
+    lines = _table_lines(headers, rows, widths, rule="━" if console else "-")
+    if console is not None:
+        console.print(next(lines), style="bold", markup=False, highlight=False, soft_wrap=True)
+        console.print(next(lines), markup=False, highlight=False, soft_wrap=True)
+    batch: list[str] = []
+    for line in lines:
+        batch.append(line)
+        if len(batch) >= _WRITE_BATCH:
+            stream.write("\n".join(batch) + "\n")
+            batch.clear()
+    if batch:
+        stream.write("\n".join(batch) + "\n")
+    stream.flush()
+
+
+def _column_widths(headers: list[str], rows: list[list[str]]) -> list[int]:
+    # zip() walks each cell exactly once and max/len run in C; strict catches rows that are short
+    # a column instead of silently narrowing the table.
+    return [max(map(len, column)) for column in zip(headers, *rows, strict=True)]
+
+
+def _table_lines(
+    headers: list[str], rows: Iterable[list[str]], widths: list[int], *, rule: str = "-"
+) -> Iterator[str]:
+    template = "  ".join(f"{{:<{width}}}" for width in widths)
+    yield template.format(*headers)
+    yield "  ".join(rule * width for width in widths)
+    for row in rows:
+        yield template.format(*row)
 
 
 def _format_table(rows: List[List[str]]) -> str:
     if not rows:
         return ""
-    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
-    lines = []
-    for idx, row in enumerate(rows):
-        padded = "  ".join(col.ljust(widths[i]) for i, col in enumerate(row))
-        lines.append(padded)
-        if idx == 0:
-            lines.append("  ".join("-" * w for w in widths))
-    return "\n".join(lines)
+    headers, body = rows[0], rows[1:]
+    return "\n".join(_table_lines(headers, body, _column_widths(headers, body)))
+
+
+_console = None
+
+
+def _stream_console(stream: TextIO):
+    """Return the shared rich console, rebound only when the target stream changes."""
+    global _console
+    try:
+        from rich.console import Console
+    except Exception:
+        return None
+    if _console is None or _console.file is not stream:
+        _console = Console(file=stream)
+    return _console
 
 
 def _render_table(headers: list[str], rows: list[list[str]], *, rich_output: bool) -> str:
@@ -234,7 +545,6 @@ def _render_table(headers: list[str], rows: list[list[str]], *, rich_output: boo
 
     try:
         from rich import box
-        from rich.console import Console
         from rich.table import Table
     except Exception:
         return _format_table([headers, *rows])
@@ -245,24 +555,91 @@ def _render_table(headers: list[str], rows: list[list[str]], *, rich_output: boo
     for row in rows:
         table.add_row(*row)
 
-    console = Console(record=True)
-    console.print(table)
-    return console.export_text()
+    # Render to plain segments instead of printing: the caller decides where the text goes.
+    console = _stream_console(sys.stdout)
+    return "".join(segment.text for segment in console.render(table))
 
 
 def gather_service_info(
     *,
-    namespace: str,
+    namespace: str | None,
     selector: Optional[str],
     include_deployments: bool = True,
     include_services: bool = True,
     include_pods: bool = False,
     kubeconfig: Optional[Path] = None,
     context: Optional[str] = None,
+    fetch: str = "sequential",
     run_cmd=None,
+    chunk_size: int | None = None,
+    stream_cmd=None,
+    projection: str = "full",
     progress: ProgressReporter | None = None,
 ) -> dict:
+    """List deployments/services/pods in one namespace (``None`` for all namespaces).
+
+    With ``chunk_size`` set, kubectl pages through the API server ``chunk_size`` items at a time and
+    its output is parsed item by item as it streams in, so the full List is never held in memory.
+    ``projection="table"`` fetches only the server-printed columns instead of full objects.
+    """
     progress = progress or ProgressReporter()
+    if fetch not in FETCH_MODES:
+        raise ValueError(f"Unsupported fetch mode '{fetch}'.")
+    if projection not in PROJECTIONS:
+        raise ValueError(f"Unsupported projection '{projection}'.")
+
+    kinds = [
+        kind
+        for kind, wanted in (
+            ("deploy", include_deployments),
+            ("svc", include_services),
+            ("pods", include_pods),
+        )
+        if wanted
+    ]
+    if projection == "table":
+        from .projection import UnexpectedTableError, list_projected
+
+        result: dict = {"deployments": [], "services": [], "pods": []}
+        unexpected: UnexpectedTableError | None = None
+        for batch in [kinds] if fetch == "combined" else [[kind] for kind in kinds]:
+            labels = ", ".join(RESULT_KEYS[kind] for kind in batch)
+            with progress.step(f"Listing {labels}") as step:
+                try:
+                    projected = list_projected(
+                        batch,
+                        namespace=namespace,
+                        selector=selector,
+                        kubeconfig=kubeconfig,
+                        context=context,
+                        chunk_size=chunk_size,
+                        run_cmd=run_cmd,
+                    )
+                except UnexpectedTableError as exc:
+                    step.mark("skipped")
+                    unexpected = exc
+                    break
+                result.update(projected)
+        if unexpected is None:
+            return result
+        # Wide columns vary between kubectl versions; the JSON listing below does not.
+        progress.note(f"{unexpected}; falling back to full objects")
+
+    if fetch == "combined" and len(kinds) > 1:
+        # One kubectl process and one API round-trip for every requested kind.
+        labels = ", ".join(RESULT_KEYS[kind] for kind in kinds)
+        with progress.step(f"Listing {labels}"):
+            data = list_resources(
+                kinds,
+                namespace=namespace,
+                selector=selector,
+                kubeconfig=kubeconfig,
+                context=context,
+                run_cmd=run_cmd,
+                chunk_size=chunk_size,
+                stream_cmd=stream_cmd,
+            )
+        return {key: data.get(key, []) for key in ("deployments", "services", "pods")}
 
     deployments: List[DeploymentInfo] = []
     if include_deployments:
@@ -273,6 +650,8 @@ def gather_service_info(
                 kubeconfig=kubeconfig,
                 context=context,
                 run_cmd=run_cmd,
+                chunk_size=chunk_size,
+                stream_cmd=stream_cmd,
             )
 
     services: List[ServiceInfo] = []
@@ -284,6 +663,8 @@ def gather_service_info(
                 kubeconfig=kubeconfig,
                 context=context,
                 run_cmd=run_cmd,
+                chunk_size=chunk_size,
+                stream_cmd=stream_cmd,
             )
 
     pods: List[PodInfo] = []
@@ -295,6 +676,8 @@ def gather_service_info(
                 kubeconfig=kubeconfig,
                 context=context,
                 run_cmd=run_cmd,
+                chunk_size=chunk_size,
+                stream_cmd=stream_cmd,
             )
 
     return {
@@ -302,3 +685,73 @@ def gather_service_info(
         "services": services,
         "pods": pods,
     }
+
+
+def gather_namespaces(
+    namespaces: Sequence[str],
+    *,
+    selector: str | None,
+    all_namespaces: bool = False,
+    include_deployments: bool = True,
+    include_services: bool = True,
+    include_pods: bool = False,
+    kubeconfig: Path | None = None,
+    context: str | None = None,
+    fetch: str = "sequential",
+    max_workers: int = 8,
+    run_cmd=None,
+    chunk_size: int | None = None,
+    stream_cmd=None,
+    projection: str = "full",
+    progress: ProgressReporter | None = None,
+) -> dict:
+    """``gather_service_info`` across several namespaces, merged into one result.
+
+    ``all_namespaces`` issues a single cluster-wide query. Otherwise each namespace is queried on
+    a bounded thread pool and the results are concatenated in the order the namespaces were given.
+    """
+    progress = progress or ProgressReporter()
+    query = dict(
+        selector=selector,
+        include_deployments=include_deployments,
+        include_services=include_services,
+        include_pods=include_pods,
+        kubeconfig=kubeconfig,
+        context=context,
+        fetch=fetch,
+        run_cmd=run_cmd,
+        chunk_size=chunk_size,
+        stream_cmd=stream_cmd,
+        projection=projection,
+    )
+    if all_namespaces:
+        return gather_service_info(namespace=None, progress=progress, **query)
+    unique = list(dict.fromkeys(namespaces))
+    if len(unique) == 1:
+        return gather_service_info(namespace=unique[0], progress=progress, **query)
+
+    def _one(namespace: str) -> dict:
+        start = time.monotonic()
+        # Per-namespace steps would interleave across threads; report one line per namespace.
+        quiet = ProgressReporter(stream=io.StringIO(), err_stream=io.StringIO())
+        try:
+            data = gather_service_info(namespace=namespace, progress=quiet, **query)
+        except KubectlError as exc:
+            progress.record(f"Listing namespace {namespace}", "fail", time.monotonic() - start)
+            raise KubectlError(f"namespace {namespace}: {exc}") from exc
+        progress.record(f"Listing namespace {namespace}", "ok", time.monotonic() - start)
+        return data
+
+    merged: dict = {"deployments": [], "services": [], "pods": []}
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(unique)))) as pool:
+        futures = [pool.submit(_one, namespace) for namespace in unique]
+        try:
+            for future in futures:
+                data = future.result()
+                for key in merged:
+                    merged[key].extend(data[key])
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+    return merged
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import subprocess
+import threading
+import time
+from collections.abc import Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+
+from .progress import ProgressReporter
+
+
+@dataclass(frozen=True)
+class Job:
+    """A single command scheduled on a worker pool."""
+
+    name: str
+    label: str
+    cmd: list[str]
+    failure: str
+    input: str | None = None
+
+
+@dataclass
+class JobResult:
+    job: Job
+    status: str
+    duration: float
+    result: object | None = None
+
+
+class JobFailed(Exception):
+    """Raised when a pooled command exits non-zero; remaining jobs are cancelled."""
+
+    def __init__(self, job: Job, returncode: int, detail: str):
+        super().__init__(f"{job.failure} (exit {returncode}): {detail}")
+        self.job = job
+        self.returncode = returncode
+        self.detail = detail
+        self.results: list[JobResult] = []
+
+
+class ProcessGroup:
+    """Runs commands with captured output and can terminate everything still in flight."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._processes: set[subprocess.Popen] = set()
+        self.cancelled = False
+
+    def run(self, cmd: list[str], input: str | None = None) -> subprocess.CompletedProcess:
+        with self._lock:
+            if self.cancelled:
+                return subprocess.CompletedProcess(cmd, -15, "", "cancelled")
+            process = subprocess.Popen(
+                cmd,
+                stdin=subprocess.PIPE if input is not None else None,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+            )
+            self._processes.add(process)
+        try:
+            stdout, stderr = process.communicate(input)
+        finally:
+            with self._lock:
+                self._processes.discard(process)
+        return subprocess.CompletedProcess(cmd, process.returncode, stdout, stderr)
+
+    def terminate(self) -> None:
+        with self._lock:
+            self.cancelled = True
+            processes = list(self._processes)
+        for process in processes:
+            try:
+                process.terminate()
+            except OSError:
+                # Already gone.
+                pass
+
+
+def run_jobs(
+    jobs: Sequence[Job],
+    *,
+    max_workers: int,
+    verbose: bool = False,
+    run_cmd=None,
+    progress: ProgressReporter | None = None,
+    emit=None,
+) -> list[JobResult]:
+    """Run jobs on a bounded pool, stopping at the first failure.
+
+    Output is always captured so concurrent commands do not interleave; with ``verbose`` it is
+    printed once the command finishes. Queued jobs are cancelled on failure and, when the default
+    runner is used, running processes are terminated as well.
+    """
+    return run_pipeline(
+        [[job] for job in jobs],
+        limits=[max_workers],
+        verbose=verbose,
+        run_cmd=run_cmd,
+        progress=progress,
+        emit=emit,
+    )
+
+
+def run_pipeline(
+    chains: Sequence[Sequence[Job]],
+    *,
+    limits: Sequence[int],
+    verbose: bool = False,
+    run_cmd=None,
+    progress: ProgressReporter | None = None,
+    emit=None,
+) -> list[JobResult]:
+    """Run chains of jobs where stage ``i`` of every chain shares a pool of ``limits[i]`` workers.
+
+    The next job of a chain is queued as soon as the previous one succeeds, so stages overlap
+    across chains (e.g. pushing one image while the next is still building). Failure handling
+    matches :func:`run_jobs`.
+    """
+    progress = progress or ProgressReporter()
+    printer = emit or print
+    group = ProcessGroup()
+    runner = run_cmd or group.run
+    cancel = threading.Event()
+    results: list[JobResult] = []
+
+    def _execute(job: Job) -> JobResult:
+        if cancel.is_set():
+            return JobResult(job=job, status="cancelled", duration=0.0)
+        start = time.monotonic()
+        result = runner(job.cmd) if job.input is None else runner(job.cmd, input=job.input)
+        duration = time.monotonic() - start
+        if getattr(result, "returncode", 1) == 0:
+            return JobResult(job=job, status="ok", duration=duration, result=result)
+        if cancel.is_set():
+            return JobResult(job=job, status="cancelled", duration=duration, result=result)
+        # Stop the pool from this worker so it cannot pick up another queued job first.
+        cancel.set()
+        group.terminate()
+        return JobResult(job=job, status="fail", duration=duration, result=result)
+
+    stage_count = max((len(chain) for chain in chains), default=0)
+    if len(limits) < stage_count:
+        raise ValueError(f"Expected {stage_count} stage limits, got {len(limits)}.")
+
+    failure: JobFailed | None = None
+    executors = [
+        ThreadPoolExecutor(max_workers=max(1, min(limits[i], len(chains))))
+        for i in range(stage_count)
+    ]
+    try:
+        futures: dict[Future, tuple[Sequence[Job], int]] = {}
+        for chain in chains:
+            if chain:
+                futures[executors[0].submit(_execute, chain[0])] = (chain, 0)
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                chain, index = futures[future]
+                outcome = future.result()
+                progress.record(outcome.job.label, outcome.status, outcome.duration)
+                results.append(outcome)
+                if outcome.status == "ok":
+                    if verbose:
+                        _echo(outcome.result, printer)
+                    if index + 1 < len(chain) and not cancel.is_set():
+                        follow_up = executors[index + 1].submit(_execute, chain[index + 1])
+                        futures[follow_up] = (chain, index + 1)
+                        pending.add(follow_up)
+                if outcome.status == "fail" and failure is None:
+                    return_code = getattr(outcome.result, "returncode", 1)
+                    detail = getattr(outcome.result, "stderr", "") or getattr(
+                        outcome.result, "stdout", ""
+                    )
+                    failure = JobFailed(outcome.job, return_code, detail)
+                    for other in pending:
+                        if other.cancel():
+                            other_chain, other_index = futures[other]
+                            job = other_chain[other_index]
+                            progress.record(job.label, "cancelled", 0.0)
+                            results.append(JobResult(job=job, status="cancelled", duration=0.0))
+            pending = {future for future in pending if not future.cancelled()}
+    finally:
+        for executor in executors:
+            executor.shutdown(wait=True)
+
+    if failure is not None:
+        failure.results = results
+        raise failure
+    return results
+
+
+def _echo(result: object, printer) -> None:
+    stdout = getattr(result, "stdout", "") or ""
+    stderr = getattr(result, "stderr", "") or ""
+    if stdout.strip():
+        printer(stdout.strip())
+    if stderr.strip():
+        printer(stderr.strip())
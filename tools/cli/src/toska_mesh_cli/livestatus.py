@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+import sys
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, TextIO
+
+from .info import (
+    DEPLOYMENT_HEADERS,
+    POD_HEADERS,
+    SERVICE_HEADERS,
+    KubectlError,
+    _kubectl_args,
+    _parse_deployment,
+    _parse_pod,
+    _parse_service,
+    deployment_row,
+    pod_row,
+    service_row,
+)
+from .watch import WatchEvent, WatchSet, watch_command
+
+try:
+    from rich import box
+    from rich.console import Console, Group, RenderableType
+    from rich.live import Live
+    from rich.table import Table
+    from rich.text import Text
+except Exception:  # pragma: no cover - optional dependency
+    Console = None  # type: ignore[assignment,misc]
+    Live = None  # type: ignore[assignment,misc]
+
+
+@dataclass(frozen=True)
+class Section:
+    key: str
+    kind: str
+    title: str
+    headers: list[str]
+    parse: Callable
+    row: Callable
+
+
+SECTIONS = {
+    "deploy": Section(
+        "deployments",
+        "deploy",
+        "Deployments",
+        DEPLOYMENT_HEADERS,
+        _parse_deployment,
+        deployment_row,
+    ),
+    "svc": Section("services", "svc", "Services", SERVICE_HEADERS, _parse_service, service_row),
+    "pods": Section("pods", "pods", "Pods", POD_HEADERS, _parse_pod, pod_row),
+}
+
+
+class StatusIndex:
+    """In-memory view of deployments/services/pods kept current by watch events.
+
+    Records are stored per watch source so a restarted stream (which replays the current state)
+    can replace exactly what it owns. Rendered rows are cached and only rebuilt for changed keys.
+    """
+
+    def __init__(self, kinds: Sequence[str]):
+        self.kinds = list(kinds)
+        self._records: dict[str, dict[tuple[str, str], Any]] = {}
+        self._rows: dict[tuple[str, str, str], list[str]] = {}
+        self._stale: set[str] = set()
+        self.dirty = False
+
+    def restarted(self, source: str) -> None:
+        self._stale.add(source)
+
+    def apply(self, kind: str, source: str, event: WatchEvent) -> str | None:
+        """Apply one watch event; returns a one-line description when something changed."""
+        section = SECTIONS[kind]
+        records = self._records.setdefault(source, {})
+        if source in self._stale:
+            # The stream was restarted and replays current state; drop what it reported before.
+            self._stale.discard(source)
+            for key in records:
+                self._rows.pop((kind, *key), None)
+            records.clear()
+            self.dirty = True
+
+        meta = event.object.get("metadata") or {}
+        key = (meta.get("namespace") or "", meta.get("name") or "")
+        if event.type == "DELETED":
+            if records.pop(key, None) is None:
+                return None
+            self._rows.pop((kind, *key), None)
+            self.dirty = True
+            return f"DELETED {section.kind} {key[0]}/{key[1]}"
+        if event.type not in ("ADDED", "MODIFIED"):
+            return None
+
+        record = section.parse(event.object, key[0])
+        if records.get(key) == record:
+            # Status-only churn (resourceVersion, timestamps) that does not change a column.
+            return None
+        records[key] = record
+        row = section.row(record)
+        self._rows[(kind, *key)] = row
+        self.dirty = True
+        return f"{event.type} {section.kind} {key[0]}/{key[1]}: {' '.join(row[1:])}"
+
+    def records(self, kind: str) -> list[Any]:
+        merged = {}
+        for source, records in self._records.items():
+            if source.split("@", 1)[0] == kind:
+                merged.update(records)
+        return [merged[key] for key in sorted(merged)]
+
+    def rows(self, kind: str, *, show_namespace: bool = False) -> list[list[str]]:
+        keys = sorted(k for k in self._rows if k[0] == kind)
+        if show_namespace:
+            return [[key[1] or "-", *self._rows[key]] for key in keys]
+        return [self._rows[key] for key in keys]
+
+
+def _source(kind: str, namespace: str | None) -> str:
+    return f"{kind}@{namespace or '*'}"
+
+
+def watch_status(
+    *,
+    namespaces: Sequence[str] | None,
+    selector: str | None,
+    kinds: Sequence[str] = ("deploy", "svc", "pods"),
+    kubeconfig: Path | None = None,
+    context: str | None = None,
+    show_namespace: bool = False,
+    restart: bool = True,
+    refresh_interval: float = 0.25,
+    watch_runner=None,
+    stream: TextIO | None = None,
+    clock=time.monotonic,
+) -> StatusIndex:
+    """Show live status from ``kubectl get --watch`` streams until Ctrl+C.
+
+    Each stream starts with kubectl's own initial list and then only carries changes, so the API
+    and CPU cost of a long session is proportional to cluster churn, not to its length. Redraws are
+    coalesced to at most one per ``refresh_interval`` and skipped when nothing changed.
+    ``namespaces=None`` watches all namespaces.
+    """
+    stream = stream or sys.stdout
+    kube_args = _kubectl_args(kubeconfig, context)
+    index = StatusIndex(kinds)
+    commands: dict[str, tuple[str, list[str]]] = {}
+    # ``None`` is one cluster-wide watch per kind.
+    scopes: list[str | None] = list(namespaces) if namespaces else [None]
+    for kind in kinds:
+        for namespace in scopes:
+            cmd = watch_command(
+                kind,
+                kube_args=kube_args,
+                namespace=namespace,
+                selector=selector,
+                all_namespaces=namespace is None,
+            )
+            commands[_source(kind, namespace)] = (kind, cmd)
+
+    console = None
+    if Console is not None and hasattr(stream, "isatty") and stream.isatty():
+        console = Console(file=stream)
+    live = None
+    try:
+        with WatchSet(watch_runner=watch_runner) as watches:
+            for source, (_, cmd) in commands.items():
+                watches.add(source, cmd)
+            if console is not None and Live is not None:
+                live = Live(
+                    render_status(index, show_namespace=show_namespace),
+                    console=console,
+                    auto_refresh=False,
+                )
+                live.start()
+            _event_loop(
+                watches,
+                index,
+                commands,
+                live=live,
+                stream=stream,
+                show_namespace=show_namespace,
+                restart=restart,
+                refresh_interval=refresh_interval,
+                clock=clock,
+            )
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if live is not None:
+            live.stop()
+    return index
+
+
+def _event_loop(
+    watches: WatchSet,
+    index: StatusIndex,
+    commands: dict[str, tuple[str, list[str]]],
+    *,
+    live,
+    stream: TextIO,
+    show_namespace: bool,
+    restart: bool,
+    refresh_interval: float,
+    clock,
+) -> None:
+    open_sources = set(commands)
+    restart_at: dict[str, float] = {}
+    backoff: dict[str, float] = {}
+    last_refresh = float("-inf")
+    while open_sources or restart_at:
+        now = clock()
+        for source, due in list(restart_at.items()):
+            if now >= due:
+                del restart_at[source]
+                index.restarted(source)
+                watches.restart(source, commands[source][1])
+                open_sources.add(source)
+
+        waits = [due - now for due in restart_at.values()]
+        if live is not None and index.dirty:
+            waits.append(last_refresh + refresh_interval - now)
+        timeout = max(min(waits), 0.0) if waits else None
+        event = watches.next(timeout=timeout)
+
+        if event is not None:
+            if event.type == "CLOSED":
+                if watches.failed(event):
+                    raise KubectlError(f"Watching {event.source} failed: {event.error}")
+                open_sources.discard(event.source)
+                if restart:
+                    # The API server ends watches periodically; resume with backoff.
+                    backoff[event.source] = min(backoff.get(event.source, 0.25) * 2, 5.0)
+                    restart_at[event.source] = clock() + backoff[event.source]
+            else:
+                backoff.pop(event.source, None)
+                change = index.apply(commands[event.source][0], event.source, event)
+                if change and live is None:
+                    stream.write(f"{change}\n")
+                    stream.flush()
+
+        if live is not None and index.dirty and clock() - last_refresh >= refresh_interval:
+            live.update(render_status(index, show_namespace=show_namespace), refresh=True)
+            index.dirty = False
+            last_refresh = clock()
+
+    if live is not None and index.dirty:
+        live.update(render_status(index, show_namespace=show_namespace), refresh=True)
+        index.dirty = False
+
+
+def render_status(index: StatusIndex, *, show_namespace: bool = False):
+    tables: list[RenderableType] = []
+    for kind in index.kinds:
+        section = SECTIONS[kind]
+        headers = ["NAMESPACE", *section.headers] if show_namespace else section.headers
+        rows = index.rows(kind, show_namespace=show_namespace)
+        if not rows:
+            tables.append(Text(f"{section.title}: none found"))
+            continue
+        table = Table(
+            title=section.title,
+            title_justify="left",
+            box=box.SIMPLE_HEAVY,
+            show_edge=False,
+            header_style="bold",
+        )
+        for header in headers:
+            table.add_column(header)
+        for row in rows:
+            table.add_row(*row)
+        tables.append(table)
+    return Group(*tables)
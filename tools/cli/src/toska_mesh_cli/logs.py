@@ -0,0 +1,322 @@
+from __future__ import annotations
+
+import heapq
+import re
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from collections.abc import Sequence
+from pathlib import Path
+from typing import TextIO
+
+from .info import KubectlError, _get_items, _kubectl_args, workload_pod_selector
+from .watch import WatchSet, watch_command
+
+# "2024-05-01T10:00:00.123456789Z" as written by ``kubectl logs --timestamps``.
+_TIMESTAMP = re.compile(r"^\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d(?:\.(\d+))?Z$")
+
+
+def sort_key(timestamp: str) -> str:
+    """Make RFC3339Nano timestamps comparable as strings.
+
+    kubectl trims trailing zeros from the fraction (``.5Z`` vs ``.49Z``), so pad it to nine digits.
+    """
+    match = _TIMESTAMP.match(timestamp)
+    if match is None:
+        return ""
+    return f"{timestamp[:19]}.{(match.group(1) or '').ljust(9, '0')}"
+
+
+def _default_log_runner(cmd: list[str]) -> subprocess.Popen:
+    return subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1
+    )
+
+
+class LogStream:
+    """Follows one container with ``kubectl logs -f --timestamps`` into a bounded ring buffer.
+
+    The reader thread never blocks on the consumer: when the buffer is full the oldest line is
+    overwritten and counted in ``dropped``.
+    """
+
+    def __init__(self, label: str, cmd: list[str], *, runner, capacity: int):
+        self.label = label
+        self.buffer: deque[tuple[str, str]] = deque(maxlen=capacity)
+        self.dropped = 0
+        self.closed = False
+        self._lock = threading.Lock()
+        self._last_key = ""
+        self.process = runner(cmd)
+        self._thread = threading.Thread(target=self._read, daemon=True)
+        self._thread.start()
+
+    def _read(self) -> None:
+        try:
+            for raw in self.process.stdout or []:
+                timestamp, _, text = raw.rstrip("\n").partition(" ")
+                key = sort_key(timestamp)
+                if not key:
+                    # kubectl errors and wrapped lines carry no timestamp; keep them in place.
+                    key, text = self._last_key, raw.rstrip("\n")
+                self._last_key = key
+                with self._lock:
+                    if len(self.buffer) == self.buffer.maxlen:
+                        self.dropped += 1
+                    self.buffer.append((key, text))
+        except (OSError, ValueError):
+            pass
+        finally:
+            self.closed = True
+
+    def drain(self) -> tuple[list[tuple[str, str]], int]:
+        with self._lock:
+            lines = list(self.buffer)
+            self.buffer.clear()
+            dropped, self.dropped = self.dropped, 0
+        return lines, dropped
+
+    @property
+    def idle(self) -> bool:
+        return self.closed and not self.buffer
+
+    def stop(self) -> None:
+        try:
+            if self.process.poll() is None:
+                self.process.terminate()
+        except (AttributeError, OSError):
+            pass
+        self.reap()
+
+    def reap(self, timeout: float = 5.0) -> None:
+        """Wait for kubectl to exit so it does not linger as a zombie; kill it if it hangs."""
+        try:
+            self.process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+        except (AttributeError, OSError):
+            pass
+
+
+class LogMerger:
+    """Reorders lines from several streams by timestamp within a short window.
+
+    A line is released once it has waited ``window`` seconds, together with every pending line
+    whose timestamp is not later, so output stays ordered unless a stream lags more than the
+    window. At most ``max_pending`` lines are held; beyond that the oldest are released early.
+    """
+
+    def __init__(self, window: float, *, max_pending: int = 10_000):
+        self.window = window
+        self.max_pending = max_pending
+        self._heap: list[tuple[str, int, str, str]] = []
+        self._arrivals: deque[tuple[float, str]] = deque()
+        self._seq = 0
+
+    def push(self, key: str, label: str, text: str, now: float) -> None:
+        heapq.heappush(self._heap, (key, self._seq, label, text))
+        self._arrivals.append((now, key))
+        self._seq += 1
+
+    def ready(self, now: float) -> list[tuple[str, str, str]]:
+        cutoff = ""
+        while self._arrivals and self._arrivals[0][0] <= now - self.window:
+            cutoff = max(cutoff, self._arrivals.popleft()[1])
+        released = []
+        while self._heap and (self._heap[0][0] <= cutoff or len(self._heap) > self.max_pending):
+            key, _, label, text = heapq.heappop(self._heap)
+            released.append((key, label, text))
+        return released
+
+    def flush(self) -> list[tuple[str, str, str]]:
+        self._arrivals.clear()
+        return [
+            (key, label, text)
+            for key, _, label, text in (heapq.heappop(self._heap) for _ in range(len(self._heap)))
+        ]
+
+
+class _Followers:
+    """Tracks which containers are followed and starts ``kubectl logs`` as they become readable."""
+
+    def __init__(self, kube_args: list[str], *, runner, capacity: int):
+        self.kube_args = kube_args
+        self.runner = runner
+        self.capacity = capacity
+        self.streams: list[LogStream] = []
+        self._started: dict[tuple[str, str, str], int] = {}
+        self._pods: set[tuple[str, str]] = set()
+
+    def sync(self, pod: dict, *, tail: int = -1) -> None:
+        meta = pod.get("metadata") or {}
+        namespace, name = meta.get("namespace") or "", meta.get("name") or ""
+        if (namespace, name) not in self._pods:
+            self._pods.add((namespace, name))
+        else:
+            # Only pods present when the command started show their recent history.
+            tail = -1
+        containers = [c.get("name", "") for c in (pod.get("spec") or {}).get("containers") or []]
+        statuses = {
+            status.get("name"): status
+            for status in (pod.get("status") or {}).get("containerStatuses") or []
+        }
+        for container in containers:
+            status = statuses.get(container) or {}
+            state = status.get("state") or {}
+            if "running" not in state and "terminated" not in state:
+                continue
+            key = (namespace, name, container)
+            restarts = int(status.get("restartCount", 0) or 0)
+            if key in self._started and self._started[key] >= restarts:
+                continue
+            # A restarted container has a fresh log; show all of it.
+            lines = -1 if key in self._started else tail
+            self._started[key] = restarts
+            label = name if len(containers) == 1 else f"{name}/{container}"
+            cmd = ["kubectl", *self.kube_args, "logs", "-f", name, "-c", container]
+            cmd.extend(["-n", namespace, "--timestamps", f"--tail={lines}"])
+            self.streams.append(LogStream(label, cmd, runner=self.runner, capacity=self.capacity))
+
+    def remove(self, pod: dict) -> None:
+        meta = pod.get("metadata") or {}
+        pod_key = (meta.get("namespace") or "", meta.get("name") or "")
+        self._pods.discard(pod_key)
+        for key in [k for k in self._started if k[:2] == pod_key]:
+            del self._started[key]
+        # Streams end on their own once the container is gone; they are dropped after draining.
+
+    @property
+    def idle(self) -> bool:
+        return all(stream.idle for stream in self.streams)
+
+    def stop(self) -> None:
+        for stream in self.streams:
+            stream.stop()
+
+
+def follow_logs(
+    workloads: Sequence[str],
+    *,
+    namespace: str,
+    selector: str | None = None,
+    kubeconfig: Path | None = None,
+    context: str | None = None,
+    tail: int = 10,
+    timestamps: bool = False,
+    buffer_lines: int = 1000,
+    merge_window: float = 0.5,
+    poll_interval: float = 0.1,
+    restart: bool = True,
+    run_cmd=None,
+    watch_runner=None,
+    log_runner=None,
+    stream: TextIO | None = None,
+    errors: TextIO | None = None,
+    clock=time.monotonic,
+) -> int:
+    """Follow the logs of every container of the given workloads' pods until Ctrl+C.
+
+    Pods are resolved from each workload's matchLabels and tracked with a pod watch, so pods
+    created (or containers restarted) while running are followed too. Lines are prefixed with the
+    pod name (``pod/container`` for multi-container pods) and merged by their kubectl timestamp.
+    Each container is read into a ring buffer of ``buffer_lines``; lines that are overwritten
+    before they could be printed are reported on ``errors``. Returns the number of lines written.
+    """
+    stream = stream or sys.stdout
+    errors = errors or sys.stderr
+    kube_args = _kubectl_args(kubeconfig, context)
+    followers = _Followers(
+        kube_args, runner=log_runner or _default_log_runner, capacity=buffer_lines
+    )
+    commands: dict[str, list[str]] = {}
+    for workload in dict.fromkeys(workloads):
+        pod_selector = workload_pod_selector(
+            workload,
+            namespace=namespace,
+            selector=selector,
+            kubeconfig=kubeconfig,
+            context=context,
+            run_cmd=run_cmd,
+        )
+        pods = _get_items(
+            "pods",
+            namespace=namespace,
+            selector=pod_selector,
+            kubeconfig=kubeconfig,
+            context=context,
+            run_cmd=run_cmd,
+        )
+        for pod in pods:
+            followers.sync(pod, tail=tail)
+        commands[f"pods@{workload}"] = watch_command(
+            "pods", kube_args=kube_args, namespace=namespace, selector=pod_selector
+        )
+
+    merger = LogMerger(merge_window)
+    written = 0
+
+    def emit(lines: list[tuple[str, str, str]]) -> None:
+        nonlocal written
+        for key, label, text in lines:
+            prefix = f"{_format_timestamp(key)} " if timestamps and key else ""
+            stream.write(f"{prefix}[{label}] {text}\n")
+        if lines:
+            stream.flush()
+            written += len(lines)
+
+    try:
+        with WatchSet(watch_runner=watch_runner) as watches:
+            for source, cmd in commands.items():
+                watches.add(source, cmd)
+            open_sources = set(commands)
+            restart_at: dict[str, float] = {}
+            while True:
+                now = clock()
+                for source, due in list(restart_at.items()):
+                    if now >= due:
+                        del restart_at[source]
+                        watches.restart(source, commands[source])
+                        open_sources.add(source)
+
+                event = watches.next(timeout=poll_interval)
+                if event is not None:
+                    if event.type == "CLOSED":
+                        if watches.failed(event):
+                            raise KubectlError(f"Watching {event.source} failed: {event.error}")
+                        open_sources.discard(event.source)
+                        if restart:
+                            # The API server ends watches periodically; resume shortly after.
+                            restart_at[event.source] = clock() + 1.0
+                    elif event.type == "DELETED":
+                        followers.remove(event.object)
+                    elif event.type in ("ADDED", "MODIFIED"):
+                        followers.sync(event.object)
+
+                now = clock()
+                for log in list(followers.streams):
+                    idle = log.idle
+                    lines, dropped = log.drain()
+                    for line_key, text in lines:
+                        merger.push(line_key, log.label, text, now)
+                    if dropped:
+                        errors.write(f"[{log.label}] {dropped} line(s) dropped (buffer full)\n")
+                    if idle:
+                        log.reap()
+                        followers.streams.remove(log)
+                emit(merger.ready(now))
+
+                if not open_sources and not restart_at and followers.idle:
+                    break
+    except KeyboardInterrupt:
+        pass
+    finally:
+        followers.stop()
+    emit(merger.flush())
+    return written
+
+
+def _format_timestamp(key: str) -> str:
+    return f"{key[:23]}Z"
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import yaml
+
+from .deploy import DeployConfig, DeployConfigError, Workload
+
+# Apply order: cluster-scoped prerequisites, then config the workloads mount, then the Services
+# they are reached through, then the workloads themselves. Unknown kinds (Ingress, HPA, custom
+# resources, ...) go last, once everything they may reference exists.
+APPLY_LEVELS: list[tuple[str, frozenset[str]]] = [
+    ("namespaces/crds", frozenset({"Namespace", "CustomResourceDefinition"})),
+    (
+        "config/identity",
+        frozenset(
+            {
+                "ConfigMap",
+                "Secret",
+                "ServiceAccount",
+                "Role",
+                "ClusterRole",
+                "RoleBinding",
+                "ClusterRoleBinding",
+                "PersistentVolume",
+                "PersistentVolumeClaim",
+                "StorageClass",
+                "LimitRange",
+                "ResourceQuota",
+                "PriorityClass",
+            }
+        ),
+    ),
+    ("services", frozenset({"Service"})),
+    (
+        "workloads",
+        frozenset(
+            {"Deployment", "StatefulSet", "DaemonSet", "ReplicaSet", "Job", "CronJob", "Pod"}
+        ),
+    ),
+]
+OTHER_LEVEL = "other"
+
+_APPLY_LINE = re.compile(
+    r"^(?P<resource>[\w.\-]+)/(?P<name>\S+) (?P<action>[\w\- ]+?)(?: \(.*\))?$"
+)
+
+
+@dataclass(frozen=True)
+class ManifestResource:
+    kind: str
+    name: str
+    namespace: str | None
+    api_version: str
+    workload: str
+    source: Path
+    body: dict = field(default_factory=dict, compare=False, repr=False)
+
+    @property
+    def ref(self) -> str:
+        return f"{self.kind.lower()}/{self.name}"
+
+    @property
+    def kubectl_ref(self) -> str:
+        """Group-qualified reference for ``kubectl delete``/``wait``, e.g. ``deployment.apps/api``."""
+        group = self.api_version.split("/", 1)[0] if "/" in self.api_version else ""
+        kind = f"{self.kind.lower()}.{group}" if group else self.kind.lower()
+        return f"{kind}/{self.name}"
+
+    def to_yaml(self) -> str:
+        return yaml.safe_dump(self.body, sort_keys=False)
+
+
+@dataclass
+class ApplyLevel:
+    name: str
+    resources: list[ManifestResource]
+
+
+@dataclass
+class ApplyLine:
+    resource: str
+    name: str
+    action: str
+
+    @property
+    def kind(self) -> str:
+        # kubectl prints plural-less, group-qualified types such as "deployment.apps".
+        return self.resource.split(".", 1)[0]
+
+
+def load_manifest_resources(path: Path, *, workload: str) -> list[ManifestResource]:
+    try:
+        documents = list(yaml.safe_load_all(path.read_text()))
+    except yaml.YAMLError as exc:
+        raise DeployConfigError(f"Unable to parse manifest {path}: {exc}") from exc
+
+    resources: list[ManifestResource] = []
+    for document in _flatten(documents):
+        meta = document.get("metadata") or {}
+        resources.append(
+            ManifestResource(
+                kind=str(document.get("kind") or ""),
+                name=str(meta.get("name") or ""),
+                namespace=meta.get("namespace"),
+                api_version=str(document.get("apiVersion") or ""),
+                workload=workload,
+                source=path,
+                body=document,
+            )
+        )
+    return resources
+
+
+def load_config_resources(config: DeployConfig) -> list[ManifestResource]:
+    resources: list[ManifestResource] = []
+    for workload in config.workloads:
+        for manifest in workload.manifests:
+            resources.extend(load_manifest_resources(manifest, workload=workload.name))
+    return resources
+
+
+def _flatten(documents: Iterable[object]) -> Iterable[dict]:
+    for document in documents:
+        if not isinstance(document, dict):
+            continue
+        if str(document.get("kind") or "").endswith("List"):
+            yield from _flatten(document.get("items") or [])
+        else:
+            yield document
+
+
+def concat_manifests(paths: Iterable[Path]) -> str:
+    """Join manifest files into a single multi-document YAML stream."""
+    parts = []
+    for path in paths:
+        text = path.read_text().strip()
+        if text.startswith("---"):
+            text = text[3:].lstrip("\n")
+        if text:
+            parts.append(text)
+    return "\n---\n".join(parts) + "\n"
+
+
+def parse_apply_output(text: str) -> list[ApplyLine]:
+    lines: list[ApplyLine] = []
+    for raw in (text or "").splitlines():
+        match = _APPLY_LINE.match(raw.strip())
+        if match:
+            lines.append(ApplyLine(match["resource"], match["name"], match["action"]))
+    return lines
+
+
+def attribute_apply_output(
+    lines: Iterable[ApplyLine], resources: Iterable[ManifestResource], workloads: Iterable[Workload]
+) -> dict[str, list[ApplyLine]]:
+    """Group kubectl apply result lines by the workload whose manifest declared the resource."""
+    owners = {(r.kind.lower(), r.name): r.workload for r in resources}
+    grouped: dict[str, list[ApplyLine]] = {w.name: [] for w in workloads}
+    for line in lines:
+        owner = owners.get((line.kind.lower(), line.name))
+        grouped.setdefault(owner or "(unattributed)", []).append(line)
+    return grouped
+
+
+def level_of(kind: str) -> str:
+    for name, kinds in APPLY_LEVELS:
+        if kind in kinds:
+            return name
+    return OTHER_LEVEL
+
+
+def plan_apply_levels(resources: Iterable[ManifestResource]) -> list[ApplyLevel]:
+    """Group resources into dependency levels; order within a level follows the manifests."""
+    buckets: dict[str, list[ManifestResource]] = {name: [] for name, _ in APPLY_LEVELS}
+    buckets[OTHER_LEVEL] = []
+    for resource in resources:
+        buckets[level_of(resource.kind)].append(resource)
+    return [ApplyLevel(name, items) for name, items in buckets.items() if items]
+
+
+def format_levels(levels: Iterable[ApplyLevel]) -> str:
+    lines = []
+    for index, level in enumerate(levels, start=1):
+        refs = ", ".join(f"{r.ref} ({r.workload})" for r in level.resources)
+        lines.append(f"{index}. {level.name}: {refs}")
+    return "\n".join(lines)
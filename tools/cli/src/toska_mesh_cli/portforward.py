@@ -0,0 +1,362 @@
+from __future__ import annotations
+
+import os
+import selectors
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TextIO
+
+from .deploy import (
+    PortForwardHandle,
+    _default_port_forward_runner,
+    _ForwardMonitor,
+    stop_port_forwards,
+)
+
+try:
+    from rich.console import Console
+    from rich.live import Live
+    from rich.table import Table
+except Exception:  # pragma: no cover - optional dependency
+    Console = None  # type: ignore[assignment,misc]
+    Live = None  # type: ignore[assignment,misc]
+    Table = None  # type: ignore[assignment,misc]
+
+STATE_STYLES = {
+    "up": "green",
+    "starting": "cyan",
+    "backoff": "yellow",
+    "exited": "red",
+    "stopped": "dim",
+}
+
+
+@dataclass
+class ForwardState:
+    label: str
+    argv: list[str]
+    handle: PortForwardHandle
+    state: str = "starting"
+    restarts: int = 0
+    started_at: float = 0.0
+    backoff: float = 0.0
+    restart_at: float | None = None
+    last_error: str = ""
+    monitor: _ForwardMonitor | None = field(default=None, repr=False)
+    pidfd: int | None = field(default=None, repr=False)
+
+
+class _Wakeup:
+    """Self-pipe the supervisor's selector sleeps on; ``set()`` is safe to call from any thread."""
+
+    def __init__(self) -> None:
+        self.read_fd, self.write_fd = os.pipe()
+        os.set_blocking(self.read_fd, False)
+        os.set_blocking(self.write_fd, False)
+
+    def set(self) -> None:
+        try:
+            os.write(self.write_fd, b"\0")
+        except OSError:
+            # A full pipe already guarantees a wakeup.
+            pass
+
+    def drain(self) -> None:
+        try:
+            while os.read(self.read_fd, 4096):
+                pass
+        except OSError:
+            pass
+
+    def close(self) -> None:
+        os.close(self.read_fd)
+        os.close(self.write_fd)
+
+
+class PortForwardSupervisor:
+    """Keeps port-forwards alive, restarting dead ones with exponential backoff.
+
+    The loop sleeps in a selector on one pidfd per child (a waiter thread per child where pidfds
+    are unavailable) plus a wakeup pipe, so it only runs when a forward exits, becomes ready or a
+    restart is due. With a live table it also wakes once a second to refresh uptimes.
+    """
+
+    def __init__(
+        self,
+        handles: list[PortForwardHandle],
+        *,
+        restart: bool = True,
+        runner=None,
+        backoff_initial: float = 0.5,
+        backoff_max: float = 30.0,
+        stable_after: float = 10.0,
+        stream: TextIO | None = None,
+        clock=time.monotonic,
+    ):
+        self.restart = restart
+        self.runner = runner or _default_port_forward_runner
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+        self.stable_after = stable_after
+        self.stream = stream or sys.stdout
+        self.clock = clock
+        self.console = None
+        if Console is not None and hasattr(self.stream, "isatty") and self.stream.isatty():
+            self.console = Console(file=self.stream)
+        now = clock()
+        self.forwards = [
+            ForwardState(
+                label=handle.label or handle.command,
+                argv=list(handle.argv),
+                handle=handle,
+                state="up",
+                started_at=now,
+                backoff=backoff_initial,
+            )
+            for handle in handles
+        ]
+        self._stopping = False
+        self._wakeup: _Wakeup | None = None
+        self._selector: selectors.BaseSelector | None = None
+
+    def stop(self) -> None:
+        """Ask ``run`` to return; safe to call from another thread or a signal handler."""
+        self._stopping = True
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _running(self) -> tuple[selectors.BaseSelector, _Wakeup]:
+        if self._selector is None or self._wakeup is None:
+            raise RuntimeError("PortForwardSupervisor is not running.")
+        return self._selector, self._wakeup
+
+    def run(self) -> None:
+        if not self.forwards:
+            return
+        self._wakeup = _Wakeup()
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._wakeup.read_fd, selectors.EVENT_READ, None)
+        live = None
+        try:
+            for forward in self.forwards:
+                # Reuse deploy's monitor: its threads already own the output pipes.
+                forward.monitor = forward.handle.monitor
+                self._watch_exit(forward)
+            if self.console and Live is not None:
+                live = Live(self.render(), console=self.console, auto_refresh=False)
+                live.start()
+            else:
+                self._print(format_forward_table(self.forwards, self.clock()))
+            self._loop(live)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._shutdown(live)
+
+    def _loop(self, live) -> None:
+        selector, wakeup = self._running()
+        while not self._stopping:
+            now = self.clock()
+            for forward in self.forwards:
+                if (
+                    forward.state == "backoff"
+                    and forward.restart_at is not None
+                    and now >= forward.restart_at
+                ):
+                    self._spawn(forward)
+            changed = self._reap() + self._promote()
+            if live is not None:
+                live.update(self.render(), refresh=True)
+            elif changed:
+                for forward in changed:
+                    self._print(describe_forward(forward))
+            if not self.restart and all(f.state == "exited" for f in self.forwards):
+                return
+
+            timeout = None
+            due = [
+                f.restart_at - self.clock()
+                for f in self.forwards
+                if f.state == "backoff" and f.restart_at
+            ]
+            if due:
+                timeout = max(min(due), 0.0)
+            if live is not None:
+                timeout = 1.0 if timeout is None else min(timeout, 1.0)
+            for key, _ in selector.select(timeout):
+                if key.data is None:
+                    wakeup.drain()
+
+    def _watch_exit(self, forward: ForwardState) -> None:
+        selector, wakeup = self._running()
+        process = forward.handle.process
+        pid = getattr(process, "pid", None)
+        if isinstance(pid, int) and hasattr(os, "pidfd_open"):
+            try:
+                forward.pidfd = os.pidfd_open(pid)
+            except OSError:
+                forward.pidfd = None
+        if forward.pidfd is not None:
+            selector.register(forward.pidfd, selectors.EVENT_READ, forward)
+            return
+
+        def _wait() -> None:
+            try:
+                process.wait()
+            except Exception:
+                pass
+            wakeup.set()
+
+        threading.Thread(target=_wait, daemon=True).start()
+
+    def _unwatch_exit(self, forward: ForwardState) -> None:
+        if forward.pidfd is not None:
+            selector, _ = self._running()
+            selector.unregister(forward.pidfd)
+            os.close(forward.pidfd)
+            forward.pidfd = None
+
+    def _spawn(self, forward: ForwardState) -> None:
+        forward.restarts += 1
+        forward.restart_at = None
+        forward.started_at = self.clock()
+        try:
+            process = self.runner(forward.argv)
+        except OSError as exc:
+            forward.last_error = str(exc)
+            self._schedule_restart(forward)
+            return
+        _, wakeup = self._running()
+        forward.monitor = _ForwardMonitor(process, wakeup)
+        forward.handle = PortForwardHandle(
+            command=forward.handle.command,
+            process=process,
+            argv=forward.argv,
+            label=forward.label,
+            monitor=forward.monitor,
+        )
+        forward.state = "starting"
+        self._watch_exit(forward)
+
+    def _reap(self) -> list[ForwardState]:
+        changed = []
+        for forward in self.forwards:
+            if forward.state not in ("up", "starting"):
+                continue
+            code = forward.handle.process.poll()
+            if code is None:
+                continue
+            self._unwatch_exit(forward)
+            detail = forward.monitor.detail() if forward.monitor else ""
+            forward.last_error = (detail.splitlines() or [f"exit code {code}"])[-1]
+            self._schedule_restart(forward)
+            changed.append(forward)
+        return changed
+
+    def _promote(self) -> list[ForwardState]:
+        changed = []
+        for forward in self.forwards:
+            monitor = forward.monitor
+            if (
+                forward.state == "starting"
+                and monitor
+                and (monitor.ready_after is not None or not monitor.readable)
+            ):
+                forward.state = "up"
+                changed.append(forward)
+        return changed
+
+    def _schedule_restart(self, forward: ForwardState) -> None:
+        if not self.restart or not forward.argv:
+            forward.state = "exited"
+            return
+        now = self.clock()
+        if now - forward.started_at >= self.stable_after:
+            # The forward was healthy for a while; start the backoff sequence over.
+            forward.backoff = self.backoff_initial
+        else:
+            forward.backoff = min(max(forward.backoff, self.backoff_initial) * 2, self.backoff_max)
+        forward.restart_at = now + forward.backoff
+        forward.state = "backoff"
+
+    def _shutdown(self, live) -> None:
+        selector, wakeup = self._running()
+        for forward in self.forwards:
+            if forward.state in ("up", "starting"):
+                forward.state = "stopped"
+            self._unwatch_exit(forward)
+        stop_port_forwards(forward.handle for forward in self.forwards)
+        if live is not None:
+            live.update(self.render(), refresh=True)
+            live.stop()
+        selector.close()
+        wakeup.close()
+        self._selector = None
+        self._wakeup = None
+
+    def render(self):
+        now = self.clock()
+        table = Table(title="Port-forwards")
+        for column in ("Forward", "State", "Restarts", "Uptime", "Last error"):
+            table.add_column(column)
+        for forward in self.forwards:
+            style = STATE_STYLES.get(forward.state, "white")
+            table.add_row(
+                forward.label,
+                f"[{style}]{_state_text(forward, now)}[/{style}]",
+                str(forward.restarts),
+                _uptime_text(forward, now),
+                forward.last_error,
+            )
+        return table
+
+    def _print(self, text: str) -> None:
+        self.stream.write(f"{text}\n")
+        self.stream.flush()
+
+
+def _state_text(forward: ForwardState, now: float) -> str:
+    if forward.state == "backoff" and forward.restart_at is not None:
+        return f"backoff ({max(forward.restart_at - now, 0.0):.1f}s)"
+    return forward.state
+
+
+def _uptime_text(forward: ForwardState, now: float) -> str:
+    if forward.state != "up":
+        return "-"
+    return format_uptime(now - forward.started_at)
+
+
+def format_uptime(seconds: float) -> str:
+    seconds = int(seconds)
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+    if hours:
+        return f"{hours}h{minutes:02d}m"
+    if minutes:
+        return f"{minutes}m{secs:02d}s"
+    return f"{secs}s"
+
+
+def describe_forward(forward: ForwardState) -> str:
+    line = f"port-forward {forward.label}: {forward.state}"
+    if forward.state == "backoff":
+        line += f", restarting in {forward.backoff:.1f}s"
+    if forward.restarts:
+        line += f" (restarts: {forward.restarts})"
+    if forward.state in ("backoff", "exited") and forward.last_error:
+        line += f" - {forward.last_error}"
+    return line
+
+
+def format_forward_table(forwards: list[ForwardState], now: float) -> str:
+    rows = [("FORWARD", "STATE", "RESTARTS", "UPTIME")]
+    rows.extend(
+        (f.label, _state_text(f, now), str(f.restarts), _uptime_text(f, now)) for f in forwards
+    )
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    return "\n".join(
+        "  ".join(cell.ljust(widths[i]) for i, cell in enumerate(row)).rstrip() for row in rows
+    )
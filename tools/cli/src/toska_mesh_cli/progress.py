@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-import time
 import sys
+import threading
+import time
 from contextlib import AbstractContextManager
 from typing import Optional, TextIO
 
@@ -20,6 +21,7 @@ class ProgressReporter:
         self.stream = stream or sys.stdout
         self.err_stream = err_stream or sys.stderr
         self._steps: list[tuple[str, str, float]] = []
+        self._lock = threading.Lock()
         self.console: Console | None = None
         if Console and hasattr(self.stream, "isatty") and self.stream.isatty():
             self.console = Console(file=self.stream, force_terminal=False)
@@ -27,6 +29,27 @@ class ProgressReporter:
     def step(self, message: str) -> "ProgressStep":
         return ProgressStep(message, reporter=self)
 
+    def record(self, message: str, status: str, duration: float) -> None:
+        """Report a step that ran elsewhere (e.g. on a worker thread) as a single line."""
+        with self._lock:
+            if self.console:
+                style = {"ok": "green", "skipped": "yellow", "fail": "red"}.get(status, "white")
+                self.console.print(f"[{style}]{status}[/] {message} ({duration:.1f}s)")
+            else:
+                target = self.err_stream if status == "fail" else self.stream
+                target.write(f"- {message} ... {status} ({duration:.1f}s)\n")
+                target.flush()
+            self._steps.append((message, status, duration))
+
+    def note(self, message: str) -> None:
+        """Print a detail line under the current step without counting it as a step."""
+        with self._lock:
+            if self.console:
+                self.console.print(f"  [dim]{message}[/dim]")
+            else:
+                self.stream.write(f"  {message}\n")
+                self.stream.flush()
+
     def summarize(self, *, header: str = "Summary") -> None:
         if not self._steps:
             return
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+
+from .info import (
+    RESULT_KEYS,
+    DeploymentInfo,
+    KubectlError,
+    PodInfo,
+    ServiceInfo,
+    _kubectl_args,
+)
+
+# kubectl's "kind/" name prefix (used when several kinds are listed at once) -> short kind.
+_PREFIX_KINDS = {"deployment": "deploy", "service": "svc", "pod": "pods"}
+# Fewest columns (after NAME) each kind prints with ``-o wide``; the last one is the one we read.
+_MIN_COLUMNS = {"pods": 6, "deploy": 7, "svc": 6}
+
+
+class UnexpectedTableError(KubectlError):
+    """kubectl printed a table whose columns do not match the layout this module expects."""
+
+
+def list_projected(
+    kinds: Sequence[str],
+    *,
+    namespace: str | None,
+    selector: str | None = None,
+    kubeconfig: Path | None = None,
+    context: str | None = None,
+    chunk_size: int | None = None,
+    run_cmd=None,
+) -> dict[str, list]:
+    """List kinds through the server-side Table printer (``kubectl get -o wide --no-headers``).
+
+    The API server returns only the printed columns plus object metadata instead of full objects
+    (no managedFields, env, volumes, ...). Columns differ slightly from the full-JSON path: pod
+    STATUS is kubectl's computed reason (e.g. ``CrashLoopBackOff``) rather than the phase, service
+    PORTS use kubectl's ``80/TCP`` form and deployment labels are not available.
+
+    Raises :class:`UnexpectedTableError` when a row is shorter than the expected wide layout, so
+    callers can fall back to the full-JSON listing.
+    """
+    runner = run_cmd or (lambda cmd: subprocess.run(cmd, capture_output=True, text=True))
+    scope = ["-n", namespace] if namespace else ["--all-namespaces"]
+    cmd = ["kubectl", *_kubectl_args(kubeconfig, context), "get", ",".join(kinds), *scope]
+    cmd.extend(["-o", "wide", "--no-headers"])
+    if selector:
+        cmd.extend(["-l", selector])
+    if chunk_size:
+        cmd.append(f"--chunk-size={chunk_size}")
+
+    result = runner(cmd)
+    if getattr(result, "returncode", 1) != 0:
+        raise KubectlError(getattr(result, "stderr", "") or getattr(result, "stdout", ""))
+    return parse_table_output(
+        getattr(result, "stdout", "") or "",
+        kinds=kinds,
+        namespace=namespace,
+    )
+
+
+def parse_table_output(
+    text: str, *, kinds: Sequence[str], namespace: str | None
+) -> dict[str, list]:
+    grouped: dict[str, list] = {RESULT_KEYS[kind]: [] for kind in kinds}
+    for line in text.splitlines():
+        tokens = line.split()
+        if not tokens or tokens[0].startswith("No resources found"):
+            continue
+        row_namespace = namespace or ""
+        if namespace is None:
+            row_namespace, tokens = tokens[0], tokens[1:]
+        kind, name = _split_name(tokens[0], kinds)
+        if kind is None:
+            continue
+        columns = tokens[1:]
+        if kind == "pods":
+            columns = _strip_last_restart(columns)
+        if len(columns) < _MIN_COLUMNS[kind]:
+            raise UnexpectedTableError(f"Unexpected kubectl {kind} table row {line!r}")
+        try:
+            record = _ROW_PARSERS[kind](sys.intern(row_namespace), name, columns)
+        except (IndexError, ValueError) as exc:
+            raise KubectlError(f"Unable to parse kubectl table row {line!r}: {exc}") from exc
+        grouped[RESULT_KEYS[kind]].append(record)
+    return grouped
+
+
+def _split_name(value: str, kinds: Sequence[str]) -> tuple[str | None, str]:
+    if len(kinds) == 1:
+        return kinds[0], value
+    prefix, _, name = value.partition("/")
+    # "deployment.apps/api" -> "deployment"
+    kind = _PREFIX_KINDS.get(prefix.split(".", 1)[0])
+    return (kind, name) if kind in kinds else (None, name)
+
+
+def _strip_last_restart(columns: list[str]) -> list[str]:
+    # Newer kubectl versions print RESTARTS as "3 (5m ago)"; drop the parenthesised suffix.
+    if len(columns) > 3 and columns[3].startswith("("):
+        for index in range(3, len(columns)):
+            if columns[index].endswith(")"):
+                return columns[:3] + columns[index + 1 :]
+    return columns
+
+
+def _pod_row(namespace: str, name: str, columns: list[str]) -> PodInfo:
+    # READY STATUS RESTARTS AGE IP NODE NOMINATED-NODE READINESS-GATES
+    ready, status, restarts = columns[0], columns[1], columns[2]
+    node = columns[5]
+    return PodInfo(
+        name=name,
+        namespace=namespace,
+        ready=sys.intern(ready),
+        status=sys.intern(status),
+        restarts=int(restarts),
+        node=sys.intern("" if node == "<none>" else node),
+    )
+
+
+def _deployment_row(namespace: str, name: str, columns: list[str]) -> DeploymentInfo:
+    # READY UP-TO-DATE AVAILABLE AGE CONTAINERS IMAGES SELECTOR
+    ready = columns[0]
+    desired = int(ready.split("/", 1)[1]) if "/" in ready else 0
+    images = columns[5].split(",") if columns[5] != "<none>" else []
+    # Set-based selectors contain spaces ("env in (a,b)"), so SELECTOR is the rest of the row.
+    selector = " ".join(columns[6:])
+    return DeploymentInfo(
+        name=name,
+        namespace=namespace,
+        ready=ready,
+        available=int(columns[2]),
+        desired=desired,
+        images=images,
+        selector=_parse_labels(selector),
+    )
+
+
+def _service_row(namespace: str, name: str, columns: list[str]) -> ServiceInfo:
+    # TYPE CLUSTER-IP EXTERNAL-IP PORT(S) AGE SELECTOR
+    svc_type, cluster_ip, ports = columns[0], columns[1], columns[3]
+    selector = _parse_labels(" ".join(columns[5:]))
+    return ServiceInfo(
+        name=name,
+        namespace=namespace,
+        svc_type=svc_type,
+        cluster_ip="" if cluster_ip == "<none>" else cluster_ip,
+        ports="" if ports == "<none>" else ports,
+        selector=selector,
+    )
+
+
+def _parse_labels(value: str) -> dict[str, str]:
+    # "app=api,tier=web"; set-based expressions ("env in (a,b)") have no key=value form.
+    labels: dict[str, str] = {}
+    if value != "<none>":
+        for pair in value.split(","):
+            key, sep, val = pair.partition("=")
+            if sep and "(" not in pair and not key.endswith("!"):
+                labels[key] = val
+    return labels
+
+
+_ROW_PARSERS = {"pods": _pod_row, "deploy": _deployment_row, "svc": _service_row}
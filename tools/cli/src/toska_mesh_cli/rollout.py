@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .deploy import DeployConfig, DeployConfigError, _kubectl_args
+from .progress import ProgressReporter
+from .watch import WatchSet, watch_command
+
+ROLLOUT_KINDS = {"Deployment": "deployments", "StatefulSet": "statefulsets"}
+# Pod label that ties a pod to the revision of its workload that created it.
+REVISION_LABELS = {"Deployment": "pod-template-hash", "StatefulSet": "controller-revision-hash"}
+_DEPLOYMENT_REVISION = "deployment.kubernetes.io/revision"
+
+# Waiting reasons that will not resolve without a change to the workload.
+FATAL_WAITING_REASONS = frozenset(
+    {
+        "CrashLoopBackOff",
+        "ImagePullBackOff",
+        "ErrImagePull",
+        "InvalidImageName",
+        "CreateContainerConfigError",
+        "CreateContainerError",
+    }
+)
+
+
+@dataclass
+class RolloutTarget:
+    kind: str
+    name: str
+    workload: str
+    selector: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def ref(self) -> str:
+        return f"{self.kind.lower()}/{self.name}"
+
+
+@dataclass
+class RolloutResult:
+    target: RolloutTarget
+    seconds: float
+
+
+def rollout_targets(config: DeployConfig) -> list[RolloutTarget]:
+    from .manifests import load_config_resources
+
+    targets: list[RolloutTarget] = []
+    for resource in load_config_resources(config):
+        if resource.kind in ROLLOUT_KINDS:
+            spec = resource.body.get("spec") or {}
+            selector = ((spec.get("selector") or {}).get("matchLabels")) or {}
+            targets.append(
+                RolloutTarget(resource.kind, resource.name, resource.workload, dict(selector))
+            )
+    return targets
+
+
+def rollout_complete(obj: dict) -> bool:
+    """Mirror ``kubectl rollout status`` for Deployments and StatefulSets."""
+    meta = obj.get("metadata") or {}
+    spec = obj.get("spec") or {}
+    status = obj.get("status") or {}
+    if (status.get("observedGeneration") or 0) < (meta.get("generation") or 0):
+        return False
+    desired = spec.get("replicas", 1) or 0
+    updated = status.get("updatedReplicas", 0) or 0
+    ready = status.get("readyReplicas", 0) or 0
+    if obj.get("kind") == "StatefulSet":
+        strategy = (spec.get("updateStrategy") or {}).get("type", "RollingUpdate")
+        if strategy == "RollingUpdate" and status.get("updateRevision") != status.get(
+            "currentRevision"
+        ):
+            return updated >= desired and ready >= desired
+        return ready >= desired
+    total = status.get("replicas", 0) or 0
+    available = status.get("availableReplicas", 0) or 0
+    return updated >= desired and total <= updated and available >= desired
+
+
+def rollout_failure(obj: dict) -> str | None:
+    for condition in (obj.get("status") or {}).get("conditions") or []:
+        if (
+            condition.get("type") == "Progressing"
+            and condition.get("reason") == "ProgressDeadlineExceeded"
+        ):
+            return condition.get("message") or "progress deadline exceeded"
+    return None
+
+
+def pod_failure(pod: dict) -> str | None:
+    if (pod.get("metadata") or {}).get("deletionTimestamp"):
+        return None
+    status = pod.get("status") or {}
+    for cs in (status.get("initContainerStatuses") or []) + (status.get("containerStatuses") or []):
+        waiting = (cs.get("state") or {}).get("waiting") or {}
+        reason = waiting.get("reason")
+        if reason in FATAL_WAITING_REASONS:
+            message = waiting.get("message") or ""
+            return f"{cs.get('name', 'container')}: {reason}{f' ({message})' if message else ''}"
+    return None
+
+
+def _matches(selector: dict[str, str], labels: dict[str, str]) -> bool:
+    return bool(selector) and all(labels.get(key) == value for key, value in selector.items())
+
+
+def _observed(obj: dict) -> bool:
+    meta = obj.get("metadata") or {}
+    status = obj.get("status") or {}
+    return (status.get("observedGeneration") or 0) >= (meta.get("generation") or 0)
+
+
+def _owner(obj: dict, kind: str) -> str | None:
+    for ref in (obj.get("metadata") or {}).get("ownerReferences") or []:
+        if ref.get("kind") == kind:
+            return ref.get("name")
+    return None
+
+
+def wait_for_rollouts(
+    targets: list[RolloutTarget],
+    *,
+    namespace: str | None,
+    kubeconfig: Path | None = None,
+    context: str | None = None,
+    timeout: float = 300.0,
+    watch_runner=None,
+    progress: ProgressReporter | None = None,
+    clock=time.monotonic,
+) -> list[RolloutResult]:
+    """Watch every target at once and return when all are rolled out.
+
+    Uses one watch stream per kind plus one for pods (to fail fast on CrashLoopBackOff and image
+    pull errors) rather than polling each workload. Only pods of the new revision can fail a
+    rollout: the new ReplicaSet's ``pod-template-hash`` for Deployments (from a ReplicaSet watch)
+    and ``status.updateRevision`` for StatefulSets.
+    """
+    progress = progress or ProgressReporter()
+    if not targets:
+        return []
+
+    kube_args = _kubectl_args(kubeconfig, context)
+    start = clock()
+    deadline = start + timeout
+    pending: dict[tuple[str, str], RolloutTarget] = {(t.kind, t.name): t for t in targets}
+    results: list[RolloutResult] = []
+    commands = {
+        plural: watch_command(plural, kube_args=kube_args, namespace=namespace)
+        for kind, plural in ROLLOUT_KINDS.items()
+        if any(t.kind == kind for t in targets)
+    }
+    if "deployments" in commands:
+        # The new ReplicaSet's pod-template-hash identifies the pods of the new revision.
+        commands["replicasets"] = watch_command(
+            "replicasets", kube_args=kube_args, namespace=namespace
+        )
+    commands["pods"] = watch_command("pods", kube_args=kube_args, namespace=namespace)
+
+    # Only pods of the revision being rolled out count toward fail-fast: old pods that are
+    # crashlooping are exactly what a fixing redeploy replaces.
+    revisions: dict[tuple[str, str], str] = {}
+    deployment_revisions: dict[str, str] = {}
+    template_hashes: dict[tuple[str, str], str] = {}
+    failing: dict[str, tuple[dict[str, str], str]] = {}
+
+    def check_failures() -> None:
+        for pod_name, (labels, reason) in failing.items():
+            for target in pending.values():
+                revision = revisions.get((target.kind, target.name))
+                if (
+                    revision
+                    and labels.get(REVISION_LABELS[target.kind]) == revision
+                    and _matches(target.selector, labels)
+                ):
+                    raise DeployConfigError(
+                        f"Rollout of {target.ref} (workload '{target.workload}') failed: "
+                        f"pod {pod_name} {reason}"
+                    )
+
+    with WatchSet(watch_runner=watch_runner) as watches:
+        for source, cmd in commands.items():
+            watches.add(source, cmd)
+
+        restart_at: dict[str, float] = {}
+        backoff: dict[str, float] = {}
+        watch_errors: dict[str, str] = {}
+        while pending:
+            now = clock()
+            if now >= deadline:
+                break
+            for source, due in list(restart_at.items()):
+                if now >= due:
+                    del restart_at[source]
+                    watches.restart(source, commands[source])
+            wait = min([deadline - now, *(due - now for due in restart_at.values())])
+            event = watches.next(timeout=max(wait, 0.0))
+            if event is None:
+                continue
+            if event.type == "CLOSED":
+                if watches.failed(event):
+                    raise DeployConfigError(f"Watching {event.source} failed: {event.error}")
+                if event.error:
+                    watch_errors[event.source] = event.error
+                # The API server ends watches periodically; resume with backoff while time is left.
+                backoff[event.source] = min(backoff.get(event.source, 0.25) * 2, 5.0)
+                restart_at[event.source] = clock() + backoff[event.source]
+                continue
+
+            obj = event.object
+            meta = obj.get("metadata") or {}
+            if event.source == "pods":
+                reason = pod_failure(obj) if event.type != "DELETED" else None
+                if reason:
+                    failing[meta.get("name", "")] = (meta.get("labels") or {}, reason)
+                    check_failures()
+                else:
+                    failing.pop(meta.get("name", ""), None)
+                continue
+
+            if event.source == "replicasets":
+                owner = _owner(obj, "Deployment")
+                revision = (meta.get("annotations") or {}).get(_DEPLOYMENT_REVISION)
+                template_hash = (meta.get("labels") or {}).get("pod-template-hash")
+                if owner and revision and template_hash and event.type != "DELETED":
+                    template_hashes[(owner, revision)] = template_hash
+                    if deployment_revisions.get(owner) == revision:
+                        revisions[("Deployment", owner)] = template_hash
+                        check_failures()
+                continue
+
+            key = (obj.get("kind") or _kind_for(event.source), meta.get("name", ""))
+            target = pending.get(key)
+            if target is None:
+                continue
+            selector = ((obj.get("spec") or {}).get("selector") or {}).get("matchLabels")
+            if selector:
+                target.selector = dict(selector)
+            # Until the controller has observed the new spec, its revision still names the old one.
+            if _observed(obj):
+                if target.kind == "StatefulSet":
+                    revision = (obj.get("status") or {}).get("updateRevision")
+                else:
+                    revision = (meta.get("annotations") or {}).get(_DEPLOYMENT_REVISION)
+                    if revision:
+                        deployment_revisions[target.name] = revision
+                        revision = template_hashes.get((target.name, revision))
+                if revision:
+                    revisions[key] = revision
+                    check_failures()
+            failure = rollout_failure(obj)
+            if failure:
+                raise DeployConfigError(
+                    f"Rollout of {target.ref} (workload '{target.workload}') failed: {failure}"
+                )
+            if event.type != "DELETED" and rollout_complete(obj):
+                elapsed = clock() - start
+                del pending[key]
+                results.append(RolloutResult(target=target, seconds=elapsed))
+                progress.record(f"Rollout {target.ref} ({target.workload}) ready", "ok", elapsed)
+
+    if pending:
+        names = ", ".join(f"{t.ref} ({t.workload})" for t in pending.values())
+        message = f"Timed out after {timeout:.0f}s waiting for rollout of: {names}"
+        if watch_errors:
+            errors = "; ".join(f"{source}: {error}" for source, error in watch_errors.items())
+            message += f" (watch errors: {errors})"
+        raise DeployConfigError(message)
+    return results
+
+
+def _kind_for(source: str) -> str:
+    for kind, plural in ROLLOUT_KINDS.items():
+        if plural == source:
+            return kind
+    return ""
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import TextIO
+
+from .info import (
+    KubectlError,
+    PodInfo,
+    _get_items,
+    _kubectl_args,
+    _parse_pod,
+    workload_pod_selector,
+)
+
+PHASES = ("scheduling", "image_pull", "container_start", "readiness", "total")
+PHASE_TITLES = {
+    "scheduling": "SCHEDULING",
+    "image_pull": "IMAGE PULL",
+    "container_start": "CONTAINER START",
+    "readiness": "READINESS",
+    "total": "TOTAL",
+}
+
+
+@dataclass
+class PodStartup:
+    """Where one pod's startup time went, in seconds (None when the data is not available).
+
+    - scheduling: created -> PodScheduled
+    - image_pull: first ``Pulling`` event -> last ``Pulled`` event (0 when images were cached)
+    - container_start: scheduled (or images pulled) -> last container started
+    - readiness: last container started -> Ready
+    - total: created -> Ready
+    """
+
+    pod: PodInfo
+    scheduling: float | None = None
+    image_pull: float | None = None
+    container_start: float | None = None
+    readiness: float | None = None
+    total: float | None = None
+
+
+@dataclass
+class PhaseSummary:
+    phase: str
+    pods: int
+    p50: float | None
+    p95: float | None
+    max: float | None
+
+
+def _time(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def _seconds(start: datetime | None, end: datetime | None) -> float | None:
+    if start is None or end is None:
+        return None
+    return max((end - start).total_seconds(), 0.0)
+
+
+def _condition_time(status: dict, kind: str) -> datetime | None:
+    for condition in status.get("conditions") or []:
+        if condition.get("type") == kind and condition.get("status") == "True":
+            return _time(condition.get("lastTransitionTime"))
+    return None
+
+
+def _event_time(event: dict) -> datetime | None:
+    return _time(
+        event.get("firstTimestamp")
+        or event.get("eventTime")
+        or (event.get("metadata") or {}).get("creationTimestamp")
+    )
+
+
+def parse_pod_startup(item: dict, events: Iterable[dict] = ()) -> PodStartup:
+    """Break down a pod's startup from its conditions, container statuses and Events."""
+    meta = item.get("metadata") or {}
+    status = item.get("status") or {}
+    created = _time(meta.get("creationTimestamp"))
+    scheduled = _condition_time(status, "PodScheduled")
+    ready = _condition_time(status, "Ready")
+
+    started_at: list[datetime] = []
+    for container in status.get("containerStatuses") or []:
+        state = container.get("state") or {}
+        container_started = _time(
+            (state.get("running") or state.get("terminated") or {}).get("startedAt")
+        )
+        if container_started is not None:
+            started_at.append(container_started)
+    # Only complete once every container has started.
+    expected = len((item.get("spec") or {}).get("containers") or []) or len(started_at)
+    started = max(started_at) if started_at and len(started_at) >= expected else None
+
+    # Events of an earlier pod with the same name (StatefulSets) predate this one.
+    timed: list[tuple[str | None, datetime]] = []
+    for event in events:
+        at = _event_time(event)
+        if at is not None and (created is None or at >= created):
+            timed.append((event.get("reason"), at))
+    pulling = [t for reason, t in timed if reason == "Pulling"]
+    pulled = [t for reason, t in timed if reason == "Pulled"]
+    image_pull = None
+    pull_end = None
+    if pulling and pulled:
+        pull_end = max(pulled)
+        image_pull = _seconds(min(pulling), pull_end)
+    elif pulled:
+        # "Container image ... already present on machine": no pull happened.
+        image_pull = 0.0
+
+    return PodStartup(
+        pod=_parse_pod(item, meta.get("namespace")),
+        scheduling=_seconds(created, scheduled),
+        image_pull=image_pull,
+        container_start=_seconds(pull_end or scheduled, started),
+        readiness=_seconds(started, ready),
+        total=_seconds(created, ready),
+    )
+
+
+def percentile(values: Sequence[float], fraction: float) -> float | None:
+    """Linear-interpolated percentile (``fraction`` in 0..1) of ``values``."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize(pods: Sequence[PodStartup]) -> list[PhaseSummary]:
+    summaries = []
+    for phase in PHASES:
+        values = [v for v in (getattr(p, phase) for p in pods) if v is not None]
+        summaries.append(
+            PhaseSummary(
+                phase=phase,
+                pods=len(values),
+                p50=percentile(values, 0.5),
+                p95=percentile(values, 0.95),
+                max=max(values) if values else None,
+            )
+        )
+    return summaries
+
+
+def list_pod_events(
+    *,
+    namespace: str,
+    kubeconfig: Path | None = None,
+    context: str | None = None,
+    run_cmd=None,
+) -> dict[str, list[dict]]:
+    """Pod Events in ``namespace`` grouped by pod name (Events expire after about an hour)."""
+    runner = run_cmd or (lambda cmd: subprocess.run(cmd, capture_output=True, text=True))
+    cmd = ["kubectl", *_kubectl_args(kubeconfig, context), "get", "events", "-n", namespace]
+    cmd.extend(["--field-selector", "involvedObject.kind=Pod", "-o", "json"])
+    result = runner(cmd)
+    if getattr(result, "returncode", 1) != 0:
+        raise KubectlError(getattr(result, "stderr", "") or getattr(result, "stdout", ""))
+    try:
+        payload = json.loads(getattr(result, "stdout", "") or "{}")
+    except json.JSONDecodeError as exc:
+        raise KubectlError(f"Unable to parse kubectl output: {exc}") from exc
+    grouped: dict[str, list[dict]] = {}
+    for event in payload.get("items", []):
+        name = (event.get("involvedObject") or {}).get("name")
+        if name:
+            grouped.setdefault(name, []).append(event)
+    return grouped
+
+
+def startup_report(
+    workloads: Sequence[str],
+    *,
+    namespace: str,
+    selector: str | None = None,
+    kubeconfig: Path | None = None,
+    context: str | None = None,
+    run_cmd=None,
+) -> list[PodStartup]:
+    """Startup breakdown for every pod of the given workloads (Deployments/StatefulSets)."""
+    events = list_pod_events(
+        namespace=namespace, kubeconfig=kubeconfig, context=context, run_cmd=run_cmd
+    )
+    report = []
+    for workload in dict.fromkeys(workloads):
+        pod_selector = workload_pod_selector(
+            workload,
+            namespace=namespace,
+            selector=selector,
+            kubeconfig=kubeconfig,
+            context=context,
+            run_cmd=run_cmd,
+        )
+        pods = _get_items(
+            "pods",
+            namespace=namespace,
+            selector=pod_selector,
+            kubeconfig=kubeconfig,
+            context=context,
+            run_cmd=run_cmd,
+        )
+        for item in pods:
+            name = (item.get("metadata") or {}).get("name", "")
+            report.append(parse_pod_startup(item, events.get(name, [])))
+    return report
+
+
+def format_seconds(value: float | None) -> str:
+    return "-" if value is None else f"{value:.1f}s"
+
+
+def write_startup_report(
+    pods: Sequence[PodStartup], *, stream: TextIO | None = None, rich_output: bool = False
+) -> None:
+    from .info import _write_table
+
+    stream = stream or sys.stdout
+    if not pods:
+        stream.write("Pods: none found\n")
+        return
+    headers = ["POD", "NODE", *(PHASE_TITLES[p] for p in PHASES)]
+    rows = [
+        [p.pod.name, p.pod.node or "-", *(format_seconds(getattr(p, phase)) for phase in PHASES)]
+        for p in pods
+    ]
+    _write_table(headers, rows, stream, rich_output)
+    stream.write("\n")
+    summary = [
+        [PHASE_TITLES[s.phase], str(s.pods), *(format_seconds(v) for v in (s.p50, s.p95, s.max))]
+        for s in summarize(pods)
+    ]
+    _write_table(["PHASE", "PODS", "P50", "P95", "MAX"], summary, stream, rich_output)
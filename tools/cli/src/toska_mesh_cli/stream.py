@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Iterator
+from typing import TextIO
+
+_WHITESPACE = " \t\n\r"
+_DECODER = json.JSONDecoder()
+
+
+class _Buffer:
+    """Sliding text window over a chunked stream; consumed text is dropped as parsing advances."""
+
+    def __init__(self, chunks: Iterator[str]):
+        self._chunks = chunks
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self.eof = True
+            return False
+        # Drop what has been parsed so memory tracks one item, not the whole document.
+        self.text = self.text[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def skip_whitespace(self) -> None:
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text) or not self.fill():
+                return
+
+    def expect(self, *chars: str) -> str:
+        self.skip_whitespace()
+        if self.pos >= len(self.text):
+            raise ValueError(f"Unexpected end of JSON input (expected {' or '.join(chars)})")
+        char = self.text[self.pos]
+        if char not in chars:
+            raise ValueError(f"Expected {' or '.join(chars)} but found {char!r}")
+        self.pos += 1
+        return char
+
+    def peek(self) -> str:
+        self.skip_whitespace()
+        return self.text[self.pos] if self.pos < len(self.text) else ""
+
+    def value(self):
+        self.skip_whitespace()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                # Most likely the value continues in the next chunk; only fail once input
+                # is exhausted.
+                if self.fill():
+                    continue
+                raise
+            if end == len(self.text) and not self.eof and self.text[self.pos] not in '{["':
+                # A bare number/literal might still continue in the next chunk.
+                if self.fill():
+                    continue
+            self.pos = end
+            return value
+
+
+def iter_list_items(chunks: Iterable[str]) -> Iterator[dict]:
+    """Yield the ``items`` of a Kubernetes ``List`` document one at a time.
+
+    Only the item currently being decoded (plus one read chunk) is held in memory; the other
+    top-level fields are parsed and discarded.
+    """
+    buffer = _Buffer(iter(chunks))
+    buffer.skip_whitespace()
+    if buffer.pos >= len(buffer.text):
+        return
+    buffer.expect("{")
+    if buffer.peek() == "}":
+        return
+    while True:
+        key = buffer.value()
+        buffer.expect(":")
+        if key == "items" and buffer.peek() == "[":
+            buffer.expect("[")
+            if buffer.peek() == "]":
+                buffer.expect("]")
+            else:
+                while True:
+                    item = buffer.value()
+                    if isinstance(item, dict):
+                        yield item
+                    if buffer.expect(",", "]") == "]":
+                        break
+        else:
+            buffer.value()
+        if buffer.expect(",", "}") == "}":
+            return
+
+
+def read_chunks(stream: TextIO | None, size: int = 1 << 16) -> Iterator[str]:
+    if stream is None:
+        return
+    while True:
+        chunk = stream.read(size)
+        if not chunk:
+            return
+        yield chunk
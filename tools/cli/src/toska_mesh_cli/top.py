@@ -0,0 +1,319 @@
+from __future__ import annotations
+
+import io
+import json
+import subprocess
+import sys
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TextIO
+
+from .info import DeploymentInfo, KubectlError, _get_items, _kubectl_args, _parse_deployment
+
+try:
+    from rich.console import Console
+    from rich.live import Live
+    from rich.text import Text
+except Exception:  # pragma: no cover - optional dependency
+    Console = None  # type: ignore[assignment,misc]
+    Live = None  # type: ignore[assignment,misc]
+    Text = None  # type: ignore[assignment,misc]
+
+METRICS_API = "/apis/metrics.k8s.io/v1beta1"
+TOP_HEADERS = [
+    "WORKLOAD",
+    "PODS",
+    "CPU",
+    "CPU MAX",
+    "CPU REQ",
+    "CPU LIM",
+    "MEMORY",
+    "MEM MAX",
+    "MEM REQ",
+    "MEM LIM",
+]
+
+_CPU_SUFFIXES = {"n": 1e-6, "u": 1e-3, "m": 1.0, "": 1000.0}
+_MEMORY_SUFFIXES = {
+    "Ki": 1 << 10,
+    "Mi": 1 << 20,
+    "Gi": 1 << 30,
+    "Ti": 1 << 40,
+    "Pi": 1 << 50,
+    "Ei": 1 << 60,
+    "k": 10**3,
+    "M": 10**6,
+    "G": 10**9,
+    "T": 10**12,
+    "P": 10**15,
+    "E": 10**18,
+}
+
+
+@dataclass
+class PodUsage:
+    name: str
+    namespace: str
+    labels: dict[str, str]
+    cpu_millicores: float
+    memory_bytes: int
+
+
+@dataclass
+class Resources:
+    """Per-pod requests/limits summed over the template's containers (None when unset)."""
+
+    cpu_request: float | None = None
+    cpu_limit: float | None = None
+    memory_request: int | None = None
+    memory_limit: int | None = None
+
+
+@dataclass
+class WorkloadUsage:
+    name: str
+    namespace: str
+    pods: int
+    cpu_millicores: float
+    cpu_max: float
+    memory_bytes: int
+    memory_max: int
+    cpu_request: float | None = None
+    cpu_limit: float | None = None
+    memory_request: int | None = None
+    memory_limit: int | None = None
+
+
+def parse_cpu(quantity: str) -> float:
+    """Kubernetes CPU quantity ("250m", "1", "1500000n") in millicores."""
+    quantity = str(quantity).strip()
+    suffix = quantity[-1] if quantity and quantity[-1] in "num" else ""
+    number = quantity[: len(quantity) - len(suffix)]
+    try:
+        return float(number) * _CPU_SUFFIXES[suffix]
+    except ValueError as exc:
+        raise KubectlError(f"Unrecognised CPU quantity {quantity!r}") from exc
+
+
+def parse_memory(quantity: str) -> int:
+    """Kubernetes memory quantity ("128Mi", "1G", "1e6", "512") in bytes."""
+    quantity = str(quantity).strip()
+    for suffix, factor in _MEMORY_SUFFIXES.items():
+        if quantity.endswith(suffix):
+            number, scale = quantity[: -len(suffix)], factor
+            break
+    else:
+        number, scale = quantity, 1
+    try:
+        return int(float(number) * scale)
+    except ValueError as exc:
+        raise KubectlError(f"Unrecognised memory quantity {quantity!r}") from exc
+
+
+def fetch_pod_usage(
+    *,
+    namespace: str | None,
+    kubeconfig: Path | None = None,
+    context: str | None = None,
+    run_cmd=None,
+) -> list[PodUsage]:
+    """Fetch every pod's current usage with one ``kubectl get --raw`` call to metrics.k8s.io."""
+    runner = run_cmd or (lambda cmd: subprocess.run(cmd, capture_output=True, text=True))
+    path = f"{METRICS_API}/namespaces/{namespace}/pods" if namespace else f"{METRICS_API}/pods"
+    cmd = ["kubectl", *_kubectl_args(kubeconfig, context), "get", "--raw", path]
+    result = runner(cmd)
+    if getattr(result, "returncode", 1) != 0:
+        detail = getattr(result, "stderr", "") or getattr(result, "stdout", "")
+        raise KubectlError(f"Pod metrics unavailable (is metrics-server installed?): {detail}")
+    try:
+        payload = json.loads(getattr(result, "stdout", "") or "{}")
+    except json.JSONDecodeError as exc:
+        raise KubectlError(f"Unable to parse pod metrics: {exc}") from exc
+    return [parse_pod_metrics(item) for item in payload.get("items", [])]
+
+
+def parse_pod_metrics(item: dict) -> PodUsage:
+    meta = item.get("metadata") or {}
+    usage = [c.get("usage") or {} for c in item.get("containers") or []]
+    return PodUsage(
+        name=meta.get("name", ""),
+        namespace=meta.get("namespace", ""),
+        labels=meta.get("labels") or {},
+        cpu_millicores=sum(parse_cpu(u.get("cpu", "0")) for u in usage),
+        memory_bytes=sum(parse_memory(u.get("memory", "0")) for u in usage),
+    )
+
+
+def template_resources(item: dict) -> Resources:
+    template = ((item.get("spec") or {}).get("template") or {}).get("spec") or {}
+    containers = template.get("containers") or []
+
+    def total(kind: str, resource: str, parse):
+        values = [((c.get("resources") or {}).get(kind) or {}).get(resource) for c in containers]
+        values = [v for v in values if v is not None]
+        return sum(parse(v) for v in values) if values else None
+
+    return Resources(
+        cpu_request=total("requests", "cpu", parse_cpu),
+        cpu_limit=total("limits", "cpu", parse_cpu),
+        memory_request=total("requests", "memory", parse_memory),
+        memory_limit=total("limits", "memory", parse_memory),
+    )
+
+
+def aggregate_usage(
+    workloads: Iterable[tuple[DeploymentInfo, Resources]], pods: Iterable[PodUsage]
+) -> list[WorkloadUsage]:
+    """Join pod usage to deployments through their label selectors and aggregate per workload.
+
+    A pod is counted for every deployment in its namespace whose selector its labels satisfy;
+    deployments without a selector match nothing.
+    """
+    by_namespace: dict[str, list[PodUsage]] = {}
+    for pod in pods:
+        by_namespace.setdefault(pod.namespace, []).append(pod)
+
+    usages = []
+    for deployment, resources in workloads:
+        selector = deployment.selector.items()
+        matched = [
+            pod
+            for pod in by_namespace.get(deployment.namespace, [])
+            if selector and selector <= pod.labels.items()
+        ]
+        usages.append(
+            WorkloadUsage(
+                name=deployment.name,
+                namespace=deployment.namespace,
+                pods=len(matched),
+                cpu_millicores=sum(p.cpu_millicores for p in matched),
+                cpu_max=max((p.cpu_millicores for p in matched), default=0.0),
+                memory_bytes=sum(p.memory_bytes for p in matched),
+                memory_max=max((p.memory_bytes for p in matched), default=0),
+                cpu_request=resources.cpu_request,
+                cpu_limit=resources.cpu_limit,
+                memory_request=resources.memory_request,
+                memory_limit=resources.memory_limit,
+            )
+        )
+    return usages
+
+
+def gather_top(
+    *,
+    namespace: str | None,
+    selector: str | None,
+    kubeconfig: Path | None = None,
+    context: str | None = None,
+    run_cmd=None,
+) -> list[WorkloadUsage]:
+    """Per-deployment usage: one deployments list plus one metrics call.
+
+    ``selector`` filters the deployments; metrics are fetched for the whole namespace (or all
+    namespaces when ``namespace`` is None) and joined to them locally.
+    """
+    items = _get_items(
+        "deploy",
+        namespace=namespace,
+        selector=selector,
+        kubeconfig=kubeconfig,
+        context=context,
+        run_cmd=run_cmd,
+    )
+    workloads = [(_parse_deployment(item, namespace), template_resources(item)) for item in items]
+    pods = fetch_pod_usage(
+        namespace=namespace, kubeconfig=kubeconfig, context=context, run_cmd=run_cmd
+    )
+    return aggregate_usage(workloads, pods)
+
+
+def format_cpu(millicores: float | None) -> str:
+    return "-" if millicores is None else f"{millicores:.0f}m"
+
+
+def format_memory(value: int | None) -> str:
+    return "-" if value is None else f"{value / (1 << 20):.0f}Mi"
+
+
+def top_row(usage: WorkloadUsage) -> list[str]:
+    return [
+        usage.name,
+        str(usage.pods),
+        format_cpu(usage.cpu_millicores),
+        format_cpu(usage.cpu_max),
+        format_cpu(usage.cpu_request),
+        format_cpu(usage.cpu_limit),
+        format_memory(usage.memory_bytes),
+        format_memory(usage.memory_max),
+        format_memory(usage.memory_request),
+        format_memory(usage.memory_limit),
+    ]
+
+
+def write_top_table(
+    usages: list[WorkloadUsage],
+    *,
+    stream: TextIO | None = None,
+    rich_output: bool = False,
+    show_namespace: bool = False,
+) -> None:
+    from .info import _headers, _with_namespace, _write_table
+
+    stream = stream or sys.stdout
+    if not usages:
+        stream.write("Workloads: none found\n")
+        return
+    rows = [_with_namespace(u, top_row(u), show_namespace) for u in usages]
+    _write_table(_headers(TOP_HEADERS, show_namespace), rows, stream, rich_output)
+
+
+def watch_top(
+    *,
+    namespace: str | None,
+    selector: str | None,
+    interval: float = 5.0,
+    kubeconfig: Path | None = None,
+    context: str | None = None,
+    show_namespace: bool = False,
+    run_cmd=None,
+    stream: TextIO | None = None,
+    sleep=time.sleep,
+    iterations: int | None = None,
+) -> None:
+    """Refresh the usage table every ``interval`` seconds until Ctrl+C (or ``iterations``).
+
+    On a TTY the table is redrawn in place; otherwise each refresh is printed below the last one
+    under a timestamp line.
+    """
+    stream = stream or sys.stdout
+    live = None
+    if Console is not None and Live is not None and hasattr(stream, "isatty") and stream.isatty():
+        live = Live(Text(""), console=Console(file=stream), auto_refresh=False)
+        live.start()
+    count = 0
+    try:
+        while iterations is None or count < iterations:
+            usages = gather_top(
+                namespace=namespace,
+                selector=selector,
+                kubeconfig=kubeconfig,
+                context=context,
+                run_cmd=run_cmd,
+            )
+            if live is not None:
+                buffer = io.StringIO()
+                write_top_table(usages, stream=buffer, show_namespace=show_namespace)
+                live.update(Text(buffer.getvalue().rstrip("\n")), refresh=True)
+            else:
+                stream.write(f"\n{time.strftime('%H:%M:%S')}\n")
+                write_top_table(usages, stream=stream, show_namespace=show_namespace)
+            count += 1
+            if iterations is None or count < iterations:
+                sleep(interval)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if live is not None:
+            live.stop()
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import json
+import queue
+import subprocess
+import tempfile
+import threading
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import IO, Protocol
+
+
+class JsonStreamSplitter:
+    """Incrementally splits a text stream of concatenated JSON objects (pretty or compact).
+
+    ``kubectl get --watch -o json`` writes one pretty-printed object per event with no delimiter,
+    so objects are cut at the point where brace depth returns to zero outside of strings.
+    """
+
+    def __init__(self) -> None:
+        self._buffer: list[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    def feed(self, text: str) -> Iterator[dict]:
+        start = 0
+        for index, char in enumerate(text):
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+            if char == '"':
+                self._in_string = True
+            elif char == "{":
+                if self._depth == 0:
+                    start = index
+                    self._buffer = []
+                self._depth += 1
+            elif char == "}" and self._depth > 0:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._buffer.append(text[start : index + 1])
+                    document = "".join(self._buffer)
+                    self._buffer = []
+                    yield json.loads(document)
+        if self._depth > 0:
+            self._buffer.append(text[start:])
+
+
+def iter_json_objects(lines: Iterable[str]) -> Iterator[dict]:
+    splitter = JsonStreamSplitter()
+    for line in lines:
+        yield from splitter.feed(line)
+
+
+@dataclass
+class WatchEvent:
+    source: str
+    type: str
+    object: dict
+    # kubectl's error output when a ``CLOSED`` stream exited with a failure.
+    error: str = ""
+
+
+class WatchProcess(Protocol):
+    stdout: IO[str] | None
+
+    def poll(self) -> int | None: ...
+
+    def terminate(self) -> None: ...
+
+
+class _WatchProcess:
+    """``kubectl get --watch`` with stderr spooled to a file, so a failed watch can say why
+    without an unread stderr pipe ever stalling it."""
+
+    def __init__(self, cmd: list[str]):
+        self._stderr = tempfile.TemporaryFile()
+        self._process = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=self._stderr, text=True, bufsize=1
+        )
+        self.stdout = self._process.stdout
+
+    def poll(self) -> int | None:
+        return self._process.poll()
+
+    def terminate(self) -> None:
+        self._process.terminate()
+
+    def wait(self, timeout: float | None = None) -> int:
+        return self._process.wait(timeout=timeout)
+
+    def error_output(self) -> str:
+        self._stderr.seek(0)
+        return self._stderr.read().decode(errors="replace").strip()
+
+
+def _default_watch_runner(cmd: list[str]) -> WatchProcess:
+    return _WatchProcess(cmd)
+
+
+def _exit_error(process: WatchProcess) -> str:
+    """kubectl's error output if the watch exited with a failure, else an empty string."""
+    wait = getattr(process, "wait", None)
+    if wait is None:
+        return ""
+    try:
+        code = wait(timeout=5.0)
+    except (OSError, subprocess.TimeoutExpired):
+        return ""
+    # Negative codes are the signal sent by ``WatchSet`` itself when restarting or closing.
+    if not code or code < 0:
+        return ""
+    error_output = getattr(process, "error_output", None)
+    return (error_output() if error_output else "") or f"kubectl exited with {code}"
+
+
+class WatchSet:
+    """Multiplexes several ``kubectl get --watch --output-watch-events -o json`` streams.
+
+    One reader thread per stream feeds a shared queue, so the consumer blocks until an event
+    arrives instead of polling. An empty object with type ``CLOSED`` marks the end of a stream;
+    its ``error`` carries kubectl's message when the watch failed (RBAC denial, bad context,
+    unknown resource). :meth:`failed` tells a consumer when a source has failed ``max_failures``
+    times in a row, so it can report the error instead of restarting until its timeout.
+    """
+
+    def __init__(self, *, watch_runner=None, max_failures: int = 3):
+        self._runner = watch_runner or _default_watch_runner
+        self.max_failures = max_failures
+        self._events: queue.Queue[WatchEvent] = queue.Queue()
+        self._processes: dict[str, WatchProcess] = {}
+        self._failures: dict[str, int] = {}
+        self._threads: list[threading.Thread] = []
+
+    def add(self, source: str, cmd: list[str]) -> None:
+        process = self._runner(cmd)
+        self._processes[source] = process
+        thread = threading.Thread(target=self._read, args=(source, process), daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+    def _read(self, source: str, process: WatchProcess) -> None:
+        stream: Iterable[str] | None = process.stdout
+        try:
+            for obj in iter_json_objects(stream or []):
+                # --output-watch-events wraps objects as {"type": ..., "object": {...}}.
+                if "object" in obj and "type" in obj:
+                    self._events.put(WatchEvent(source, obj["type"], obj["object"] or {}))
+                else:
+                    self._events.put(WatchEvent(source, "ADDED", obj))
+        except (ValueError, OSError):
+            pass
+        finally:
+            self._events.put(WatchEvent(source, "CLOSED", {}, _exit_error(process)))
+
+    def next(self, timeout: float | None) -> WatchEvent | None:
+        try:
+            event = self._events.get(timeout=timeout)
+        except queue.Empty:
+            return None
+        if event.error:
+            self._failures[event.source] = self._failures.get(event.source, 0) + 1
+        else:
+            self._failures.pop(event.source, None)
+        return event
+
+    def failed(self, event: WatchEvent) -> bool:
+        """Whether ``event`` closes the ``max_failures``-th failed stream of its source in a row."""
+        return bool(event.error) and self._failures.get(event.source, 0) >= self.max_failures
+
+    def restart(self, source: str, cmd: list[str]) -> None:
+        self._stop(source)
+        self.add(source, cmd)
+
+    def _stop(self, source: str) -> None:
+        process = self._processes.pop(source, None)
+        if process is None:
+            return
+        try:
+            if process.poll() is None:
+                process.terminate()
+        except (AttributeError, OSError):
+            pass
+
+    def close(self) -> None:
+        for source in list(self._processes):
+            self._stop(source)
+
+    def __enter__(self) -> WatchSet:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def watch_command(
+    kind: str,
+    *,
+    kube_args: list[str],
+    namespace: str | None = None,
+    selector: str | None = None,
+    all_namespaces: bool = False,
+) -> list[str]:
+    cmd = ["kubectl", *kube_args, "get", kind, "--watch", "--output-watch-events", "-o", "json"]
+    if all_namespaces:
+        cmd.append("--all-namespaces")
+    elif namespace:
+        cmd.extend(["-n", namespace])
+    if selector:
+        cmd.extend(["-l", selector])
+    return cmd
@@ -95,3 +95,173 @@ def test_cli_kubeconfig_delegates_to_helper(monkeypatch, tmp_path):
     assert called["discover_port"] == 50000
     assert called["discover_timeout"] == 0.5
     assert called["max_hosts"] == 32
+    assert called["rank"] is True
+
+
+def test_kubeconfig_prints_endpoint_latency(monkeypatch, tmp_path, capsys):
+    from toska_mesh_cli.cluster import EndpointLatency, KubeconfigResult
+
+    called = {}
+    monkeypatch.setattr("toska_mesh_cli.cli._require_commands", lambda commands, action: None)
+
+    def fake_kubeconfig(**kwargs):
+        called.update(kwargs)
+        return KubeconfigResult(
+            path="generated",
+            endpoints=["10.0.0.2"],
+            nodes=["10.0.0.2"],
+            latencies=[
+                EndpointLatency("10.0.0.2", connect=0.0012, tls=0.0045),
+                EndpointLatency("10.0.0.9", connect=0.080, dropped=True),
+                EndpointLatency("10.0.0.3", error="timed out", dropped=True),
+            ],
+        )
+
+    monkeypatch.setattr("toska_mesh_cli.cluster.talos_kubeconfig", fake_kubeconfig)
+
+    args = ["kubeconfig", "--out", str(tmp_path / "kubeconfig"), "--max-latency", "50"]
+    assert main([*args, "--rank-tls"]) == 0
+
+    assert called["max_latency"] == 0.05
+    assert called["rank_tls"] is True
+    lines = capsys.readouterr().out.splitlines()
+    start = lines.index("Endpoints: 10.0.0.2") + 1
+    assert lines[start : start + 3] == [
+        "  10.0.0.2: connect 1.2 ms, TLS 4.5 ms",
+        "  10.0.0.9: connect 80.0 ms (dropped)",
+        "  10.0.0.3: unreachable (timed out)",
+    ]
+
+    assert main([*args, "--no-rank"]) == 0
+    assert called["rank"] is False
+
+
+def test_cache_show_and_clear(monkeypatch, tmp_path, capsys):
+    from toska_mesh_cli.cache import ApplyStateStore
+
+    monkeypatch.setenv("TOSKA_CACHE_DIR", str(tmp_path))
+    store = ApplyStateStore()
+    store.record("dev", "https://dev:6443", "toskamesh", tmp_path / "service.yaml", "abc123")
+    store.record("prod", "https://prod:6443", "toskamesh", tmp_path / "service.yaml", "def456")
+
+    assert main(["cache", "show"]) == 0
+    assert "service.yaml" in capsys.readouterr().out
+
+    assert main(["cache", "clear", "--context", "dev"]) == 0
+    assert [e.context for e in ApplyStateStore().entries()] == ["prod"]
+
+
+def test_cache_show_and_clear_discovery(monkeypatch, tmp_path, capsys):
+    from toska_mesh_cli.cache import ApplyStateStore
+    from toska_mesh_cli.cluster import DiscoveryCache
+
+    monkeypatch.setenv("TOSKA_CACHE_DIR", str(tmp_path))
+    ApplyStateStore().record(
+        "dev", "https://dev:6443", "toskamesh", tmp_path / "service.yaml", "abc123"
+    )
+    DiscoveryCache().record(["10.0.0.0/24"], 50000, ["10.0.0.5"])
+
+    assert main(["cache", "show"]) == 0
+    assert "- 10.0.0.0/24 port 50000: 10.0.0.5" in capsys.readouterr().out
+
+    assert main(["cache", "clear", "--discovery"]) == 0
+    assert DiscoveryCache().entries() == []
+    assert len(ApplyStateStore().entries()) == 1
+
+
+def test_status_ndjson_writes_one_line_per_resource(monkeypatch, capsys):
+    import json
+
+    from toska_mesh_cli.info import DeploymentInfo, PodInfo
+
+    calls = []
+
+    def fake_iter_resources(kinds, **kwargs):
+        calls.append((list(kinds), kwargs["namespace"], kwargs["chunk_size"]))
+        yield "deploy", DeploymentInfo("api", kwargs["namespace"], "1/1", 1, 1, ["api:1"])
+        yield "pods", PodInfo("api-1", kwargs["namespace"], "1/1", "Running", 0, "node-a")
+
+    monkeypatch.setattr("toska_mesh_cli.cli._require_commands", lambda commands, action: None)
+    monkeypatch.setattr("toska_mesh_cli.info.iter_resources", fake_iter_resources)
+
+    exit_code = main(["status", "-n", "a", "-n", "b", "-o", "ndjson"])
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+    assert exit_code == 0
+    assert sorted(c[1] for c in calls) == ["a", "b"]
+    assert calls[0][0] == ["deploy", "svc", "pods"]
+    assert calls[0][2] == 500
+    for namespace in ("a", "b"):
+        assert [(r["kind"], r["name"]) for r in lines if r["namespace"] == namespace] == [
+            ("Deployment", "api"),
+            ("Pod", "api-1"),
+        ]
+
+
+def test_status_ndjson_lists_namespaces_concurrently(monkeypatch, capsys):
+    import threading
+
+    from toska_mesh_cli.info import PodInfo
+
+    started = threading.Barrier(2, timeout=5)
+
+    def fake_iter_resources(kinds, **kwargs):
+        # Both namespaces must be in flight at once for the barrier to release.
+        started.wait()
+        yield "pods", PodInfo("api-1", kwargs["namespace"], "1/1", "Running", 0, "node-a")
+
+    monkeypatch.setattr("toska_mesh_cli.cli._require_commands", lambda commands, action: None)
+    monkeypatch.setattr("toska_mesh_cli.info.iter_resources", fake_iter_resources)
+
+    assert main(["status", "-n", "a", "-n", "b", "--max-parallel", "2", "-o", "ndjson"]) == 0
+    assert len(capsys.readouterr().out.splitlines()) == 2
+
+
+def test_status_ndjson_exits_cleanly_on_broken_pipe(monkeypatch, tmp_path):
+    import os
+
+    from toska_mesh_cli.info import PodInfo
+
+    def fake_iter_resources(kinds, **kwargs):
+        for index in range(100):
+            yield "pods", PodInfo(f"api-{index}", kwargs["namespace"], "1/1", "Running", 0, "")
+
+    class ClosedPipe:
+        def __init__(self, path):
+            self.fd = os.open(path, os.O_WRONLY | os.O_CREAT)
+
+        def write(self, text):
+            raise BrokenPipeError(32, "Broken pipe")
+
+        def flush(self):
+            pass
+
+        def fileno(self):
+            return self.fd
+
+    stdout = ClosedPipe(tmp_path / "stdout")
+    monkeypatch.setattr("toska_mesh_cli.cli._require_commands", lambda commands, action: None)
+    monkeypatch.setattr("toska_mesh_cli.info.iter_resources", fake_iter_resources)
+    monkeypatch.setattr("sys.stdout", stdout)
+
+    try:
+        assert main(["status", "-o", "ndjson"]) == 0
+    finally:
+        os.close(stdout.fd)
+
+
+def test_status_watch_rejects_structured_output(monkeypatch, capsys):
+    monkeypatch.setattr("toska_mesh_cli.cli._require_commands", lambda commands, action: None)
+
+    assert main(["status", "--watch", "-o", "ndjson"]) == 2
+    assert "--watch" in capsys.readouterr().err
+
+
+def test_logs_rejects_empty_buffer(capsys):
+    import pytest
+
+    with pytest.raises(SystemExit) as excinfo:
+        build_parser().parse_args(["logs", "api", "--buffer-lines", "0"])
+
+    assert excinfo.value.code == 2
+    assert "--buffer-lines: must be at least 1" in capsys.readouterr().err
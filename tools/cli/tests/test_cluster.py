@@ -120,3 +120,414 @@ def test_resolve_talosconfig_path_searches_parents(tmp_path):
 
     resolved = _resolve_talosconfig_path(Path("clusterconfig") / "talosconfig", base_dir=nested_dir)
     assert resolved == talos_file.resolve()
+
+
+@pytest.fixture
+def talos_listener():
+    import socket
+
+    server = socket.socket()
+    try:
+        server.bind(("127.0.0.2", 0))
+    except OSError:
+        server.close()
+        pytest.skip("127.0.0.2 is not routable to loopback on this platform")
+    server.listen(128)
+    yield server.getsockname()[1]
+    server.close()
+
+
+@pytest.fixture
+def counted_sockets(monkeypatch):
+    """Every socket the scanner opens, so tests can count them and check they were closed."""
+    import socket
+
+    from toska_mesh_cli import cluster
+
+    opened = []
+
+    class CountingSocket(socket.socket):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            opened.append(self)
+
+    monkeypatch.setattr(cluster.socket, "socket", CountingSocket)
+    return opened
+
+
+def test_nonblocking_scan_finds_local_listener(talos_listener):
+    from toska_mesh_cli.cluster import discover_talos_endpoints
+
+    streamed: list[str] = []
+    result = discover_talos_endpoints(
+        ["127.0.0.0/24"],
+        port=talos_listener,
+        max_hosts=256,
+        engine="nonblocking",
+        max_in_flight=16,
+        on_found=streamed.append,
+    )
+
+    assert result == ["127.0.0.2"]
+    assert streamed == ["127.0.0.2"]
+
+
+def test_nonblocking_scan_respects_rate_and_in_flight_limits(talos_listener, counted_sockets):
+    import time
+
+    from toska_mesh_cli import cluster
+
+    hosts = [f"127.0.1.{i}" for i in range(1, 41)] + ["127.0.0.2"]
+
+    start = time.monotonic()
+    result = cluster._scan_nonblocking(
+        hosts, port=talos_listener, timeout=0.5, max_in_flight=4, rate=200
+    )
+
+    assert result == ["127.0.0.2"]
+    assert len(counted_sockets) == len(hosts)
+    # 41 connects paced at 200/s take about 0.2s.
+    assert time.monotonic() - start >= 0.15
+    assert all(sock.fileno() == -1 for sock in counted_sockets)
+
+
+def test_nonblocking_scan_counts_unopenable_sockets_as_unreachable(talos_listener, monkeypatch):
+    import errno
+
+    from toska_mesh_cli import cluster
+
+    real_socket = cluster.socket.socket
+
+    def v4_only(family=cluster.socket.AF_INET, *args, **kwargs):
+        if family == cluster.socket.AF_INET6:
+            raise OSError(errno.EAFNOSUPPORT, "Address family not supported by protocol")
+        return real_socket(family, *args, **kwargs)
+
+    monkeypatch.setattr(cluster.socket, "socket", v4_only)
+
+    result = cluster._scan_nonblocking(
+        ["fd00::1", "127.0.0.2"], port=talos_listener, timeout=0.5, max_in_flight=4, rate=0
+    )
+
+    assert result == ["127.0.0.2"]
+
+
+def test_fd_budget_leaves_headroom():
+    import resource
+
+    from toska_mesh_cli.cluster import _FD_RESERVE, _fd_budget
+
+    assert _fd_budget(8) == 8
+    soft, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft != resource.RLIM_INFINITY:
+        assert _fd_budget(10**9) <= soft - _FD_RESERVE
+
+
+def test_discover_rejects_unknown_engine():
+    from toska_mesh_cli.cluster import discover_talos_endpoints
+
+    with pytest.raises(KubeconfigError, match="engine"):
+        discover_talos_endpoints(["10.0.0.0/30"], engine="magic")
+
+
+def test_iter_hosts_merges_overlaps_lazily():
+    import ipaddress
+    import types
+
+    from toska_mesh_cli.cluster import _iter_hosts
+
+    cidrs = ["10.0.1.0/30", "10.0.0.0/24", "10.0.0.128/25", "10.0.0.4/31"]
+    hosts = list(_iter_hosts(cidrs, max_hosts=10_000))
+    expected = {str(h) for cidr in cidrs for h in ipaddress.ip_network(cidr).hosts()}
+
+    assert len(hosts) == len(set(hosts)) == len(expected)
+    assert set(hosts) == expected
+    # CIDR order is kept across merged ranges.
+    assert hosts[:2] == ["10.0.1.1", "10.0.1.2"]
+
+    huge = _iter_hosts(["10.0.0.0/8"], max_hosts=3)
+    assert isinstance(huge, types.GeneratorType)
+    assert list(huge) == ["10.0.0.1", "10.0.0.2", "10.0.0.3"]
+
+
+def test_iter_hosts_ipv6_limits():
+    from toska_mesh_cli.cluster import _iter_hosts
+
+    assert list(_iter_hosts(["fd00::/126", "fd00::/127"], max_hosts=10)) == [
+        "fd00::",
+        "fd00::1",
+        "fd00::2",
+        "fd00::3",
+    ]
+    assert len(list(_iter_hosts(["fd00::/112"], max_hosts=100))) == 100
+    with pytest.raises(KubeconfigError, match="too large"):
+        _iter_hosts(["fd00::/64"], max_hosts=10)
+
+
+def test_iter_hosts_probes_likely_hosts_first():
+    from toska_mesh_cli.cluster import _iter_hosts
+
+    likely = ["10.0.0.9", "192.168.1.1", "talos.local", "10.0.0.9", "10.0.0.2"]
+    hosts = list(_iter_hosts(["10.0.0.0/28"], max_hosts=5, likely=likely))
+
+    assert hosts == ["10.0.0.9", "10.0.0.2", "10.0.0.1", "10.0.0.3", "10.0.0.4"]
+    assert len(list(_iter_hosts(["10.0.0.0/28"], max_hosts=100, likely=likely))) == 14
+
+
+def test_likely_talos_hosts_reads_kubeconfig_talosconfig_and_arp(tmp_path):
+    from toska_mesh_cli import cluster
+
+    talosconfig = tmp_path / "talosconfig"
+    talosconfig.write_text(
+        "context: home\n"
+        "contexts:\n"
+        "  old:\n    endpoints: ['10.0.0.7:50000']\n    nodes: ['[fd00::7]:50000']\n"
+        "  home:\n    endpoints: ['10.0.0.5']\n    nodes: ['10.0.0.6']\n"
+    )
+    kubeconfig = tmp_path / "config"
+    kubeconfig.write_text(
+        "clusters:\n- cluster:\n    server: https://10.0.0.4:6443\n  name: home\n"
+    )
+    arp = tmp_path / "arp"
+    arp.write_text(
+        "IP address       HW type     Flags       HW address            Mask     Device\n"
+        "10.0.0.8         0x1         0x2         52:54:00:12:34:56     *        eth0\n"
+        "10.0.0.9         0x1         0x0         00:00:00:00:00:00     *        eth0\n"
+        "10.0.0.5         0x1         0x2         52:54:00:12:34:57     *        eth0\n"
+    )
+
+    hosts = cluster.likely_talos_hosts(
+        talosconfig=talosconfig, kubeconfig=kubeconfig, arp_table=arp
+    )
+
+    assert hosts == ["10.0.0.4", "10.0.0.5", "10.0.0.6", "10.0.0.7", "fd00::7", "10.0.0.8"]
+    missing = cluster.likely_talos_hosts(kubeconfig=tmp_path / "missing", arp_table=arp)
+    assert missing == ["10.0.0.8", "10.0.0.5"]
+
+
+def test_nonblocking_scan_stops_after_requested_endpoints(talos_listener, counted_sockets):
+    from toska_mesh_cli import cluster
+
+    hosts = ["127.0.0.2"] + [f"127.0.1.{i}" for i in range(1, 201)]
+
+    result = cluster._scan_nonblocking(
+        hosts, port=talos_listener, timeout=0.5, max_in_flight=8, rate=100, stop_after=1
+    )
+
+    assert result == ["127.0.0.2"]
+    # A full sweep at 100/s would open all 201 sockets over two seconds.
+    assert len(counted_sockets) < 10
+    assert all(sock.fileno() == -1 for sock in counted_sockets)
+
+
+def test_talos_kubeconfig_discovers_likely_host_first(tmp_path, talos_listener):
+    talosconfig = tmp_path / "talosconfig"
+    talosconfig.write_text("context: home\ncontexts:\n  home:\n    nodes: ['127.0.0.2']\n")
+    commands: list[list[str]] = []
+
+    result = talos_kubeconfig(
+        talosconfig=talosconfig,
+        endpoints=None,
+        nodes=None,
+        out=tmp_path / "kubeconfig",
+        discover_cidrs=["127.0.0.0/24"],
+        discover_port=talos_listener,
+        # The sweep alone would only reach 127.0.0.1.
+        max_hosts=1,
+        discover_engine="nonblocking",
+        discover_count=1,
+        run_cmd=_fake_talosctl(commands),
+    )
+
+    assert result.endpoints == ["127.0.0.2"]
+    assert commands[0][4] == "127.0.0.2"
+    report = result.discovery
+    assert report is not None
+    assert report.likely_hosts == 1
+    assert report.first_found_after is not None
+    assert report.first_found_after <= report.elapsed
+
+
+def _fake_talosctl(commands):
+    def run(cmd):
+        commands.append(cmd)
+        return type("R", (), {"returncode": 0})()
+
+    return run
+
+
+def _cached_kubeconfig(tmp_path, cache, port, **kwargs):
+    talosconfig = tmp_path / "talosconfig"
+    talosconfig.write_text("context: home\ncontexts:\n  home: {}\n")
+    options = dict(
+        talosconfig=talosconfig,
+        endpoints=None,
+        nodes=None,
+        out=tmp_path / "kubeconfig",
+        discover_cidrs=["127.0.0.0/29"],
+        discover_port=port,
+        discover_engine="nonblocking",
+        discover_likely=False,
+        discover_cache=cache,
+        run_cmd=_fake_talosctl([]),
+    )
+    options.update(kwargs)
+    return talos_kubeconfig(**options)
+
+
+def test_discovery_cache_hit_is_revalidated_without_scanning(tmp_path, talos_listener, monkeypatch):
+    from toska_mesh_cli import cluster
+
+    cache = cluster.DiscoveryCache(tmp_path / "discovery.json")
+    cache.record(["127.0.0.0/29"], talos_listener, ["127.0.0.3", "127.0.0.2"], discovered_at=1e10)
+
+    def no_scan(*args, **kwargs):
+        raise AssertionError("cache hit should not scan")
+
+    monkeypatch.setattr(cluster, "discover_talos_endpoints", no_scan)
+    # Equivalent CIDR spellings share the entry.
+    result = _cached_kubeconfig(
+        tmp_path, cache, talos_listener, discover_cidrs=["127.0.0.5/29"]
+    )
+
+    assert result.endpoints == ["127.0.0.2"]
+    assert result.discovery.source == "cache"
+    # The endpoint that stopped answering is dropped; the scan time is kept for the TTL.
+    record = cluster.DiscoveryCache(tmp_path / "discovery.json").lookup(
+        ["127.0.0.0/29"], talos_listener
+    )
+    assert record is not None
+    assert record.endpoints == ["127.0.0.2"]
+    assert record.discovered_at == 1e10
+
+
+def test_discovery_cache_rescans_when_stale_gone_or_refreshed(tmp_path, talos_listener):
+    import time
+
+    from toska_mesh_cli.cluster import DiscoveryCache
+
+    cache = DiscoveryCache(tmp_path / "discovery.json")
+    cache.record(["127.0.0.0/29"], talos_listener, ["127.0.0.4"])
+
+    result = _cached_kubeconfig(tmp_path, cache, talos_listener)
+    assert (result.discovery.source, result.endpoints) == ("scan", ["127.0.0.2"])
+    record = cache.lookup(["127.0.0.0/29"], talos_listener)
+    assert record is not None and record.endpoints == ["127.0.0.2"]
+
+    assert _cached_kubeconfig(tmp_path, cache, talos_listener).discovery.source == "cache"
+    refreshed = _cached_kubeconfig(tmp_path, cache, talos_listener, discover_refresh=True)
+    assert refreshed.discovery.source == "scan"
+
+    cache.record(["127.0.0.0/29"], talos_listener, ["127.0.0.2"], discovered_at=time.time() - 60)
+    expired = _cached_kubeconfig(tmp_path, cache, talos_listener, discover_cache_ttl=30)
+    assert expired.discovery.source == "scan"
+    # The expired endpoint is still probed first.
+    assert expired.discovery.likely_hosts == 1
+
+
+def test_discovery_cache_only_answers_requests_its_scan_covered(tmp_path, talos_listener):
+    import socket
+
+    from toska_mesh_cli.cluster import DiscoveryCache
+
+    second = socket.socket()
+    try:
+        second.bind(("127.0.0.3", talos_listener))
+    except OSError:
+        second.close()
+        pytest.skip("127.0.0.3 is not routable to loopback on this platform")
+    second.listen(128)
+    cache = DiscoveryCache(tmp_path / "discovery.json")
+    try:
+        # What a scan stopped after the first answer leaves behind.
+        cache.record(["127.0.0.0/29"], talos_listener, ["127.0.0.2"], stop_after=1)
+        assert _cached_kubeconfig(
+            tmp_path, cache, talos_listener, discover_count=1
+        ).discovery.source == "cache"
+
+        # The early-stopped scan saw one of the two listeners; a full request must scan.
+        full = _cached_kubeconfig(tmp_path, cache, talos_listener)
+        assert full.discovery.source == "scan"
+        assert sorted(full.endpoints) == ["127.0.0.2", "127.0.0.3"]
+        assert _cached_kubeconfig(tmp_path, cache, talos_listener).discovery.source == "cache"
+        # A wider sweep than the cached one scans again.
+        wider = _cached_kubeconfig(tmp_path, cache, talos_listener, max_hosts=512)
+        assert wider.discovery.source == "scan"
+    finally:
+        second.close()
+
+    # Fewer cached endpoints still answer than were asked for.
+    cache.record(["127.0.0.0/29"], talos_listener, ["127.0.0.2", "127.0.0.3"])
+    short = _cached_kubeconfig(tmp_path, cache, talos_listener, discover_count=2)
+    assert (short.discovery.source, short.endpoints) == ("scan", ["127.0.0.2"])
+
+
+def test_measure_endpoint_latency(talos_listener):
+    from toska_mesh_cli.cluster import measure_endpoint_latency
+
+    ok, explicit_port, refused = measure_endpoint_latency(
+        ["127.0.0.2", f"127.0.0.2:{talos_listener}", "127.0.0.3"], port=talos_listener, timeout=0.5
+    )
+
+    assert ok.connect is not None and ok.error is None
+    assert explicit_port.connect is not None
+    assert refused.connect is None and refused.latency is None and refused.error
+
+    (plain,) = measure_endpoint_latency(["127.0.0.2"], port=talos_listener, timeout=0.2, tls=True)
+    # The listener never answers the ClientHello; the connect time is still reported.
+    assert plain.connect is not None and plain.tls is None
+    assert plain.latency == plain.connect
+    assert plain.error and "TLS handshake failed" in plain.error
+
+
+def test_rank_endpoints_orders_and_drops(monkeypatch):
+    from toska_mesh_cli import cluster
+    from toska_mesh_cli.cluster import EndpointLatency, rank_endpoints
+
+    timings = {"a": 0.030, "b": 0.002, "c": None, "d": 0.010}
+    monkeypatch.setattr(
+        cluster,
+        "measure_endpoint_latency",
+        lambda endpoints, **kwargs: [EndpointLatency(e, connect=timings[e]) for e in endpoints],
+    )
+
+    ranked, measured = rank_endpoints(["a", "b", "c", "d"])
+    assert ranked == ["b", "d", "a"]
+    assert [(m.endpoint, m.dropped) for m in measured] == [
+        ("b", False),
+        ("d", False),
+        ("a", False),
+        ("c", True),
+    ]
+
+    assert rank_endpoints(["a", "b", "d"], max_latency=0.015)[0] == ["b", "d"]
+    # The fastest endpoint survives a threshold nothing meets.
+    assert rank_endpoints(["a", "d"], max_latency=0.001)[0] == ["d"]
+    ranked, measured = rank_endpoints(["c"])
+    assert ranked == ["c"] and not measured[0].dropped
+
+
+def test_talos_kubeconfig_ranks_talosconfig_endpoints(tmp_path, talos_listener):
+    talosconfig = tmp_path / "talosconfig"
+    talosconfig.write_text(
+        "context: home\ncontexts:\n  home:\n    endpoints: ['127.0.0.3', '127.0.0.2']\n"
+    )
+    commands: list[list[str]] = []
+
+    result = talos_kubeconfig(
+        talosconfig=talosconfig,
+        endpoints=None,
+        nodes=None,
+        out=tmp_path / "kubeconfig",
+        discover_port=talos_listener,
+        rank=True,
+        rank_timeout=0.5,
+        run_cmd=_fake_talosctl(commands),
+    )
+
+    assert result.endpoints == result.nodes == ["127.0.0.2"]
+    assert [(m.endpoint, m.dropped) for m in result.latencies] == [
+        ("127.0.0.2", False),
+        ("127.0.0.3", True),
+    ]
+    assert commands[0][3:7] == ["--endpoints", "127.0.0.2", "--nodes", "127.0.0.2"]
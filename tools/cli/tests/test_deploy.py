@@ -1,3 +1,8 @@
+import io
+import os
+import threading
+import time
+
 import pytest
 
 from toska_mesh_cli.deploy import (
@@ -6,6 +11,7 @@ from toska_mesh_cli.deploy import (
     deploy,
     destroy,
     filter_workloads,
+    format_plan,
     load_deploy_config,
     publish,
     push_images,
@@ -240,3 +246,448 @@ def test_port_forward_failure_is_reported(tmp_path):
             run_cmd=lambda cmd: Result(),
             port_forward_runner=lambda cmd: FailingPortForward(),
         )
+
+
+def test_port_forward_waits_for_forwarding_line(tmp_path):
+    manifest = _write_manifest(tmp_path, with_port_forward=True)
+    config = load_deploy_config(manifest)
+
+    class Result:
+        returncode = 0
+        stdout = ""
+        stderr = ""
+
+    class SlowTunnel:
+        def __init__(self):
+            self.returncode = None
+            self.terminated = False
+            read_fd, write_fd = os.pipe()
+            self.stdout = os.fdopen(read_fd)
+            self._writer = os.fdopen(write_fd, "w")
+            self.stderr = None
+            threading.Timer(0.1, self._announce).start()
+
+        def _announce(self):
+            self._writer.write("Forwarding from 127.0.0.1:8080 -> 8080\n")
+            self._writer.flush()
+
+        def poll(self):
+            return self.returncode
+
+        def terminate(self):
+            self.terminated = True
+            self._writer.close()
+
+        def wait(self, timeout=None):
+            return 0
+
+    tunnel = SlowTunnel()
+    result = deploy(
+        config,
+        dry_run=False,
+        port_forward=True,
+        run_cmd=lambda cmd: Result(),
+        port_forward_runner=lambda cmd: tunnel,
+    )
+
+    assert len(result.port_forwards) == 1
+    ready_after = result.port_forwards[0].ready_after
+    assert ready_after is not None and ready_after >= 0.1
+    assert not tunnel.terminated
+
+
+def test_port_forward_timeout_stops_tunnels(tmp_path):
+    manifest = _write_manifest(tmp_path, with_port_forward=True)
+    config = load_deploy_config(manifest)
+
+    class Result:
+        returncode = 0
+        stdout = ""
+        stderr = ""
+
+    class SilentTunnel:
+        def __init__(self):
+            self.returncode = None
+            self.terminated = False
+            self.stdout = io.StringIO("")
+            self.stderr = None
+
+        def poll(self):
+            return self.returncode
+
+        def terminate(self):
+            self.terminated = True
+
+        def wait(self, timeout=None):
+            return 0
+
+    tunnel = SilentTunnel()
+    with pytest.raises(DeployConfigError, match="not ready"):
+        deploy(
+            config,
+            dry_run=False,
+            port_forward=True,
+            port_forward_timeout=0.2,
+            run_cmd=lambda cmd: Result(),
+            port_forward_runner=lambda cmd: tunnel,
+        )
+    assert tunnel.terminated
+
+
+def _write_multi_workload_manifest(tmp_path, names):
+    (tmp_path / "Dockerfile").write_text("# test")
+    k8s_dir = tmp_path / "k8s"
+    k8s_dir.mkdir(exist_ok=True)
+    workloads = []
+    for name in names:
+        (k8s_dir / f"{name}.yaml").write_text(
+            f"apiVersion: v1\nkind: Service\nmetadata:\n  name: {name}\n"
+        )
+        workloads.append(
+            f"""
+  - name: {name}
+    manifests:
+      - k8s/{name}.yaml
+    image:
+      repository: {name}
+      tag: local
+    build:
+      context: .
+      dockerfile: Dockerfile
+"""
+        )
+    manifest_file = tmp_path / "toska.yaml"
+    manifest_file.write_text(
+        "service:\n  name: multi\n  type: stateless\ndeploy:\n  namespace: toskamesh\nworkloads:"
+        + "".join(workloads)
+    )
+    return manifest_file
+
+
+def test_build_jobs_runs_workloads_concurrently(tmp_path):
+    import threading
+
+    config = load_deploy_config(_write_multi_workload_manifest(tmp_path, ["api", "silo"]))
+    barrier = threading.Barrier(2, timeout=5)
+
+    class Result:
+        returncode = 0
+        stdout = ""
+        stderr = ""
+
+    def fake_runner(cmd):
+        # Both builds must be in flight at the same time for the barrier to release.
+        barrier.wait()
+        return Result()
+
+    commands = list(build_images(config, jobs=2, run_cmd=fake_runner))
+
+    assert len(commands) == 2
+
+
+def test_build_jobs_cancels_remaining_builds_on_failure(tmp_path):
+    config = load_deploy_config(_write_multi_workload_manifest(tmp_path, ["a", "b", "c"]))
+    started = []
+
+    class Result:
+        def __init__(self, returncode):
+            self.returncode = returncode
+            self.stdout = ""
+            self.stderr = "boom" if returncode else ""
+
+    def fake_runner(cmd):
+        image = cmd[3]
+        started.append(image)
+        if image.startswith("b:"):
+            time.sleep(0.2)
+        return Result(1 if image.startswith("a:") else 0)
+
+    with pytest.raises(DeployConfigError, match="workload 'a'"):
+        build_images(config, jobs=2, run_cmd=fake_runner)
+
+    assert not any(image.startswith("c:") for image in started)
+
+
+def test_publish_pushes_while_next_build_runs(tmp_path):
+    import threading
+
+    config = load_deploy_config(_write_multi_workload_manifest(tmp_path, ["first", "second"]))
+    first_pushed = threading.Event()
+    calls = []
+    lines: list[str] = []
+
+    class Result:
+        returncode = 0
+        stdout = ""
+        stderr = ""
+
+    def fake_runner(cmd):
+        calls.append(cmd[:2] + [cmd[-1] if cmd[1] == "push" else cmd[3]])
+        if cmd[1] == "build" and cmd[3].startswith("second:"):
+            # The second build only completes once the first image has been pushed.
+            assert first_pushed.wait(timeout=5)
+        if cmd[1] == "push" and cmd[2].startswith("first:"):
+            first_pushed.set()
+        return Result()
+
+    commands = list(
+        publish(config, build_jobs=1, push_jobs=1, run_cmd=fake_runner, emit=lines.append)
+    )
+
+    assert len(commands) == 4
+    assert calls.index(["docker", "push", "first:local"]) < calls.index(
+        ["docker", "push", "second:local"]
+    )
+    assert any("sequential" in line for line in lines)
+
+
+def test_deploy_batch_mode_applies_all_manifests_in_one_call(tmp_path):
+    import io
+
+    from toska_mesh_cli.progress import ProgressReporter
+
+    config = load_deploy_config(_write_multi_workload_manifest(tmp_path, ["api", "silo"]))
+    calls = []
+
+    class Result:
+        returncode = 0
+        stdout = "service/api created\nservice/silo unchanged\n"
+        stderr = ""
+
+    def fake_runner(cmd, input=None):
+        calls.append((cmd, input))
+        return Result()
+
+    stream = io.StringIO()
+    result = deploy(
+        config, apply_mode="batch", run_cmd=fake_runner, progress=ProgressReporter(stream=stream)
+    )
+
+    assert len(calls) == 1
+    cmd, stdin = calls[0]
+    assert cmd[-4:] == ["-f", "-", "-n", "toskamesh"]
+    assert "name: api" in stdin and "name: silo" in stdin
+    assert len(result.commands) == 1
+    output = stream.getvalue()
+    assert "api: service/api created" in output
+    assert "silo: service/silo unchanged" in output
+
+
+def test_parse_apply_output_handles_group_qualified_types():
+    from toska_mesh_cli.manifests import parse_apply_output
+
+    lines = parse_apply_output(
+        "deployment.apps/todo-mesh-api configured\nconfigmap/cfg created (dry run)\n"
+    )
+
+    assert [(line.kind, line.name, line.action) for line in lines] == [
+        ("deployment", "todo-mesh-api", "configured"),
+        ("configmap", "cfg", "created"),
+    ]
+
+
+def test_apply_cache_skips_unchanged_manifests(tmp_path):
+    from toska_mesh_cli.cache import ApplyStateStore
+
+    config = load_deploy_config(_write_manifest(tmp_path))
+    store = ApplyStateStore(tmp_path / "state.json")
+    applied = []
+    server = {"url": "https://10.0.0.1:6443"}
+
+    class Result:
+        returncode = 0
+        stderr = ""
+
+        def __init__(self, stdout=""):
+            self.stdout = stdout
+
+    def fake_runner(cmd, input=None):
+        if "apply" in cmd:
+            applied.append(cmd)
+        if "view" in cmd:
+            return Result(server["url"])
+        return Result()
+
+    deploy(config, context="dev", apply_state=store, run_cmd=fake_runner)
+    second = deploy(
+        config,
+        context="dev",
+        apply_state=ApplyStateStore(tmp_path / "state.json"),
+        run_cmd=fake_runner,
+    )
+    assert len(applied) == 1
+    assert second.commands == []
+
+    deploy(config, context="prod", apply_state=store, run_cmd=fake_runner)
+    deploy(config, context="prod", apply_state=store, force_apply=True, run_cmd=fake_runner)
+    assert len(applied) == 3
+
+    config.workloads[0].manifests[0].write_text(
+        "apiVersion: v1\nkind: Service\nmetadata:\n  name: changed\n"
+    )
+    deploy(config, context="dev", apply_state=store, run_cmd=fake_runner)
+    assert len(applied) == 4
+
+    # Same context name in another kubeconfig pointing at a different cluster.
+    server["url"] = "https://10.0.9.1:6443"
+    deploy(config, context="dev", apply_state=store, run_cmd=fake_runner)
+    assert len(applied) == 5
+
+
+def test_build_skips_unchanged_context(tmp_path):
+    from toska_mesh_cli.fingerprint import FingerprintIndex
+
+    config = load_deploy_config(_write_manifest(tmp_path))
+    (tmp_path / ".dockerignore").write_text("cache/\n")
+    index_path = tmp_path / "cache" / "fingerprints.json"
+    builds = []
+
+    class Result:
+        returncode = 0
+        stdout = ""
+        stderr = ""
+
+    def fake_runner(cmd):
+        builds.append(cmd)
+        return Result()
+
+    build_images(config, fingerprints=FingerprintIndex(index_path), run_cmd=fake_runner)
+    second = list(
+        build_images(config, fingerprints=FingerprintIndex(index_path), run_cmd=fake_runner)
+    )
+    assert len(builds) == 1
+    assert second == []
+
+    build_images(
+        config, fingerprints=FingerprintIndex(index_path), force_build=True, run_cmd=fake_runner
+    )
+    (tmp_path / "Dockerfile").write_text("# changed")
+    build_images(config, fingerprints=FingerprintIndex(index_path), run_cmd=fake_runner)
+    assert len(builds) == 3
+
+
+def test_plan_apply_levels_orders_by_dependency(tmp_path):
+    from toska_mesh_cli.manifests import load_manifest_resources, plan_apply_levels
+
+    manifest = tmp_path / "app.yaml"
+    manifest.write_text(
+        """
+apiVersion: apps/v1
+kind: Deployment
+metadata:
+  name: api
+---
+apiVersion: v1
+kind: Service
+metadata:
+  name: api
+---
+apiVersion: v1
+kind: ConfigMap
+metadata:
+  name: api-config
+---
+apiVersion: v1
+kind: Namespace
+metadata:
+  name: toskamesh
+---
+apiVersion: networking.k8s.io/v1
+kind: Ingress
+metadata:
+  name: api
+"""
+    )
+
+    levels = plan_apply_levels(load_manifest_resources(manifest, workload="api"))
+
+    assert [level.name for level in levels] == [
+        "namespaces/crds",
+        "config/identity",
+        "services",
+        "workloads",
+        "other",
+    ]
+    assert [r.ref for r in levels[3].resources] == ["deployment/api"]
+
+
+def test_deploy_levels_mode_applies_level_by_level(tmp_path):
+    config = load_deploy_config(_write_multi_workload_manifest(tmp_path, ["api", "silo"]))
+    (tmp_path / "k8s" / "api.yaml").write_text(
+        "apiVersion: apps/v1\nkind: Deployment\nmetadata:\n  name: api\n---\n"
+        "apiVersion: v1\nkind: Service\nmetadata:\n  name: api\n"
+    )
+    (tmp_path / "k8s" / "silo.yaml").write_text(
+        "apiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: silo\n"
+    )
+    applied = []
+
+    class Result:
+        returncode = 0
+        stdout = ""
+        stderr = ""
+
+    def fake_runner(cmd, input=None):
+        applied.append(input.split("kind: ")[1].split("\n")[0])
+        return Result()
+
+    result = deploy(config, apply_mode="levels", jobs=2, run_cmd=fake_runner)
+
+    assert applied == ["ConfigMap", "Service", "Deployment"]
+    assert len(result.commands) == 3
+    assert "Apply levels:" in format_plan(config, apply_mode="levels")
+
+
+def test_destroy_levels_deletes_in_reverse_order_without_waiting(tmp_path):
+    from toska_mesh_cli.cache import ApplyStateStore
+
+    config = load_deploy_config(_write_multi_workload_manifest(tmp_path, ["api"]))
+    (tmp_path / "k8s" / "api.yaml").write_text(
+        "apiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: api\n---\n"
+        "apiVersion: apps/v1\nkind: Deployment\nmetadata:\n  name: api\n"
+    )
+    store = ApplyStateStore(tmp_path / "state.json")
+    store.record("dev", "https://dev:6443", "toskamesh", config.workloads[0].manifests[0], "abc")
+    calls = []
+
+    class Result:
+        returncode = 0
+        stdout = ""
+        stderr = ""
+
+    def fake_runner(cmd):
+        calls.append(cmd)
+        return Result()
+
+    destroy(config, delete_mode="levels", wait="watch", apply_state=store, run_cmd=fake_runner)
+
+    deletes = [cmd for cmd in calls if "delete" in cmd]
+    assert [cmd[2] for cmd in deletes] == ["deployment.apps/api", "configmap/api"]
+    assert all("--wait=false" in cmd and "--cascade=background" in cmd for cmd in deletes)
+    assert calls[-1][1:3] == ["wait", "--for=delete"]
+    assert store.entries() == []
+
+
+def test_destroy_levels_honours_manifest_namespace(tmp_path):
+    config = load_deploy_config(_write_multi_workload_manifest(tmp_path, ["api"]))
+    (tmp_path / "k8s" / "api.yaml").write_text(
+        "apiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: api\n---\n"
+        "apiVersion: apps/v1\nkind: Deployment\nmetadata:\n  name: api\n  namespace: edge\n"
+    )
+    calls = []
+
+    class Result:
+        returncode = 0
+        stdout = ""
+        stderr = ""
+
+    def fake_runner(cmd):
+        calls.append(cmd)
+        return Result()
+
+    destroy(config, delete_mode="levels", wait="watch", run_cmd=fake_runner)
+
+    namespaces = {cmd[2]: cmd[cmd.index("-n") + 1] for cmd in calls if "delete" in cmd}
+    assert namespaces == {"deployment.apps/api": "edge", "configmap/api": config.namespace}
+    waits = {cmd[-1]: cmd[3:-3] for cmd in calls if cmd[1] == "wait"}
+    assert waits == {"edge": ["deployment.apps/api"], config.namespace: ["configmap/api"]}
@@ -0,0 +1,37 @@
+from toska_mesh_cli.fingerprint import DockerIgnore, FingerprintIndex
+
+
+def test_dockerignore_matches_directories_globs_and_negations():
+    ignore = DockerIgnore(["# comment", "bin/", "**/obj", "*.md", "!README.md", "/.git"])
+
+    assert ignore.excluded("bin/Debug/app.dll")
+    assert ignore.excluded("src/Service/obj/project.assets.json")
+    assert ignore.excluded("CHANGELOG.md")
+    assert ignore.excluded(".git/HEAD")
+    assert not ignore.excluded("README.md")
+    assert not ignore.excluded("src/Service/Program.cs")
+
+
+def test_fingerprint_reuses_hashes_and_honors_dockerignore(tmp_path):
+    context = tmp_path / "ctx"
+    (context / "src").mkdir(parents=True)
+    (context / "src" / "app.py").write_text("print('hi')")
+    (context / "notes.log").write_text("noise")
+    (context / ".dockerignore").write_text("*.log\n")
+    dockerfile = context / "Dockerfile"
+    dockerfile.write_text("FROM scratch")
+
+    index = FingerprintIndex(tmp_path / "index.json")
+    first = index.fingerprint(context, dockerfile)
+    index.save()
+
+    reloaded = FingerprintIndex(tmp_path / "index.json")
+    assert reloaded.fingerprint(context, dockerfile) == first
+    assert reloaded.hashed == 0
+
+    (context / "notes.log").write_text("more noise")
+    assert reloaded.fingerprint(context, dockerfile) == first
+
+    (context / "src" / "app.py").write_text("print('changed')")
+    assert reloaded.fingerprint(context, dockerfile) != first
+    assert reloaded.hashed == 1
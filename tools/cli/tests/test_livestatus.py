@@ -0,0 +1,116 @@
+import io
+import json
+
+from rich.console import Console
+
+from toska_mesh_cli.livestatus import render_status, watch_status
+
+
+class _FakeWatch:
+    def __init__(self, events):
+        self.stdout = io.StringIO("".join(json.dumps(e, indent=2) for e in events))
+
+    def poll(self):
+        return 0
+
+    def terminate(self):
+        pass
+
+
+def _pod(name, phase, *, ready=True, restarts=0):
+    return {
+        "kind": "Pod",
+        "metadata": {"name": name, "namespace": "toskamesh", "resourceVersion": str(restarts)},
+        "status": {
+            "phase": phase,
+            "nodeName": "node-a",
+            "containerStatuses": [{"ready": ready, "restartCount": restarts}],
+        },
+    }
+
+
+def _event(kind, obj):
+    return {"type": kind, "object": obj}
+
+
+def test_watch_status_applies_events_to_index():
+    seen = []
+
+    def fake_watch_runner(cmd):
+        seen.append(cmd)
+        if "pods" in cmd:
+            return _FakeWatch(
+                [
+                    _event("ADDED", _pod("api-1", "Pending", ready=False)),
+                    _event("ADDED", _pod("api-2", "Running")),
+                    _event("MODIFIED", _pod("api-1", "Running")),
+                    # Same columns, new resourceVersion only: not reported.
+                    _event("MODIFIED", {**_pod("api-1", "Running"), "spec": {"x": 1}}),
+                    _event("DELETED", _pod("api-2", "Running")),
+                ]
+            )
+        return _FakeWatch([])
+
+    out = io.StringIO()
+    index = watch_status(
+        namespaces=["toskamesh"],
+        selector="component=example",
+        watch_runner=fake_watch_runner,
+        restart=False,
+        stream=out,
+    )
+
+    assert len(seen) == 3
+    assert all("--watch" in cmd and cmd[-2:] == ["-l", "component=example"] for cmd in seen)
+    pods = index.records("pods")
+    assert [(p.name, p.status, p.ready) for p in pods] == [("api-1", "Running", "1/1")]
+    lines = out.getvalue().splitlines()
+    assert lines == [
+        "ADDED pods toskamesh/api-1: 0/1 Pending 0 node-a",
+        "ADDED pods toskamesh/api-2: 1/1 Running 0 node-a",
+        "MODIFIED pods toskamesh/api-1: 1/1 Running 0 node-a",
+        "DELETED pods toskamesh/api-2",
+    ]
+
+
+def test_watch_status_restart_replaces_stale_records():
+    streams = [
+        [_event("ADDED", _pod("old", "Running"))],
+        [_event("ADDED", _pod("new", "Running"))],
+    ]
+
+    def fake_watch_runner(cmd):
+        if not streams:
+            raise KeyboardInterrupt
+        return _FakeWatch(streams.pop(0))
+
+    index = watch_status(
+        namespaces=["toskamesh"],
+        selector=None,
+        kinds=["pods"],
+        watch_runner=fake_watch_runner,
+        stream=io.StringIO(),
+        clock=iter(range(0, 1000, 10)).__next__,
+    )
+
+    assert [p.name for p in index.records("pods")] == ["new"]
+
+
+def test_render_status_adds_namespace_column():
+    def fake_watch_runner(cmd):
+        return _FakeWatch([_event("ADDED", _pod("api-1", "Running"))] if "pods" in cmd else [])
+
+    index = watch_status(
+        namespaces=None,
+        selector=None,
+        watch_runner=fake_watch_runner,
+        restart=False,
+        stream=io.StringIO(),
+    )
+    console = Console(record=True, width=120)
+    console.print(render_status(index, show_namespace=True))
+    text = console.export_text()
+
+    assert "NAMESPACE" in text
+    assert "toskamesh" in text
+    assert "Deployments: none found" in text
@@ -0,0 +1,194 @@
+import io
+import json
+import subprocess
+
+import pytest
+
+from toska_mesh_cli.info import KubectlError, workload_pod_selector
+from toska_mesh_cli.logs import LogMerger, LogStream, follow_logs, sort_key
+
+
+def _result(payload):
+    class Result:
+        returncode = 0
+        stdout = json.dumps(payload)
+        stderr = ""
+
+    return Result()
+
+
+def _pod(name, *, containers=("app",), state="running", restarts=0):
+    return {
+        "kind": "Pod",
+        "metadata": {"name": name, "namespace": "toskamesh"},
+        "spec": {"containers": [{"name": c} for c in containers]},
+        "status": {
+            "containerStatuses": [
+                {"name": c, "state": {state: {}}, "restartCount": restarts} for c in containers
+            ]
+        },
+    }
+
+
+class _FakeProcess:
+    def __init__(self, text):
+        self.stdout = io.StringIO(text)
+        self.waited = False
+
+    def poll(self):
+        return 0
+
+    def terminate(self):
+        pass
+
+    def wait(self, timeout=None):
+        self.waited = True
+        return 0
+
+
+def _deployment(name, labels):
+    return {
+        "kind": "Deployment",
+        "metadata": {"name": name},
+        "spec": {"selector": {"matchLabels": labels}},
+    }
+
+
+def test_sort_key_pads_trimmed_fractions():
+    assert sort_key("2024-05-01T10:00:00.5Z") > sort_key("2024-05-01T10:00:00.49Z")
+    assert sort_key("2024-05-01T10:00:01Z") > sort_key("2024-05-01T10:00:00.999Z")
+    assert sort_key("not-a-timestamp") == ""
+
+
+def test_workload_pod_selector_uses_match_labels():
+    seen = []
+
+    def runner(cmd):
+        seen.append(cmd)
+        return _result({"items": [_deployment("api", {"tier": "api", "app": "mesh"})]})
+
+    selector = workload_pod_selector(
+        "api", namespace="toskamesh", selector="component=example", run_cmd=runner
+    )
+
+    assert selector == "app=mesh,tier=api"
+    assert seen[0][2:4] == ["deploy,statefulsets", "-n"]
+    assert seen[0][-2:] == ["-l", "component=example"]
+    with pytest.raises(KubectlError, match="No deployment or statefulset 'silo'"):
+        workload_pod_selector("silo", namespace="toskamesh", run_cmd=runner)
+
+
+def test_log_merger_orders_within_window():
+    merger = LogMerger(window=1.0)
+    merger.push("b", "pod-b", "second", now=0.0)
+    merger.push("a", "pod-a", "first", now=0.5)
+    merger.push("c", "pod-a", "third", now=0.9)
+
+    assert merger.ready(0.9) == []
+    # "b" is due; "a" is older, so it is released with it; "c" is newer and keeps waiting.
+    assert [text for _, _, text in merger.ready(1.0)] == ["first", "second"]
+    assert [text for _, _, text in merger.flush()] == ["third"]
+
+
+def test_follow_logs_merges_pods_and_picks_up_new_ones():
+    def run_cmd(cmd):
+        if cmd[2] == "deploy,statefulsets":
+            return _result({"items": [_deployment("api", {"app": "api"})]})
+        return _result({"items": [_pod("api-1", containers=("app", "sidecar")), _pod("api-2")]})
+
+    class FakeWatch:
+        def __init__(self, cmd):
+            events = [
+                {"type": "ADDED", "object": _pod("api-1", containers=("app", "sidecar"))},
+                {"type": "ADDED", "object": _pod("api-3", state="waiting")},
+                {"type": "MODIFIED", "object": _pod("api-3")},
+            ]
+            self.stdout = io.StringIO("".join(json.dumps(e) for e in events))
+
+        def poll(self):
+            return 0
+
+        def terminate(self):
+            pass
+
+    logs = {
+        ("api-1", "app"): "2024-05-01T10:00:00.3Z app one\n2024-05-01T10:00:02Z app two\n",
+        ("api-1", "sidecar"): "2024-05-01T10:00:01.5Z proxy up\n",
+        ("api-2", "app"): "2024-05-01T10:00:00.25Z api-2 boot\n",
+        ("api-3", "app"): "2024-05-01T10:00:03Z new pod\n",
+    }
+    log_cmds = []
+    processes = []
+
+    def log_runner(cmd):
+        log_cmds.append(cmd)
+        processes.append(_FakeProcess(logs[(cmd[3], cmd[5])]))
+        return processes[-1]
+
+    out = io.StringIO()
+    written = follow_logs(
+        ["api"],
+        namespace="toskamesh",
+        selector="component=example",
+        timestamps=True,
+        merge_window=60,
+        poll_interval=0.01,
+        restart=False,
+        run_cmd=run_cmd,
+        watch_runner=FakeWatch,
+        log_runner=log_runner,
+        stream=out,
+    )
+
+    assert written == 5
+    assert out.getvalue().splitlines() == [
+        "2024-05-01T10:00:00.250Z [api-2] api-2 boot",
+        "2024-05-01T10:00:00.300Z [api-1/app] app one",
+        "2024-05-01T10:00:01.500Z [api-1/sidecar] proxy up",
+        "2024-05-01T10:00:02.000Z [api-1/app] app two",
+        "2024-05-01T10:00:03.000Z [api-3] new pod",
+    ]
+    tails = {cmd[3]: cmd[-1] for cmd in log_cmds}
+    assert tails == {"api-1": "--tail=10", "api-2": "--tail=10", "api-3": "--tail=-1"}
+    assert len(log_cmds) == 4
+    # Finished kubectl processes are reaped, not left as zombies.
+    assert all(process.waited for process in processes)
+
+
+def test_log_stream_ring_buffer_keeps_newest_lines():
+    lines = "".join(f"2024-05-01T10:00:{i:02d}Z line {i}\n" for i in range(50))
+    lines += "error: container restarted\n"
+
+    stream = LogStream("api-1", ["kubectl"], runner=lambda cmd: _FakeProcess(lines), capacity=5)
+    stream._thread.join(timeout=5)
+    kept, dropped = stream.drain()
+
+    assert dropped == 46
+    assert [text for _, text in kept][-2:] == ["line 49", "error: container restarted"]
+    # Lines without a timestamp sort with the line before them.
+    assert kept[-1][0] == kept[-2][0] == sort_key("2024-05-01T10:00:49Z")
+    assert stream.idle
+
+
+def test_log_stream_stop_kills_a_process_that_ignores_terminate():
+    class Stubborn(_FakeProcess):
+        def __init__(self):
+            super().__init__("")
+            self.killed = False
+
+        def poll(self):
+            return None
+
+        def wait(self, timeout=None):
+            if not self.killed:
+                raise subprocess.TimeoutExpired("kubectl", timeout)
+            return -9
+
+        def kill(self):
+            self.killed = True
+
+    process = Stubborn()
+    stream = LogStream("api-1", ["kubectl"], runner=lambda cmd: process, capacity=5)
+    stream.stop()
+
+    assert process.killed
@@ -0,0 +1,67 @@
+import io
+import subprocess
+import sys
+import threading
+
+from toska_mesh_cli.deploy import PortForwardHandle, wait_on_port_forwards
+from toska_mesh_cli.portforward import PortForwardSupervisor, format_uptime
+
+FLAKY_TUNNEL = [
+    sys.executable,
+    "-c",
+    "import sys, time; "
+    "print('Forwarding from 127.0.0.1:8080 -> 8080', flush=True); "
+    "time.sleep(0.05); sys.exit(1)",
+]
+
+
+def _spawn(cmd):
+    return subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+
+
+def test_supervisor_restarts_dead_forwards_with_backoff():
+    spawned = []
+
+    def runner(cmd):
+        spawned.append(cmd)
+        if len(spawned) >= 3:
+            supervisor.stop()
+        return _spawn(cmd)
+
+    handle = PortForwardHandle(
+        command="kubectl port-forward", process=_spawn(FLAKY_TUNNEL), argv=FLAKY_TUNNEL, label="api"
+    )
+    out = io.StringIO()
+    supervisor = PortForwardSupervisor([handle], runner=runner, backoff_initial=0.01, stream=out)
+
+    watchdog = threading.Timer(10, supervisor.stop)
+    watchdog.start()
+    try:
+        supervisor.run()
+    finally:
+        watchdog.cancel()
+
+    forward = supervisor.forwards[0]
+    assert forward.restarts == 3
+    assert spawned == [FLAKY_TUNNEL] * 3
+    # Each quick failure doubles the delay before the next attempt.
+    assert forward.backoff >= 0.04
+    assert "restarting in" in out.getvalue()
+    assert forward.handle.process.poll() is not None
+
+
+def test_wait_on_port_forwards_returns_when_all_exit_without_restarting():
+    process = _spawn([sys.executable, "-c", "pass"])
+    handle = PortForwardHandle(
+        command="kubectl port-forward", process=process, argv=["unused"], label="api"
+    )
+
+    wait_on_port_forwards([handle])
+
+    assert process.poll() == 0
+
+
+def test_format_uptime():
+    assert format_uptime(5.2) == "5s"
+    assert format_uptime(125) == "2m05s"
+    assert format_uptime(3 * 3600 + 120) == "3h02m"
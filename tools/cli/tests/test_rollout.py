@@ -0,0 +1,282 @@
+import io
+import json
+
+import pytest
+
+from toska_mesh_cli.deploy import DeployConfigError
+from toska_mesh_cli.rollout import RolloutTarget, rollout_complete, wait_for_rollouts
+from toska_mesh_cli.watch import iter_json_objects
+
+
+class _FakeWatch:
+    def __init__(self, events):
+        # kubectl prints pretty JSON objects back to back with no delimiter.
+        self.stdout = io.StringIO("".join(json.dumps(e, indent=2) for e in events))
+
+    def poll(self):
+        return 0
+
+    def terminate(self):
+        pass
+
+
+class _GatedWatch(_FakeWatch):
+    """Emits ``before``, then waits for ``gates`` before emitting ``after``; sets ``done``."""
+
+    def __init__(self, before, after=(), *, gates=(), done=None):
+        def lines():
+            for event in before:
+                yield json.dumps(event)
+            for gate in gates:
+                gate.wait(5)
+            for event in after:
+                yield json.dumps(event)
+            if done is not None:
+                done.set()
+
+        self.stdout = lines()
+
+
+def _deployment(name, *, ready, generation=2, revision="2"):
+    return {
+        "kind": "Deployment",
+        "metadata": {
+            "name": name,
+            "generation": generation,
+            "annotations": {"deployment.kubernetes.io/revision": revision},
+        },
+        "spec": {"replicas": 2, "selector": {"matchLabels": {"app": name}}},
+        "status": {
+            "observedGeneration": generation,
+            "replicas": 2,
+            "updatedReplicas": ready,
+            "readyReplicas": ready,
+            "availableReplicas": ready,
+        },
+    }
+
+
+def test_iter_json_objects_splits_concatenated_pretty_json():
+    text = json.dumps({"a": "}{"}, indent=2) + json.dumps({"b": [1, {"c": 2}]}, indent=2)
+
+    objects = list(iter_json_objects(io.StringIO(text)))
+
+    assert objects == [{"a": "}{"}, {"b": [1, {"c": 2}]}]
+
+
+def test_watch_set_reports_stderr_of_a_failed_watch():
+    import sys
+
+    from toska_mesh_cli.watch import WatchSet
+
+    failing = [sys.executable, "-c", "import sys; sys.exit('error: the server has no resource')"]
+    with WatchSet(max_failures=1) as watches:
+        watches.add("widgets", failing)
+        event = watches.next(timeout=10)
+
+    assert event is not None and event.type == "CLOSED"
+    assert event.error == "error: the server has no resource"
+    assert watches.failed(event)
+
+
+def test_rollout_complete_requires_all_updated_replicas_available():
+    assert not rollout_complete(_deployment("api", ready=1))
+    assert rollout_complete(_deployment("api", ready=2))
+    stale = _deployment("api", ready=2)
+    stale["status"]["observedGeneration"] = 1
+    assert not rollout_complete(stale)
+
+
+def test_wait_for_rollouts_watches_all_targets_at_once():
+    seen = []
+
+    def fake_watch_runner(cmd):
+        seen.append(cmd)
+        if "deployments" in cmd:
+            return _FakeWatch(
+                [
+                    {"type": "ADDED", "object": _deployment("api", ready=1)},
+                    {"type": "ADDED", "object": _deployment("silo", ready=2)},
+                    {"type": "MODIFIED", "object": _deployment("api", ready=2)},
+                ]
+            )
+        return _FakeWatch([])
+
+    targets = [
+        RolloutTarget("Deployment", "api", "api"),
+        RolloutTarget("Deployment", "silo", "silo"),
+    ]
+    results = wait_for_rollouts(
+        targets, namespace="toskamesh", timeout=5, watch_runner=fake_watch_runner
+    )
+
+    assert sorted(r.target.name for r in results) == ["api", "silo"]
+    assert all("--watch" in cmd and "toskamesh" in cmd for cmd in seen)
+
+
+def _replicaset(deployment, revision, template_hash):
+    return {
+        "kind": "ReplicaSet",
+        "metadata": {
+            "name": f"{deployment}-{template_hash}",
+            "labels": {"app": deployment, "pod-template-hash": template_hash},
+            "annotations": {"deployment.kubernetes.io/revision": revision},
+            "ownerReferences": [{"kind": "Deployment", "name": deployment}],
+        },
+    }
+
+
+def _crashing_pod(name, labels):
+    return {
+        "metadata": {"name": name, "labels": labels},
+        "status": {
+            "containerStatuses": [
+                {"name": "api", "state": {"waiting": {"reason": "CrashLoopBackOff"}}}
+            ]
+        },
+    }
+
+
+def test_wait_for_rollouts_fails_fast_on_crash_loop():
+    crashing_pod = _crashing_pod("api-new-1", {"app": "api", "pod-template-hash": "new"})
+
+    def fake_watch_runner(cmd):
+        if "pods" in cmd:
+            return _FakeWatch([{"type": "MODIFIED", "object": crashing_pod}])
+        if "replicasets" in cmd:
+            return _FakeWatch([{"type": "ADDED", "object": _replicaset("api", "2", "new")}])
+        return _FakeWatch([{"type": "ADDED", "object": _deployment("api", ready=0)}])
+
+    targets = [RolloutTarget("Deployment", "api", "api", {"app": "api"})]
+    with pytest.raises(DeployConfigError, match="CrashLoopBackOff"):
+        wait_for_rollouts(targets, namespace="toskamesh", timeout=5, watch_runner=fake_watch_runner)
+
+
+def test_wait_for_rollouts_reports_kubectl_error_of_a_failing_watch():
+    class _DeniedWatch(_FakeWatch):
+        def __init__(self):
+            super().__init__([])
+
+        def wait(self, timeout=None):
+            return 1
+
+        def error_output(self):
+            return 'deployments.apps is forbidden: User "dev" cannot watch resource'
+
+    runs = []
+
+    def fake_watch_runner(cmd):
+        runs.append(cmd)
+        return _DeniedWatch() if "deployments" in cmd else _FakeWatch([])
+
+    ticks = iter(range(10_000))
+    targets = [RolloutTarget("Deployment", "api", "api", {"app": "api"})]
+    with pytest.raises(DeployConfigError, match="Watching deployments failed: .*forbidden"):
+        wait_for_rollouts(
+            targets,
+            namespace="toskamesh",
+            timeout=300,
+            watch_runner=fake_watch_runner,
+            clock=lambda: float(next(ticks)),
+        )
+    # Two restarts, then the third failure in a row is reported instead of waiting for the timeout.
+    assert sum("deployments" in cmd for cmd in runs) == 3
+
+
+def test_wait_for_rollouts_ignores_crash_loop_in_old_revision():
+    import threading
+
+    pods_seen, replicasets_seen = threading.Event(), threading.Event()
+    old_pod = _crashing_pod("api-old-1", {"app": "api", "pod-template-hash": "old"})
+    old_statefulset_pod = _crashing_pod("db-0", {"app": "db", "controller-revision-hash": "db-1"})
+    statefulset = {
+        "kind": "StatefulSet",
+        "metadata": {"name": "db", "generation": 3},
+        "spec": {"replicas": 1, "selector": {"matchLabels": {"app": "db"}}},
+        "status": {
+            "observedGeneration": 3,
+            "currentRevision": "db-1",
+            "updateRevision": "db-2",
+            "updatedReplicas": 0,
+            "readyReplicas": 0,
+        },
+    }
+    rolled_statefulset = json.loads(json.dumps(statefulset))
+    rolled_statefulset["status"].update(currentRevision="db-2", updatedReplicas=1, readyReplicas=1)
+
+    def fake_watch_runner(cmd):
+        if "pods" in cmd:
+            events = [
+                {"type": "MODIFIED", "object": old_pod},
+                {"type": "MODIFIED", "object": old_statefulset_pod},
+            ]
+            return _GatedWatch(events, done=pods_seen)
+        if "replicasets" in cmd:
+            events = [
+                {"type": "ADDED", "object": _replicaset("api", "1", "old")},
+                {"type": "ADDED", "object": _replicaset("api", "2", "new")},
+            ]
+            return _GatedWatch(events, done=replicasets_seen)
+        gates = (pods_seen, replicasets_seen)
+        if "statefulsets" in cmd:
+            return _GatedWatch(
+                [{"type": "ADDED", "object": statefulset}],
+                [{"type": "MODIFIED", "object": rolled_statefulset}],
+                gates=gates,
+            )
+        return _GatedWatch(
+            [{"type": "ADDED", "object": _deployment("api", ready=0)}],
+            [{"type": "MODIFIED", "object": _deployment("api", ready=2)}],
+            gates=gates,
+        )
+
+    targets = [
+        RolloutTarget("Deployment", "api", "api", {"app": "api"}),
+        RolloutTarget("StatefulSet", "db", "db", {"app": "db"}),
+    ]
+    results = wait_for_rollouts(
+        targets, namespace="toskamesh", timeout=5, watch_runner=fake_watch_runner
+    )
+
+    assert sorted(r.target.name for r in results) == ["api", "db"]
+
+
+def test_deploy_waits_for_rollout_before_port_forwarding(tmp_path):
+    from toska_mesh_cli.deploy import deploy, load_deploy_config
+
+    (tmp_path / "k8s").mkdir()
+    (tmp_path / "k8s" / "api.yaml").write_text(
+        "apiVersion: apps/v1\nkind: Deployment\nmetadata:\n  name: api\n"
+        "spec:\n  selector:\n    matchLabels:\n      app: api\n"
+    )
+    (tmp_path / "toska.yaml").write_text(
+        "service:\n  name: api\n  type: stateless\n"
+        "workloads:\n  - name: api\n    type: stateless\n    manifests:\n      - k8s/api.yaml\n"
+        "    portForward:\n      service: api\n      port: 8080\n"
+    )
+    config = load_deploy_config(tmp_path / "toska.yaml")
+    stalled = _deployment("api", ready=0)
+    stalled["status"]["conditions"] = [
+        {"type": "Progressing", "reason": "ProgressDeadlineExceeded", "message": "stuck"}
+    ]
+    forwarded: list[list[str]] = []
+
+    class Result:
+        returncode = 0
+        stdout = ""
+        stderr = ""
+
+    with pytest.raises(DeployConfigError, match="stuck"):
+        deploy(
+            config,
+            port_forward=True,
+            wait=True,
+            wait_timeout=5,
+            run_cmd=lambda cmd: Result(),
+            watch_runner=lambda cmd: _FakeWatch(
+                [{"type": "ADDED", "object": stalled}] if "deployments" in cmd else []
+            ),
+            port_forward_runner=forwarded.append,
+        )
+
+    assert forwarded == []
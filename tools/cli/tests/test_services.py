@@ -1,4 +1,7 @@
+import io
 import json
+import threading
+import time
 
 from toska_mesh_cli.info import (
     DeploymentInfo,
@@ -8,11 +11,16 @@ from toska_mesh_cli.info import (
     format_deployments_table,
     format_pods_table,
     format_services_table,
+    gather_namespaces,
     gather_service_info,
     list_deployments,
     list_pods,
+    list_resources,
     list_services,
+    write_table,
 )
+from toska_mesh_cli.progress import ProgressReporter
+from toska_mesh_cli.projection import parse_table_output
 
 
 def _fake_result(payload):
@@ -174,6 +182,148 @@ def test_gather_service_info_includes_pods_when_requested():
     assert any("pods" in cmd for cmd in seen_cmds)
 
 
+def test_list_resources_splits_combined_list_by_kind():
+    payload = {
+        "kind": "List",
+        "items": [
+            {"kind": "Deployment", "metadata": {"name": "hello"}, "status": {"replicas": 1}},
+            {
+                "kind": "Service",
+                "metadata": {"name": "hello-svc"},
+                "spec": {"clusterIP": "10.0.0.1"},
+            },
+            {"kind": "Pod", "metadata": {"name": "hello-pod"}, "status": {"phase": "Running"}},
+            {"kind": "ReplicaSet", "metadata": {"name": "ignored"}},
+        ],
+    }
+    seen_cmds = []
+
+    def fake_runner(cmd):
+        seen_cmds.append(cmd)
+        return _fake_result(payload)
+
+    data = list_resources(["deploy", "svc", "pods"], namespace="toskamesh", run_cmd=fake_runner)
+
+    assert [d.name for d in data["deployments"]] == ["hello"]
+    assert [s.name for s in data["services"]] == ["hello-svc"]
+    assert [p.name for p in data["pods"]] == ["hello-pod"]
+    assert data["pods"][0].namespace == "toskamesh"
+    assert seen_cmds[0][2:] == ["deploy,svc,pods", "-n", "toskamesh", "-o", "json"]
+
+
+def test_gather_service_info_combined_fetch_uses_one_kubectl_call():
+    seen_cmds = []
+
+    def fake_runner(cmd):
+        seen_cmds.append(cmd)
+        return _fake_result({"kind": "List", "items": []})
+
+    data = gather_service_info(
+        namespace="toskamesh",
+        selector="component=example",
+        include_pods=True,
+        fetch="combined",
+        run_cmd=fake_runner,
+    )
+
+    assert data == {"deployments": [], "services": [], "pods": []}
+    assert len(seen_cmds) == 1
+    assert "deploy,svc,pods" in seen_cmds[0]
+    assert seen_cmds[0][-2:] == ["-l", "component=example"]
+
+
+def test_gather_namespaces_fans_out_and_keeps_namespace_order():
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def fake_runner(cmd):
+        namespace = cmd[cmd.index("-n") + 1]
+        with lock:
+            active.append(namespace)
+            peak.append(len(active))
+        time.sleep(0.05 if namespace == "preview-a" else 0.01)
+        with lock:
+            active.remove(namespace)
+        item = {"kind": "Deployment", "metadata": {"name": "api", "namespace": namespace}}
+        return _fake_result({"kind": "List", "items": [item]})
+
+    data = gather_namespaces(
+        ["preview-a", "preview-b", "preview-c", "preview-a"],
+        selector=None,
+        include_services=False,
+        max_workers=2,
+        run_cmd=fake_runner,
+    )
+
+    assert [d.namespace for d in data["deployments"]] == ["preview-a", "preview-b", "preview-c"]
+    assert max(peak) == 2
+
+
+def test_gather_namespaces_all_namespaces_uses_single_query():
+    seen_cmds = []
+
+    def fake_runner(cmd):
+        seen_cmds.append(cmd)
+        return _fake_result({"kind": "List", "items": []})
+
+    gather_namespaces(
+        [],
+        all_namespaces=True,
+        selector=None,
+        include_pods=True,
+        fetch="combined",
+        run_cmd=fake_runner,
+    )
+
+    assert len(seen_cmds) == 1
+    assert "--all-namespaces" in seen_cmds[0]
+    assert "-n" not in seen_cmds[0]
+
+
+def test_format_tables_add_namespace_column():
+    pods = [
+        PodInfo(
+            name="p", namespace="preview-a", ready="1/1", status="Running", restarts=0, node="n"
+        )
+    ]
+
+    text = format_pods_table(pods, show_namespace=True)
+
+    assert text.splitlines()[0].startswith("NAMESPACE")
+    assert "preview-a" in text
+
+
+def test_write_table_streams_same_text_as_format_table():
+    pods = [
+        PodInfo(name=f"pod-{i}", namespace="ns", ready="1/1", status="Running", restarts=i, node="")
+        for i in range(1200)
+    ]
+
+    class CountingStream(io.StringIO):
+        writes = 0
+
+        def write(self, text):
+            self.writes += 1
+            return super().write(text)
+
+    out = CountingStream()
+    write_table("pods", pods, stream=out, show_namespace=True)
+
+    assert out.getvalue() == format_pods_table(pods, show_namespace=True) + "\n"
+    assert 1 < out.writes < 10
+
+
+def test_write_table_rich_header_and_empty_rows():
+    out = io.StringIO()
+    write_table("svc", [], stream=out, rich_output=True)
+
+    assert out.getvalue().splitlines() == [
+        "NAME  TYPE  CLUSTER IP  PORTS",
+        "━━━━  ━━━━  ━━━━━━━━━━  ━━━━━",
+    ]
+
+
 def test_kubectl_error_bubbles():
     class Result:
         returncode = 1
@@ -186,3 +336,109 @@ def test_kubectl_error_bubbles():
         assert "boom" in str(exc)
     else:
         assert False, "Expected KubectlError"
+
+
+def test_parse_table_output_reads_wide_pod_rows():
+    text = (
+        "api-1   1/1   Running            3 (5m ago)   2d   10.0.0.5   node-a   <none>   <none>\n"
+        "api-2   0/1   CrashLoopBackOff   7            2d   <none>     <none>   <none>   <none>\n"
+    )
+
+    pods = parse_table_output(text, kinds=["pods"], namespace="toskamesh")["pods"]
+
+    assert [(p.name, p.ready, p.status, p.restarts, p.node) for p in pods] == [
+        ("api-1", "1/1", "Running", 3, "node-a"),
+        ("api-2", "0/1", "CrashLoopBackOff", 7, ""),
+    ]
+    assert pods[0].namespace == "toskamesh"
+
+
+def test_gather_service_info_table_projection_splits_kinds():
+    seen_cmds = []
+    text = (
+        "preview-a   deployment.apps/api   2/3   3   2   1d   api   api:v1,sidecar:v2   app=api\n"
+        "\n"
+        "preview-a   service/api   ClusterIP   10.0.0.9   <none>   80/TCP   1d   app=api\n"
+        "\n"
+        "preview-b   pod/api-1   1/1   Running   0   1d   10.1.0.4   node-b   <none>   <none>\n"
+    )
+
+    def fake_runner(cmd):
+        seen_cmds.append(cmd)
+
+        class Result:
+            returncode = 0
+            stdout = text
+            stderr = ""
+
+        return Result()
+
+    data = gather_service_info(
+        namespace=None,
+        selector=None,
+        include_pods=True,
+        fetch="combined",
+        projection="table",
+        run_cmd=fake_runner,
+    )
+
+    assert len(seen_cmds) == 1
+    assert "wide" in seen_cmds[0] and "--no-headers" in seen_cmds[0]
+    deployment = data["deployments"][0]
+    assert (deployment.ready, deployment.available, deployment.desired) == ("2/3", 2, 3)
+    assert deployment.images == ["api:v1", "sidecar:v2"]
+    assert data["services"][0].selector == {"app": "api"}
+    assert data["pods"][0].namespace == "preview-b"
+
+
+def test_parse_table_output_keeps_set_based_selectors():
+    text = (
+        "api   1/1   1   1   1d   api   api:v1   app=api,env in (a,b)\n"
+        "web   0/1   0   0   1d   web   web:v1   tier=web,track (canary)\n"
+    )
+
+    deployments = parse_table_output(text, kinds=["deploy"], namespace="toskamesh")["deployments"]
+
+    assert [d.images for d in deployments] == [["api:v1"], ["web:v1"]]
+    assert [d.selector for d in deployments] == [{"app": "api"}, {"tier": "web"}]
+
+
+def test_gather_service_info_table_projection_falls_back_to_json_on_unexpected_columns():
+    seen_cmds = []
+    pods = {
+        "items": [
+            {
+                "metadata": {"name": "api-1", "namespace": "toskamesh"},
+                "spec": {"nodeName": "node-a", "containers": [{"name": "api"}]},
+                "status": {"phase": "Running", "containerStatuses": [{"ready": True}]},
+            }
+        ]
+    }
+
+    def fake_runner(cmd):
+        seen_cmds.append(cmd)
+
+        class Result:
+            returncode = 0
+            # An older kubectl without the IP/NODE wide columns.
+            stdout = "api-1   1/1   Running   0   1d\n" if "wide" in cmd else json.dumps(pods)
+            stderr = ""
+
+        return Result()
+
+    stream = io.StringIO()
+    data = gather_service_info(
+        namespace="toskamesh",
+        selector=None,
+        include_deployments=False,
+        include_services=False,
+        include_pods=True,
+        projection="table",
+        run_cmd=fake_runner,
+        progress=ProgressReporter(stream=stream),
+    )
+
+    assert len(seen_cmds) == 2
+    assert "json" in seen_cmds[1]
+    assert [(p.name, p.status) for p in data["pods"]] == [("api-1", "Running")]
+    assert "falling back to full objects" in stream.getvalue()
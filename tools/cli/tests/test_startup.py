@@ -0,0 +1,166 @@
+import io
+import json
+
+import pytest
+
+from toska_mesh_cli.startup import (
+    parse_pod_startup,
+    percentile,
+    startup_report,
+    summarize,
+    write_startup_report,
+)
+
+
+def _pod(name, *, created, scheduled, started, ready, containers=1):
+    return {
+        "kind": "Pod",
+        "metadata": {"name": name, "namespace": "toskamesh", "creationTimestamp": created},
+        "spec": {"containers": [{"name": f"c{i}"} for i in range(containers)]},
+        "status": {
+            "phase": "Running",
+            "nodeName": "node-a",
+            "conditions": [
+                {"type": "PodScheduled", "status": "True", "lastTransitionTime": scheduled},
+                {
+                    "type": "Ready",
+                    "status": "True" if ready else "False",
+                    "lastTransitionTime": ready,
+                },
+            ],
+            "containerStatuses": [
+                {
+                    "name": f"c{i}",
+                    "ready": True,
+                    "restartCount": 0,
+                    "state": {"running": {"startedAt": s}},
+                }
+                for i, s in enumerate(started)
+            ],
+        },
+    }
+
+
+def _event(pod, reason, at):
+    return {"involvedObject": {"kind": "Pod", "name": pod}, "reason": reason, "firstTimestamp": at}
+
+
+def test_parse_pod_startup_breaks_down_phases():
+    pod = _pod(
+        "api-1",
+        created="2024-05-01T10:00:00Z",
+        scheduled="2024-05-01T10:00:02Z",
+        started=["2024-05-01T10:00:20Z", "2024-05-01T10:00:21Z"],
+        ready="2024-05-01T10:00:30Z",
+        containers=2,
+    )
+    events = [
+        _event("api-1", "Scheduled", "2024-05-01T10:00:02Z"),
+        _event("api-1", "Pulling", "2024-05-01T10:00:03Z"),
+        _event("api-1", "Pulled", "2024-05-01T10:00:15Z"),
+        _event("api-1", "Pulling", "2024-05-01T10:00:15Z"),
+        _event("api-1", "Pulled", "2024-05-01T10:00:18Z"),
+        # From an earlier pod with the same name.
+        _event("api-1", "Pulling", "2024-05-01T09:00:00Z"),
+    ]
+
+    startup = parse_pod_startup(pod, events)
+
+    assert startup.pod.name == "api-1"
+    assert startup.pod.node == "node-a"
+    assert startup.scheduling == 2
+    assert startup.image_pull == 15
+    assert startup.container_start == 3
+    assert startup.readiness == 9
+    assert startup.total == 30
+
+
+def test_parse_pod_startup_handles_cached_images_and_unready_pods():
+    pod = _pod(
+        "api-2",
+        created="2024-05-01T10:00:00Z",
+        scheduled="2024-05-01T10:00:01Z",
+        started=["2024-05-01T10:00:04Z"],
+        ready=None,
+    )
+
+    startup = parse_pod_startup(pod, [_event("api-2", "Pulled", "2024-05-01T10:00:02Z")])
+
+    assert startup.image_pull == 0
+    assert startup.container_start == 3
+    assert startup.readiness is None
+    assert startup.total is None
+
+
+def test_percentile_and_summary():
+    assert percentile([], 0.5) is None
+    assert percentile([4.0, 1.0, 3.0, 2.0], 0.5) == pytest.approx(2.5)
+    assert percentile([1.0, 2.0, 3.0], 0.95) == pytest.approx(2.9)
+
+    pods = []
+    for i, ready in enumerate(["2024-05-01T10:00:10Z", "2024-05-01T10:00:20Z", None]):
+        pods.append(
+            parse_pod_startup(
+                _pod(
+                    f"p{i}",
+                    created="2024-05-01T10:00:00Z",
+                    scheduled="2024-05-01T10:00:01Z",
+                    started=["2024-05-01T10:00:05Z"],
+                    ready=ready,
+                )
+            )
+        )
+    total = {s.phase: s for s in summarize(pods)}["total"]
+
+    assert (total.pods, total.p50, total.max) == (2, 15, 20)
+    assert total.p95 == pytest.approx(19.5)
+
+
+def test_startup_report_reads_workload_pods_and_events():
+    seen = []
+    payloads = {
+        "events": {"items": [_event("api-1", "Pulled", "2024-05-01T10:00:01Z")]},
+        "deploy,statefulsets": {
+            "items": [
+                {
+                    "kind": "Deployment",
+                    "metadata": {"name": "api"},
+                    "spec": {"selector": {"matchLabels": {"app": "api"}}},
+                }
+            ]
+        },
+        "pods": {
+            "items": [
+                _pod(
+                    "api-1",
+                    created="2024-05-01T10:00:00Z",
+                    scheduled="2024-05-01T10:00:00Z",
+                    started=["2024-05-01T10:00:02Z"],
+                    ready="2024-05-01T10:00:05Z",
+                )
+            ]
+        },
+    }
+
+    def runner(cmd):
+        seen.append(cmd)
+
+        class Result:
+            returncode = 0
+            stdout = json.dumps(payloads[cmd[2]])
+            stderr = ""
+
+        return Result()
+
+    pods = startup_report(["api"], namespace="toskamesh", run_cmd=runner)
+    out = io.StringIO()
+    write_startup_report(pods, stream=out)
+
+    assert "involvedObject.kind=Pod" in seen[0]
+    assert seen[2][-2:] == ["-l", "app=api"]
+    assert pods[0].image_pull == 0
+    assert pods[0].total == 5
+    lines = out.getvalue().splitlines()
+    assert lines[0].split()[:3] == ["POD", "NODE", "SCHEDULING"]
+    assert lines[2].split() == ["api-1", "node-a", "0.0s", "0.0s", "2.0s", "3.0s", "5.0s"]
+    assert "P95" in out.getvalue()
@@ -0,0 +1,112 @@
+import io
+import json
+
+import pytest
+
+from toska_mesh_cli.info import KubectlError, list_pods
+from toska_mesh_cli.stream import iter_list_items, read_chunks
+
+
+def _pods(count):
+    return [
+        {
+            "kind": "Pod",
+            "metadata": {"name": f"pod-{i}", "namespace": "toskamesh", "labels": {"app": "a{b}"}},
+            "status": {
+                "phase": "Running",
+                "containerStatuses": [{"ready": True, "restartCount": i}],
+            },
+        }
+        for i in range(count)
+    ]
+
+
+def _chunked(text, size):
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+@pytest.mark.parametrize("size", [1, 7, 64, 1 << 16])
+def test_iter_list_items_handles_any_chunk_boundary(size):
+    items = _pods(5)
+    document = json.dumps(
+        {"apiVersion": "v1", "items": items, "kind": "List", "metadata": {"resourceVersion": "12"}},
+        indent=4,
+    )
+
+    assert list(iter_list_items(_chunked(document, size))) == items
+
+
+def test_iter_list_items_ignores_fields_around_items():
+    document = '{"kind": "List", "count": 12345, "items": [], "metadata": {"continue": ""}}'
+
+    assert list(iter_list_items(_chunked(document, 3))) == []
+    assert list(iter_list_items([""])) == []
+
+
+def test_iter_list_items_rejects_truncated_output():
+    document = json.dumps({"items": _pods(2)})[:-20]
+
+    with pytest.raises(ValueError):
+        list(iter_list_items(_chunked(document, 16)))
+
+
+class _FakeStream:
+    def __init__(self, stdout, *, returncode=0, stderr=""):
+        self.stdout = io.StringIO(stdout)
+        self.stderr = io.StringIO(stderr)
+        self.returncode = None
+        self.terminated = False
+        self._exit = returncode
+
+    def terminate(self):
+        self.terminated = True
+        self._exit = -15
+
+    def wait(self):
+        self.returncode = self._exit
+        return self._exit
+
+
+def test_list_pods_streams_with_chunk_size():
+    seen_cmds = []
+    document = json.dumps({"kind": "List", "items": _pods(3)})
+
+    def stream_cmd(cmd):
+        seen_cmds.append(cmd)
+        return _FakeStream(document)
+
+    pods = list_pods(namespace="toskamesh", chunk_size=2, stream_cmd=stream_cmd)
+
+    assert [p.restarts for p in pods] == [0, 1, 2]
+    assert "--chunk-size=2" in seen_cmds[0]
+    assert not hasattr(pods[0], "__dict__")
+
+
+def test_list_pods_stream_reports_kubectl_failure():
+    def stream_cmd(cmd):
+        return _FakeStream("", returncode=1, stderr="forbidden")
+
+    with pytest.raises(KubectlError, match="forbidden"):
+        list_pods(namespace="toskamesh", chunk_size=500, stream_cmd=stream_cmd)
+
+
+def test_stream_items_stops_kubectl_when_the_consumer_stops_early():
+    from toska_mesh_cli.info import iter_resources
+
+    streams = []
+
+    def stream_cmd(cmd):
+        streams.append(_FakeStream(json.dumps({"kind": "List", "items": _pods(3)})))
+        return streams[-1]
+
+    records = iter_resources(["pods"], namespace="toskamesh", chunk_size=2, stream_cmd=stream_cmd)
+    next(records)
+    records.close()
+
+    assert streams[0].terminated
+    assert streams[0].returncode == -15
+
+
+def test_read_chunks_splits_stream():
+    assert list(read_chunks(io.StringIO("abcde"), 2)) == ["ab", "cd", "e"]
+    assert list(read_chunks(None)) == []
@@ -0,0 +1,170 @@
+import io
+import json
+
+import pytest
+
+from toska_mesh_cli.info import KubectlError
+from toska_mesh_cli.top import gather_top, parse_cpu, parse_memory, watch_top, write_top_table
+
+DEPLOYMENTS = {
+    "kind": "List",
+    "items": [
+        {
+            "kind": "Deployment",
+            "metadata": {"name": "api", "namespace": "toskamesh"},
+            "spec": {
+                "selector": {"matchLabels": {"app": "api"}},
+                "template": {
+                    "spec": {
+                        "containers": [
+                            {
+                                "name": "api",
+                                "resources": {
+                                    "requests": {"cpu": "250m", "memory": "128Mi"},
+                                    "limits": {"cpu": "1", "memory": "256Mi"},
+                                },
+                            },
+                            {"name": "proxy", "resources": {"requests": {"cpu": "50m"}}},
+                        ]
+                    }
+                },
+            },
+            "status": {"replicas": 2, "readyReplicas": 2, "availableReplicas": 2},
+        },
+        {
+            "kind": "Deployment",
+            "metadata": {"name": "silo", "namespace": "toskamesh"},
+            "spec": {"selector": {"matchLabels": {"app": "silo"}}},
+        },
+    ],
+}
+
+POD_METRICS = {
+    "kind": "PodMetricsList",
+    "apiVersion": "metrics.k8s.io/v1beta1",
+    "items": [
+        {
+            "metadata": {
+                "name": "api-1",
+                "namespace": "toskamesh",
+                "labels": {"app": "api", "pod-template-hash": "abc"},
+            },
+            "containers": [
+                {"name": "api", "usage": {"cpu": "120000000n", "memory": "100Mi"}},
+                {"name": "proxy", "usage": {"cpu": "5m", "memory": "20Mi"}},
+            ],
+        },
+        {
+            "metadata": {"name": "api-2", "namespace": "toskamesh", "labels": {"app": "api"}},
+            "containers": [{"name": "api", "usage": {"cpu": "75m", "memory": "90Mi"}}],
+        },
+        {
+            "metadata": {"name": "other", "namespace": "toskamesh", "labels": {"app": "other"}},
+            "containers": [{"name": "x", "usage": {"cpu": "1", "memory": "1Gi"}}],
+        },
+    ],
+}
+
+
+def _fake_runner(seen):
+    def runner(cmd):
+        seen.append(cmd)
+
+        class Result:
+            returncode = 0
+            stdout = json.dumps(POD_METRICS if "--raw" in cmd else DEPLOYMENTS)
+            stderr = ""
+
+        return Result()
+
+    return runner
+
+
+def test_parse_quantities():
+    assert parse_cpu("250m") == 250
+    assert parse_cpu("2") == 2000
+    assert parse_cpu("1500000n") == pytest.approx(1.5)
+    assert parse_memory("128Mi") == 128 << 20
+    assert parse_memory("1G") == 10**9
+    assert parse_memory("1e3") == 1000
+    assert parse_memory("2Pi") == 2 << 50
+    assert parse_memory("1Ei") == 1 << 60
+    assert parse_memory("3P") == 3 * 10**15
+    assert parse_memory("2E") == 2 * 10**18
+    with pytest.raises(KubectlError):
+        parse_cpu("lots")
+
+
+def test_gather_top_joins_metrics_through_selector():
+    seen: list[list[str]] = []
+    usages = gather_top(
+        namespace="toskamesh", selector="component=example", run_cmd=_fake_runner(seen)
+    )
+
+    assert len(seen) == 2
+    assert seen[1][1:] == ["get", "--raw", "/apis/metrics.k8s.io/v1beta1/namespaces/toskamesh/pods"]
+    api, silo = usages
+    assert (api.name, api.pods) == ("api", 2)
+    assert api.cpu_millicores == pytest.approx(200)
+    assert api.cpu_max == pytest.approx(125)
+    assert api.memory_bytes == 210 << 20
+    assert api.memory_max == 120 << 20
+    assert (api.cpu_request, api.cpu_limit) == (300, 1000)
+    assert (api.memory_request, api.memory_limit) == (128 << 20, 256 << 20)
+    assert (silo.pods, silo.cpu_request, silo.memory_limit) == (0, None, None)
+
+
+def test_write_top_table_formats_units():
+    usages = gather_top(namespace="toskamesh", selector=None, run_cmd=_fake_runner([]))
+    out = io.StringIO()
+    write_top_table(usages, stream=out)
+
+    lines = out.getvalue().splitlines()
+    assert lines[0].split()[:3] == ["WORKLOAD", "PODS", "CPU"]
+    assert lines[2].split() == [
+        "api",
+        "2",
+        "200m",
+        "125m",
+        "300m",
+        "1000m",
+        "210Mi",
+        "120Mi",
+        "128Mi",
+        "256Mi",
+    ]
+    assert lines[3].split() == ["silo", "0", "0m", "0m", "-", "-", "0Mi", "0Mi", "-", "-"]
+
+
+def test_metrics_api_failure_is_reported():
+    def runner(cmd):
+        class Result:
+            returncode = 1 if "--raw" in cmd else 0
+            stdout = json.dumps(DEPLOYMENTS)
+            stderr = "the server could not find the requested resource"
+
+        return Result()
+
+    with pytest.raises(KubectlError, match="metrics-server"):
+        gather_top(namespace="toskamesh", selector=None, run_cmd=runner)
+
+
+def test_watch_top_refreshes_every_interval():
+    seen: list[list[str]] = []
+    sleeps: list[float] = []
+    out = io.StringIO()
+    watch_top(
+        namespace=None,
+        selector=None,
+        interval=2.5,
+        show_namespace=True,
+        run_cmd=_fake_runner(seen),
+        stream=out,
+        sleep=sleeps.append,
+        iterations=3,
+    )
+
+    assert sleeps == [2.5, 2.5]
+    assert len(seen) == 6
+    assert seen[1][-1] == "/apis/metrics.k8s.io/v1beta1/pods"
+    assert out.getvalue().count("NAMESPACE") == 3